@@ -1,6 +1,8 @@
+import asyncio
+import itertools
+import operator
 import shutil
 import sys
-import threading
 import webbrowser
 from typing import Any, Tuple
 from os import makedirs
@@ -12,12 +14,28 @@ from tkinter.ttk import Combobox
 from src.models.song import Song, SongID3
 from src.models.field_definition import field_registry
 from src.utils.audio import AudioMetadata
-from src.core.database import Database
+from src.core.database import Database, SongQuery
 from src.core.config import app_config
 from src.ui.theme import theme
 from src.utils.error_handler import ErrorHandler
 from src.validators.song_validator import SongValidator
 
+# F9/F10 presses within this window are merged into one song load
+NAV_DEBOUNCE_MS = 80
+
+# Registry lookups resolved once at import instead of per field per song
+OPTIONAL_FIELDS = frozenset(f.name for f in field_registry.optional())
+QUERY_MATCHES = ("contains", "equals")
+
+# Filename label: "<current>    <--->    <expected>" without the songs root
+LOCATION_FORMAT = "{}    <--->    {}"
+SONGS_PREFIX = "z:\\songs\\"
+
+# Neighbours decoded ahead of navigation, and how far from the current
+# position a prefetched song may be before it is dropped
+PREFETCH_OFFSETS = (1, -1)
+PREFETCH_RADIUS = 2
+
 
 class DatabaseEditor(Tk):
     def __init__(self):
@@ -63,12 +81,22 @@ class DatabaseEditor(Tk):
         # State Variables
         self.song = None
         self.id3 = None
-        self.song_query = self.get_initial_query()
+        # The first batch is enough to show a song; the rest streams in below
+        initial_batches = self.initial_query_batches()
+        self.song_query = SongQuery(next(initial_batches, []))
+        self._query_more = bool(self.song_query)
         # Load saved position
         last_query_data = app_config.load_last_query()
         if last_query_data and "position" in last_query_data:
             try:
                 saved_pos = int(last_query_data["position"])
+                # Read ahead until the saved position is loaded
+                while self._query_more and saved_pos >= len(self.song_query):
+                    rows = next(initial_batches, None)
+                    if rows is None:
+                        self._query_more = False
+                    else:
+                        self.song_query.extend(rows)
                 # Clamp position to valid range
                 if saved_pos < 0:
                     self.position = 0
@@ -84,6 +112,29 @@ class DatabaseEditor(Tk):
             self.position = 0
 
         self.is_loading = False
+        self._querying = False
+        # Widget path -> background last set through _set_bg
+        self._last_bg = {}
+        self._nav_pending_delta = 0
+        self._nav_after_id = None
+
+        # Song loads, queries and tag writes run as asyncio tasks; blocking
+        # I/O goes through asyncio.to_thread. The loop is pumped from the Tk
+        # event loop, so task code runs on the main thread and may touch
+        # widgets directly. A newer load cancels the one it supersedes.
+        self.loop = asyncio.new_event_loop()
+        self._load_task = None
+        self._query_task = None
+        self._query_window = None
+        self._save_task = None
+        # Song id -> decoded (Song, SongID3) for the current song's neighbours.
+        # A save bumps the epoch so reads started before it are discarded.
+        self._prefetched = {}
+        self._prefetching = set()
+        self._prefetch_epoch = 0
+        if self._query_more:
+            self._query_task = self.loop.create_task(self._stream_query(initial_batches))
+        self.after(10, self._pump)
         
         # Handle Window Close
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -171,7 +222,7 @@ class DatabaseEditor(Tk):
 
     def connect_database(self):
         try:
-            return Database(self.file, self.table_name)
+            return Database(self.file, self.table_name, mirror=True)
         except Exception as e:
             root = Tk()
             root.withdraw()
@@ -183,8 +234,24 @@ class DatabaseEditor(Tk):
             app_config.save_last_position(self.position)
         except Exception as e:
             ErrorHandler.log_silent(e, "Saving app state")
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        # Let the cancelled tasks run their cleanup
+        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        # Worker threads may still be reading through their pooled
+        # connections; let them finish before the pool is closed
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        self.loop.close()
+        self.db.close()
         self.destroy()
 
+    def _pump(self):
+        """Run one pass of ready asyncio callbacks, then reschedule on Tk."""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.after(10, self._pump)
+
     def setup_ui(self):
         self.deiconify()
         self.lift()
@@ -264,12 +331,12 @@ class DatabaseEditor(Tk):
             
             self.buttons_db[field] = ttk.Button(action_frame, text="->", width=3)
             self.buttons_db[field].pack(side="left")
-            self.buttons_db[field].bind("<Button-1>", lambda event, f=field: copy_text(self.texts_db[f], self.texts_id3[f], END))
+            self.buttons_db[field].bind("<Button-1>", lambda event, f=field: copy_text(self.texts_db[f], self.texts_id3[f], END, self._set_bg))
 
             self.buttons_id3[field] = ttk.Button(action_frame, text="<-", width=3)
             if field_def and field_def.db_editable:  # Only show <- button if DB side is editable
                 self.buttons_id3[field].pack(side="left")
-                self.buttons_id3[field].bind("<Button-1>", lambda event, f=field: copy_text(self.texts_id3[f], self.texts_db[f], END))
+                self.buttons_id3[field].bind("<Button-1>", lambda event, f=field: copy_text(self.texts_id3[f], self.texts_db[f], END, self._set_bg))
 
             # ID3 Entry (Dark Input)
             self.texts_id3[field] = Entry(main_frame, relief="solid", bd=1, font=("Segoe UI", 10),
@@ -286,6 +353,15 @@ class DatabaseEditor(Tk):
 
             row_count += 1
 
+        # (name, Song attribute, attribute getter, DB entry, ID3 entry, required)
+        # for every editable field except artist, resolved once for the
+        # per-song loops
+        self._editable_widgets = [
+            (fd.name, fd.song_attr, operator.attrgetter(fd.song_attr),
+             self.texts_db[fd.name], self.texts_id3[fd.name], fd.required)
+            for fd in field_registry.editable() if fd.name != "artist"
+        ]
+
         # Status Label for Done (Added to ID3 column)
         self.lbl_done_status = Label(main_frame, text="[ NOT DONE ]", bg=BG_DARK, fg=theme.FG_MEDIUM_GRAY, font=("Segoe UI", 10, "bold"))
         self.lbl_done_status.grid(row=row_count, column=3, sticky="w", padx=2, pady=5)
@@ -370,16 +446,21 @@ class DatabaseEditor(Tk):
         ErrorHandler.set_error_callback(self.update_error_badge)
 
         # Key Bindings
-        self.bind("<F1>", lambda event: self.query_db())
+        # Keys stay live while the buttons are disabled, so the ones that
+        # load, save or query check is_loading themselves
+        self._bind_unless_loading("<F1>", self.query_db)
         self.bind("<F3>", lambda event: WebSearch.google_lookup(self.song))
         self.bind("<F4>", lambda event: WebSearch.discogs_lookup(self.song))
-        self.bind("<F5>", lambda event: self.save_song(False))
-        self.bind("<F6>", lambda event: self.save_song(True))
-        self.bind("<F9>", lambda event: self.get_song(-1))
-        self.bind("<F10>", lambda event: self.get_song(1))
-        self.bind("<F11>", lambda event: self.get_song(None))
+        self._bind_unless_loading("<F5>", lambda: self.save_song(False))
+        self._bind_unless_loading("<F6>", lambda: self.save_song(True))
+        self._bind_unless_loading("<F9>", lambda: self.get_song(-1))
+        self._bind_unless_loading("<F10>", lambda: self.get_song(1))
+        self._bind_unless_loading("<F11>", lambda: self.get_song(None))
         self.bind("<F12>", lambda event: self.text_jump.focus())
 
+    def _bind_unless_loading(self, key, action):
+        self.bind(key, lambda event: None if self.is_loading else action())
+
     def toggle_controls(self, state="normal"):
         """Enable or disable navigations buttons to prevent race conditions."""
         if state is True or state == "normal":
@@ -401,17 +482,19 @@ class DatabaseEditor(Tk):
                 ErrorHandler.log_silent(e, "Updating button state")
                 pass  # Button state change failed, continue
 
+    def _query_column(self, field_in):
+        # Use field registry for mapping
+        field_def = field_registry.get(field_in)
+        if field_def and field_def.queryable:
+            return field_def.db_column
+        # Fallback to artist if field not found or not queryable
+        return "fldArtistName"
+
     def query_execute(self, field_in, match, query, save=True):
         if save:
             app_config.save_last_query(field_in, match, query)
         
-        # Use field registry for mapping
-        field_def = field_registry.get(field_in)
-        if field_def and field_def.queryable:
-            field_out = field_def.db_column
-        else:
-            # Fallback to artist if field not found or not queryable
-            field_out = "fldArtistName"
+        field_out = self._query_column(field_in)
 
         if match == "contains":
             return self.db.fetch_songs(field_out, query, False)
@@ -419,6 +502,15 @@ class DatabaseEditor(Tk):
             return self.db.fetch_songs(field_out, query, True)
         return []
 
+    def query_batches(self, field_in, match, query, save=True):
+        """Like query_execute, but yields rows in batches as they are read."""
+        if save:
+            app_config.save_last_query(field_in, match, query)
+
+        if match not in QUERY_MATCHES:
+            return iter(())
+        return self.db.iter_songs(self._query_column(field_in), query, match == "equals")
+
     def get_initial_query(self):
         last_query = app_config.load_last_query()
         if last_query:
@@ -431,42 +523,59 @@ class DatabaseEditor(Tk):
         ErrorHandler.show_info("No previous query found.\nLoading first 2000 songs to save memory.")
         return self.db.fetch_all_songs()
 
+    def initial_query_batches(self):
+        """Batched form of get_initial_query, used at startup."""
+        last_query = app_config.load_last_query()
+        if last_query:
+            try:
+                ErrorHandler.log_info(f"Loading last query: {last_query}")
+                batches = self.query_batches(last_query["field"], last_query["match"], last_query["value"], save=False)
+                # Pull the first batch now so a bad query falls back like get_initial_query
+                first = next(batches, None)
+                if first is None:
+                    return iter(())
+                return itertools.chain((first,), batches)
+            except Exception as e:
+                ErrorHandler.log_silent(e, "Restoring last query")
+
+        ErrorHandler.show_info("No previous query found.\nLoading first 2000 songs to save memory.")
+        return self.db.iter_all_songs()
+
     def update_fields(self):
         if self.id3 is None:
             choice = ErrorHandler.ask_yes_no("No song selected! Delete database entry?", "Error")
             if choice:
-                self.db.delete_song(self.song_query[self.position][0])
-                self.song_query = self.get_initial_query()
+                self.db.delete_song(self.song_query.ids[self.position])
+                self.song_query = SongQuery(self.get_initial_query())
                 self.get_song(0)
                 return
             else:
                 self.id3 = SongID3("", "", "", "", "0", "", "", "", "0", "false", "FILE NOT FOUND")
 
-        self.texts_db["artist"].config(state="normal")
+        self._set_state(self.texts_db["artist"], "normal")
         self._update_text_field("artist", self.song.artist, self.id3.artist)
-        self.texts_db["artist"].config(state="disabled")
+        self._set_state(self.texts_db["artist"], "disabled")
         
-        # Update editable fields from registry
-        for field_def in field_registry.editable():
-            if field_def.name == "artist":
-                continue  # Already handled above
-            val_song = getattr(self.song, field_def.song_attr)
-            val_id3 = getattr(self.id3, field_def.song_attr)
-            self._update_text_field(field_def.name, val_song, val_id3)
+        # Update editable fields from registry (artist handled above)
+        song, id3, set_entry = self.song, self.id3, self._set_entry
+        for _, _, get, w_db, w_id3, required in self._editable_widgets:
+            val1, val2, color = process_string_comparison(get(song), get(id3), required=required)
+            set_entry(w_db, val1, color)
+            set_entry(w_id3, val2, color)
 
         # Decade
-        self.texts_db["decade"].config(state="normal")
-        self.texts_id3["decade"].config(state="normal")
+        self._set_state(self.texts_db["decade"], "normal")
+        self._set_state(self.texts_id3["decade"], "normal")
         self._update_text_field("decade", self.song.decade, self.song.decade)
-        self.texts_db["decade"].config(state="disabled")
-        self.texts_id3["decade"].config(state="disabled")
+        self._set_state(self.texts_db["decade"], "disabled")
+        self._set_state(self.texts_id3["decade"], "disabled")
 
         # Duration
-        self.texts_db["duration"].config(state="normal")
-        self.texts_id3["duration"].config(state="normal")
+        self._set_state(self.texts_db["duration"], "normal")
+        self._set_state(self.texts_id3["duration"], "normal")
         self._update_text_field("duration", self.song.duration, self.song.duration)
-        self.texts_db["duration"].config(state="disabled")
-        self.texts_id3["duration"].config(state="disabled")
+        self._set_state(self.texts_db["duration"], "disabled")
+        self._set_state(self.texts_id3["duration"], "disabled")
 
         # Done Status Check
         if getattr(self.id3, "done", False):
@@ -475,34 +584,50 @@ class DatabaseEditor(Tk):
              self.lbl_done_status.config(text="[ NOT DONE ]", fg=theme.FG_MEDIUM_GRAY)
 
         self._update_status_indicators()
+        # Redraw once for the whole song instead of per widget change
+        self.update_idletasks()
+
+    # Entry updates go straight to Tcl: a song load touches ~30 entries, and
+    # delete/insert/config each go through Tkinter's option handling.
+    # Backgrounds are only sent when they differ from the last one set.
+    def _set_entry(self, entry, value, bg=None):
+        call, w = entry.tk.call, entry._w
+        call(w, 'delete', 0, 'end')
+        call(w, 'insert', 0, value)
+        if bg is not None:
+            self._set_bg(entry, bg)
+
+    def _set_bg(self, widget, bg):
+        w = widget._w
+        if self._last_bg.get(w) != bg:
+            widget.tk.call(w, 'configure', '-background', bg)
+            self._last_bg[w] = bg
+
+    @staticmethod
+    def _set_state(entry, state):
+        entry.tk.call(entry._w, 'configure', '-state', state)
 
     def _update_text_field(self, field, val_song, val_id3):
         txt_db = self.texts_db[field]
         txt_id3 = self.texts_id3[field]
         
         # Determine if field is optional using registry
-        field_def = field_registry.get(field)
-        is_required = field_def.required if field_def else True
+        is_required = field not in OPTIONAL_FIELDS
         
         # Special handling for artist field (database has limited length)
         is_artist = field == "artist"
             
         val1, val2, color = process_string_comparison(val_song, val_id3, required=is_required, is_artist=is_artist)
         
-        txt_db.delete(0, END)
-        txt_db.insert(0, val1)
-        txt_db.config(bg=color)
-        
-        txt_id3.delete(0, END)
-        txt_id3.insert(0, val2)
-        txt_id3.config(bg=color)
+        self._set_entry(txt_db, val1, color)
+        self._set_entry(txt_id3, val2, color)
 
     def _update_status_indicators(self):
         # Genre Validation
         test_genre = Song.check_genre(self.song.genres_all, self.id3.genres_all)
         bg_genre = theme.BG_LIGHTER if test_genre else theme.STATUS_ERROR_BG
-        self.texts_db["genre"].config(bg=bg_genre)
-        self.texts_id3["genre"].config(bg=bg_genre)
+        self._set_bg(self.texts_db["genre"], bg_genre)
+        self._set_bg(self.texts_id3["genre"], bg_genre)
         
         if test_genre:
              self.lbl_stat_genre.config(text="✔ Genres Match", fg=theme.STATUS_SUCCESS)
@@ -514,8 +639,8 @@ class DatabaseEditor(Tk):
         
         # Override BG for empty ISRC to be normal (not error)
         if not self.song.isrc and not self.id3.isrc:
-            self.texts_db["isrc"].config(bg=theme.BG_LIGHTER)
-            self.texts_id3["isrc"].config(bg=theme.BG_LIGHTER)
+            self._set_bg(self.texts_db["isrc"], theme.BG_LIGHTER)
+            self._set_bg(self.texts_id3["isrc"], theme.BG_LIGHTER)
             
         if isrc_match:
              self.lbl_stat_isrc.config(text="✔ ISRC Match", fg=theme.STATUS_SUCCESS)
@@ -523,7 +648,7 @@ class DatabaseEditor(Tk):
              self.lbl_stat_isrc.config(text="⚠️ ISRC Mismatch", fg=theme.STATUS_WARNING)
             
         # Count & File Status
-        self.label_counter.config(text=f"{self.position + 1}/{len(self.song_query)}")
+        self._update_counter()
         
         err = self.id3.error
         if err == "No error":
@@ -531,60 +656,51 @@ class DatabaseEditor(Tk):
         else:
             self.lbl_stat_file.config(text=f"❌ {err}", fg=theme.STATUS_DANGER)
             
-        self.text_jump.delete(0, END)
-        self.text_jump.insert(0, str(self.position + 1))
+        self._set_entry(self.text_jump, str(self.position + 1))
         
         # File Validation
-        clean_loc = (self.song.location_local + "    <--->    " + self.song.location_correct).replace("z:\\songs\\", "")
+        local, correct = self.song.location_local, self.song.location_correct
+        clean_loc = LOCATION_FORMAT.format(local, correct).replace(SONGS_PREFIX, "")
+        bg_file = theme.STATUS_SUCCESS if Song.same_path(local, correct) else theme.STATUS_DANGER
         self.label_filename.config(text=clean_loc)
-        
-        bg_file = theme.STATUS_SUCCESS if self.song.location_local.lower() == self.song.location_correct.lower() else theme.STATUS_DANGER
-        self.label_filename.config(bg=bg_file)
+        self._set_bg(self.label_filename, bg_file)
 
-    def song_rename(self):
+    async def song_rename(self, song):
+        """Point the DB at the expected path, then move the file in a worker thread."""
         # 0. Prepare paths
-        location_db = self.song.location_correct.replace("z:", "b:")
-        old_location_db = self.song.location_local.replace("z:", "b:")
+        location_db = song.location_correct.replace("z:", "b:")
+        old_location_db = song.location_local.replace("z:", "b:")
         
         try:
             # 1. Update Database First
             # If this fails, file stays where it is. Safe.
-            self.db.update_song_filename(self.song.id, location_db)
+            self.db.update_song_filename(song.id, location_db)
             
-            # 2. Prepare destination directory
-            if not path.exists(self.song.location_correct):
-                makedirs(path.dirname(self.song.location_correct), exist_ok=True)
-            
-            # 3. Move File
-            shutil.move(self.song.location_local, self.song.location_correct)
+            # 2-3. Prepare destination directory and move the file; a move
+            # across volumes is a full copy, so keep it off the Tk thread
+            self.lbl_stat_file.config(text="⏳ Moving file...", fg=theme.FG_WHITE)
+            await asyncio.to_thread(self._move_file, song.location_local, song.location_correct)
             
             # 4. Update in-memory state
-            self.song.location_local = self.song.location_correct
-            
-            # Update cache tuple (handling immutability)
-            try:
-                 self.song_query[self.position][20] = self.song.location_correct
-            except TypeError:
-                 temp_list = list(self.song_query[self.position])
-                 temp_list[20] = self.song.location_correct
-                 self.song_query[self.position] = tuple(temp_list)
+            song.location_local = song.location_correct
 
             # 5. Success Notification
-            self.update_fields()
-            ErrorHandler.log_info(f"Renamed song {self.song.id}")
+            if self.song is song:
+                self.update_fields()
+            ErrorHandler.log_info(f"Renamed song {song.id}")
             ErrorHandler.show_info("File renamed successfully!")
 
         except (OSError, PermissionError, shutil.Error) as e:
             # File Move Failed!
             # ROLLBACK Database
             try:
-                self.db.update_song_filename(self.song.id, old_location_db)
+                self.db.update_song_filename(song.id, old_location_db)
                 ErrorHandler.log_info("Database rolled back after failed file move.")
             except Exception as rollback_error:
                 # Fatal! Database thinks file is moved, but it isn't.
                 ErrorHandler.show_critical(
                     "CRITICAL ERROR: Data Corruption!",
-                    f"File move failed AND rollback failed!\n\nFile is at: {self.song.location_local}\nDB thinks it is at: {self.song.location_correct}\n\nError: {rollback_error}"
+                    f"File move failed AND rollback failed!\n\nFile is at: {song.location_local}\nDB thinks it is at: {song.location_correct}\n\nError: {rollback_error}"
                 )
                 return
 
@@ -597,21 +713,24 @@ class DatabaseEditor(Tk):
             # Generic error (DB failure or other)
             ErrorHandler.show_error("Rename Error", f"An unexpected error occurred:\n{e}")
 
+    @staticmethod
+    def _move_file(src, dst):
+        if not path.exists(dst):
+            makedirs(path.dirname(dst), exist_ok=True)
+        # shutil.move renames in place when src and dst share a volume
+        shutil.move(src, dst)
 
     def _gather_data_from_ui(self):
         """Extracts data from UI widgets and updates self.song/self.id3 objects."""
         # Gather editable fields from registry
-        for field_def in field_registry.editable():
-            if field_def.name == "artist":
-                continue  # Artist handled separately below
-            if field_def.name == "year":
+        # Song and SongID3 are plain attribute bags, so write their __dict__ directly
+        song_attrs, id3_attrs = vars(self.song), vars(self.id3)
+        for name, attr, _, w_db, w_id3, _ in self._editable_widgets:
+            if name == "year":
                 continue  # Year handled separately below
             
-            val = self.texts_db[field_def.name].get().strip()
-            setattr(self.song, field_def.song_attr, val)
-            
-            val_id3 = self.texts_id3[field_def.name].get().strip()
-            setattr(self.id3, field_def.song_attr, val_id3)
+            song_attrs[attr] = w_db.get().strip()
+            id3_attrs[attr] = w_id3.get().strip()
             
         self.id3.artist = self.texts_id3["artist"].get().strip()
 
@@ -633,6 +752,11 @@ class DatabaseEditor(Tk):
             self.song.genre_04_id = self.reverse_decade_map.get(self.song.decade, 0)
 
     def save_song(self, rename):
+        # A second move started before the first finishes would fail and
+        # roll the DB back to the old location
+        if self._save_task is not None and not self._save_task.done():
+            return
+
         self._gather_data_from_ui()
 
         # Normalization
@@ -663,57 +787,71 @@ class DatabaseEditor(Tk):
                 "fldLabel": self.song.publisher,
                 "fldCDKey": self.song.isrc,
                 "fldDuration": self.song.duration,
-                # Genre fields require special handling
-                "fldCat1a": Song.get_genre_id(self.song.genre_01_name, self.reverse_genre_map),
-                "fldCat1b": Song.get_genre_id(self.song.genre_02_name, self.reverse_genre_map),
-                "fldCat1c": Song.get_genre_id(self.song.genre_03_name, self.reverse_genre_map),
+                # Genre IDs were resolved by update_genre_ids above
+                "fldCat1a": self.song.genre_01_id,
+                "fldCat1b": self.song.genre_02_id,
+                "fldCat1c": self.song.genre_03_id,
                 "fldCat2": self.song.genre_04_id,
             }
 
-            if rename:
-                 self.song_rename()
-
             # Config Rules / Folder Validation - Handled by SongValidator
 
-
             try:
                  self.db.update_song_fields(self.song.id, update_fields_dict)
             except Exception as e:
                 ErrorHandler.show_error(f"Could not save changes to database:\n{e}")
                 return
 
-            AudioMetadata.tag_write(self.id3, self.song.location_local)
+            # Decoded copies of this song (or reads in flight) are now stale
+            self._prefetch_epoch += 1
+            self._prefetched.pop(self.song.id, None)
+            self.toggle_controls(False)
+            self._save_task = self.loop.create_task(self._finish_save(rename))
+            return
+
+        self.update_fields()
+
+    async def _finish_save(self, rename):
+        """Move the file if asked, then write tags, off the main thread."""
+        # Navigation can move on while this runs; keep hold of what was saved
+        song, id3 = self.song, self.id3
+        try:
+            if rename:
+                await self.song_rename(song)
+
+            await asyncio.to_thread(AudioMetadata.tag_write, id3, song.location_local)
             
             # Check validation
-            if not Song.check_genre(self.song.genres_all, self.id3.genres_all):
+            if not Song.check_genre(song.genres_all, id3.genres_all):
                 return
 
-            # Next song
-            try:
-                # Re-fetch to update local state
-                result = self.db.fetch_songs("AUID", self.song.id, True)
-                
-                if result and len(result) > 0:
-                    result = result[0]
-                
-                try:
-                    self.song_query[self.position] = result
-                except TypeError:
-                    pass
-                
-            except IndexError:
-                 pass
-            except Exception as e:
-                ErrorHandler.log_silent(e, "Refreshing song list")
-
-        self.update_fields()
+            if self.song is song:
+                self.update_fields()
+        except Exception as e:
+            ErrorHandler.log_silent(e, "Writing tags")
+        finally:
+            # Neighbour prefetches may have read the file mid-save
+            self._prefetch_epoch += 1
+            self._prefetched.pop(song.id, None)
+            if self._load_task is None or self._load_task.done():
+                self.toggle_controls(True)
 
     def get_song(self, delta):
-        if self.is_loading:
+        if self._querying:
+            return
+
+        if delta:
+            # Coalesce key-repeat: presses within NAV_DEBOUNCE_MS only move
+            # the counter, then a single song is loaded
+            self._nav_pending_delta += delta
+            self._update_counter(self._clamp_position(self.position + self._nav_pending_delta))
+            if self._nav_after_id is None:
+                self._nav_after_id = self.after(NAV_DEBOUNCE_MS, self._flush_nav)
             return
 
+        self._cancel_nav()
+
         if delta is None:
-            delta = 0
             test = self.text_jump.get().strip()
 
             try:
@@ -723,26 +861,55 @@ class DatabaseEditor(Tk):
                 
             if self.position == -1:
                 self.position = 0
-        
-        self.position += delta
-        
-        if self.position <= -1:
-            self.position = 0
-        if self.position >= len(self.song_query):
-            self.position = len(self.song_query) - 1
+
+        self._load_position(self.position)
+
+    def _flush_nav(self):
+        self._nav_after_id = None
+        delta, self._nav_pending_delta = self._nav_pending_delta, 0
+        if not self._querying:
+            self._load_position(self.position + delta)
+
+    def _cancel_nav(self):
+        if self._nav_after_id is not None:
+            self.after_cancel(self._nav_after_id)
+            self._nav_after_id = None
+        self._nav_pending_delta = 0
+
+    def _clamp_position(self, position):
+        return max(0, min(position, len(self.song_query) - 1))
+
+    def _load_position(self, position):
+        self.position = self._clamp_position(position)
             
         if self.song_query:
             self.toggle_controls(False)
-            threading.Thread(target=self._load_song_thread_job, args=(self.position,), daemon=True).start()
+            if self._load_task is not None:
+                self._load_task.cancel()
+            self._load_task = self.loop.create_task(self._load_song(self.position))
 
-    def _load_song_thread_job(self, pos):
-        """Worker thread for loading song data."""
+    async def _load_song(self, pos):
+        """Load song data in a worker thread, then update the UI."""
         try:
-            data = Song.from_db_record(self.song_query[pos], self.genre_map, self.decade_map, self.tempo_map)
-            self.after(0, self._finish_load_song, data)
+            song_id = self.song_query.ids[pos]
+            data = self._prefetched.pop(song_id, None)
+            if data is None:
+                data = await asyncio.to_thread(self._read_song, song_id)
+        except asyncio.CancelledError:
+            # Superseded by a newer load, which re-enables the controls
+            raise
         except Exception as e:
             ErrorHandler.log_silent(e, "Loading song data thread")
-            self.after(0, self.toggle_controls, True)
+            self.toggle_controls(True)
+            return
+        self._finish_load_song(data)
+
+    def _read_song(self, song_id):
+        """Re-read one row by AUID and build the Song/ID3 pair (worker thread)."""
+        row = self.db.fetch_song(song_id)
+        if row is None:
+            raise LookupError(f"Song {song_id} no longer exists")
+        return Song.from_db_record(row, self.genre_map, self.decade_map, self.tempo_map)
 
     def _finish_load_song(self, data):
         """Update UI with loaded data on main thread."""
@@ -754,49 +921,163 @@ class DatabaseEditor(Tk):
             # messagebox.showerror("UI Error", str(e)) # Optional
         finally:
             self.toggle_controls(True)
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        """Decode the songs next to the current one while the user reads it."""
+        ids, pos = self.song_query.ids, self.position
+        near = {ids[p] for p in range(max(0, pos - PREFETCH_RADIUS), min(len(ids), pos + PREFETCH_RADIUS + 1))}
+        for song_id in [sid for sid in self._prefetched if sid not in near]:
+            del self._prefetched[song_id]
+
+        for offset in PREFETCH_OFFSETS:
+            p = pos + offset
+            if 0 <= p < len(ids):
+                song_id = ids[p]
+                if song_id not in self._prefetched and song_id not in self._prefetching:
+                    self.loop.create_task(self._prefetch_song(song_id))
+
+    async def _prefetch_song(self, song_id):
+        epoch = self._prefetch_epoch
+        self._prefetching.add(song_id)
+        try:
+            data = await asyncio.to_thread(self._read_song, song_id)
+        except Exception as e:
+            ErrorHandler.log_silent(e, "Prefetching song data")
+            return
+        finally:
+            self._prefetching.discard(song_id)
+        if epoch == self._prefetch_epoch:
+            self._prefetched[song_id] = data
 
     def query_db(self):
+        # Built on first use, then hidden and shown again
+        if self._query_window is None:
+            self._build_query_window()
+        self._query_window.deiconify()
+        self._query_text.delete(0, END)
+        self._query_text.focus_set()
+        self.withdraw()
+
+    def _build_query_window(self):
         window_query = Toplevel(self)
         window_query.title("Database query")
         window_query.config(bg=theme.BG_DARK)
         
         # Get queryable fields from registry
         queryable_fields = [f.name for f in field_registry.queryable()]
-        dropdown_field = Combobox(window_query, values=queryable_fields)
-        dropdown_field.grid(row=0, column=0, padx=5, pady=10)
-        dropdown_field.set("artist")
+        self._query_field = Combobox(window_query, values=queryable_fields)
+        self._query_field.grid(row=0, column=0, padx=5, pady=10)
+        self._query_field.set("artist")
         
-        dropdown_match = Combobox(window_query, values=["contains", "equals"])
-        dropdown_match.grid(row=0, column=1, padx=5, pady=10)
-        dropdown_match.set("contains")
+        self._query_match = Combobox(window_query, values=list(QUERY_MATCHES))
+        self._query_match.grid(row=0, column=1, padx=5, pady=10)
+        self._query_match.set("contains")
         
-        text_query = Entry(window_query, width=50, bg=theme.BG_LIGHTER, fg=theme.FG_WHITE, insertbackground=theme.FG_WHITE)
-        text_query.grid(row=0, column=2, padx=5, pady=10)
-        text_query.focus_set()
+        self._query_text = Entry(window_query, width=50, bg=theme.BG_LIGHTER, fg=theme.FG_WHITE, insertbackground=theme.FG_WHITE)
+        self._query_text.grid(row=0, column=2, padx=5, pady=10)
         
-        button_send_query = ttk.Button(window_query, text="Query",
-                                   command=lambda: self.query_button_click(dropdown_field.get(), dropdown_match.get(),
-                                                                      text_query.get().strip(), window_query))
+        button_send_query = ttk.Button(window_query, text="Query", command=self._send_query)
         button_send_query.grid(row=0, column=3, padx=5, pady=10)
         
-        window_query.bind("<Return>", lambda event: self.query_button_click(dropdown_field.get(), dropdown_match.get(),
-                                                                       text_query.get().strip(), window_query))
-        self.withdraw()
+        window_query.bind("<Return>", lambda event: self._send_query())
+        window_query.protocol("WM_DELETE_WINDOW", self._cancel_query_window)
+        self._query_window = window_query
+
+    def _send_query(self):
+        self.query_button_click(self._query_field.get(), self._query_match.get(),
+                                self._query_text.get().strip(), self._query_window)
+
+    def _cancel_query_window(self):
+        self._query_window.withdraw()
+        self.deiconify()
 
     def query_button_click(self, drop_field, drop_match, text_query, window_sent):
         self.toggle_controls(False)
+        self._cancel_nav()
+        self._querying = True
         window_sent.withdraw() # Hide immediately
-        threading.Thread(target=self._query_thread_job, args=(drop_field, drop_match, text_query, window_sent), daemon=True).start()
+        if self._query_task is not None:
+            self._query_task.cancel()
+        self._query_task = self.loop.create_task(self._query(drop_field, drop_match, text_query, window_sent))
 
-    def _query_thread_job(self, drop_field, drop_match, text_query, window_sent):
-        results = self.query_execute(drop_field, drop_match, text_query)
-        self.after(0, self._finish_query, results, window_sent)
+    async def _query(self, drop_field, drop_match, text_query, window_sent):
+        batches = read = None
+        try:
+            batches = self.query_batches(drop_field, drop_match, text_query)
+            read = self._read_batch(batches)
+            first = await asyncio.shield(read) or []
+        except asyncio.CancelledError:
+            self._close_batches(batches, read)
+            raise
+        except Exception as e:
+            ErrorHandler.log_silent(e, "Running query")
+            self._close_batches(batches, read)
+            batches, first = None, []
+        self._query_more = bool(first)
+        self._finish_query(SongQuery(first), window_sent)
+        if first:
+            await self._stream_query(batches)
+        else:
+            self._close_batches(batches, None)
+
+    async def _stream_query(self, batches):
+        """Append the remaining result batches while the user navigates."""
+        target = self.song_query
+        read = None
+        try:
+            while True:
+                read = self._read_batch(batches)
+                rows = await asyncio.shield(read)
+                if rows is None or self.song_query is not target:
+                    # Exhausted, or the list was replaced by another query
+                    break
+                self._extend_query(rows)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            ErrorHandler.log_silent(e, "Streaming query results")
+        finally:
+            # Releases the query's Access connection and cursor
+            self._close_batches(batches, read)
+        self._query_more = False
+        self._update_counter()
+
+    def _read_batch(self, batches):
+        """Read the next result batch (None when exhausted) in a worker thread."""
+        return self.loop.run_in_executor(None, next, batches, None)
+
+    @staticmethod
+    def _close_batches(batches, read):
+        """
+        Close a batch generator. A cancelled read keeps running in its
+        worker thread, and a generator can't be closed mid-read, so in
+        that case it is closed once the read returns.
+        """
+        close = getattr(batches, "close", None)
+        if close is None:
+            return
+        if read is None or read.done():
+            close()
+        else:
+            read.add_done_callback(lambda _: close())
+
+    def _extend_query(self, rows):
+        self.song_query.extend(rows)
+        self._update_counter()
+
+    def _update_counter(self, position=None):
+        if position is None:
+            position = self.position
+        more = "+" if self._query_more else ""
+        self.label_counter.config(text=f"{position + 1}/{len(self.song_query)}{more}")
 
     def _finish_query(self, results, window_sent):
+        self._querying = False
         self.song_query = results
         if not self.song_query:
             ErrorHandler.show_info("No results found.")
-            window_sent.destroy()
+            window_sent.withdraw()
             self.deiconify()
             self.toggle_controls(True)
             return
@@ -837,11 +1118,19 @@ class DatabaseEditor(Tk):
             # print(f"Error log launch failed: {e}")
 
 
-def copy_text(text_1, text_2, end):
+def copy_text(text_1, text_2, end, set_bg=None):
+    """Copy text_1 into text_2 and clear both highlights.
+
+    The editor passes its _set_bg so the colour cache stays in step.
+    """
     text_2.delete(0, end)
     text_2.insert(0, text_1.get())
-    text_1.config(bg=theme.BG_LIGHTER)
-    text_2.config(bg=theme.BG_LIGHTER)
+    if set_bg is None:
+        text_1.config(bg=theme.BG_LIGHTER)
+        text_2.config(bg=theme.BG_LIGHTER)
+    else:
+        set_bg(text_1, theme.BG_LIGHTER)
+        set_bg(text_2, theme.BG_LIGHTER)
 
 
 def process_string_comparison(val1: Any, val2: Any, required: bool = True, is_artist: bool = False) -> Tuple[str, str, str]:
@@ -877,12 +1166,12 @@ def process_string_comparison(val1: Any, val2: Any, required: bool = True, is_ar
 
 
 class WebSearch:
+    # Spaces become %20; characters that break the search URLs are dropped
+    _CLEAN_TABLE = str.maketrans({" ": "%20", "-": None, "&": None, "#": None, "\\": None})
+
     @staticmethod
     def _clean_lookup_string(song):
-        s = song.artist + " " + song.title
-        s = s.replace(" ", "%20")
-        s = s.replace("-", "").replace("&", "").replace("#", "").replace("\\", "")
-        return s
+        return (song.artist + " " + song.title).translate(WebSearch._CLEAN_TABLE)
 
     @staticmethod
     def discogs_lookup(song):
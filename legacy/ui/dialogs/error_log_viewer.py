@@ -1,18 +1,34 @@
+from collections import deque
 from tkinter import Toplevel, Frame, Text, Label, Button, Scrollbar, END, BOTH, RIGHT, Y, X, LEFT, VERTICAL
 from tkinter import ttk
 from src.ui.theme import theme
 from src.utils.error_handler import ErrorHandler
 
+# Entries kept in the viewer; older ones are dropped as new entries arrive
+MAX_ERRORS = 10000
+# Only the newest rows are put in the tree; scrolling near the bottom adds
+# the next page, so opening the viewer costs the same for any log size
+PAGE_SIZE = 200
+
 class ErrorLogViewer(Toplevel):
     def __init__(self, parent):
         super().__init__(parent)
         self.title("Error Log Viewer")
         self.geometry("900x600")
         self.configure(bg=theme.BG_DARK)
-        self.current_errors = []
+        # (iid, error), oldest first. The tree shows the newest _rendered of
+        # them, newest on top; new entries are added to the top as they arrive.
+        self.current_errors = deque()
+        self._rendered = 0
+        self._render_pending = False
+        self._errors_by_iid = {}
+        self._next_iid = 0
+        self._log_offset = 0
+        self._loaded = False
         
         # UI Setup
         self._setup_ui()
+        ErrorHandler.log_info("Error log viewer opened")
         self._load_data()
         
     def _setup_ui(self):
@@ -23,6 +39,10 @@ class ErrorLogViewer(Toplevel):
         self.btn_refresh = Button(toolbar, text="Refresh", command=self._load_data, 
                                  bg=theme.BTN_ACTIVE, fg=theme.FG_WHITE, relief="flat", padx=10)
         self.btn_refresh.pack(side=LEFT, padx=(0, 10))
+
+        self.btn_clear = Button(toolbar, text="Clear Log", command=self._clear_log,
+                                bg=theme.BTN_ACTIVE, fg=theme.FG_WHITE, relief="flat", padx=10)
+        self.btn_clear.pack(side=LEFT, padx=(0, 10))
         
         # Main Content: Database style list (Treeview)
         # Using a paned window to split List and Details
@@ -37,8 +57,8 @@ class ErrorLogViewer(Toplevel):
         self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings", selectmode="browse")
         
         # Scrollbar
-        vpath = Scrollbar(tree_frame, orient=VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vpath.set)
+        self._scrollbar = vpath = Scrollbar(tree_frame, orient=VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_scroll)
         
         self.tree.heading("Time", text="Time", anchor="w")
         self.tree.heading("Level", text="Level", anchor="w")
@@ -52,6 +72,10 @@ class ErrorLogViewer(Toplevel):
         
         self.tree.pack(side=LEFT, fill=BOTH, expand=True)
         vpath.pack(side=RIGHT, fill=Y)
+
+        # Shown over the empty tree instead of a placeholder row
+        self.lbl_empty = Label(tree_frame, text="No errors found in log file.",
+                               bg="#2b2b2b", fg=theme.FG_WHITE)
         
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
         
@@ -78,68 +102,113 @@ class ErrorLogViewer(Toplevel):
         self.tree.tag_configure("SILENT", foreground="#a0a0a0")   # Gray
 
     def _load_data(self):
+        """Add the log entries written since the last load to the top of the list."""
         try:
-            # Clear existing
-            for i in self.tree.get_children():
-                self.tree.delete(i)
-                
-            self.current_errors = ErrorHandler.get_recent_errors(limit=100)
-            ErrorHandler.log_info(f"Viewer loaded {len(self.current_errors)} errors")
-            
-            if not self.current_errors:
-                # Add placeholder if empty
-                self.tree.insert("", "end", values=("", "INFO", "", "No errors found in log file."))
-                return
-            
-            # Insert in reverse order (newest top)
-            for i, err in enumerate(reversed(self.current_errors)):
-                tags = (err.get("level", "INFO"),)
-                values = (
-                    err.get("timestamp", "")[:19].replace("T", " "), # Clean up timestamp
-                    err.get("level", ""),
-                    err.get("context", ""),
-                    err.get("message", "")
-                )
-                # Use 'i' as index to map back to reversed list
-                self.tree.insert("", "end", iid=str(i), values=values, tags=tags)
+            size = ErrorHandler.log_size()
+            if self._loaded and size == self._log_offset:
+                return  # Nothing new
+            if not self._loaded or size < self._log_offset:
+                # First load, or the log was cleared: start over from its tail
+                self._reset_rows()
+                new_errors, self._log_offset = ErrorHandler.tail_errors(limit=MAX_ERRORS)
+                self._loaded = True
+                for err in new_errors:
+                    self._add_error(err, render=False)
+                self._render_more()
+            else:
+                new_errors, self._log_offset = ErrorHandler.read_errors_since(self._log_offset)
+                for err in new_errors[-MAX_ERRORS:]:
+                    self._add_error(err, render=True)
+
+            if self.current_errors:
+                self.lbl_empty.place_forget()
+            else:
+                self.lbl_empty.place(relx=0.5, rely=0.5, anchor="center")
                 
         except Exception as e:
             from tkinter import messagebox
             messagebox.showerror("Error Log Error", f"Failed to load error log:\n{e}")
+
+    def _add_error(self, err, render):
+        if len(self.current_errors) == MAX_ERRORS:
+            old_iid, _ = self.current_errors.popleft()
+            if self._rendered > len(self.current_errors):
+                # The dropped entry was the bottom row
+                self._rendered -= 1
+                del self._errors_by_iid[old_iid]
+                self.tree.delete(old_iid)
+        iid = str(self._next_iid)
+        self._next_iid += 1
+        self.current_errors.append((iid, err))
+        if render:
+            # Newest on top; existing rows keep their place
+            self._insert_row(iid, err, 0)
+            self._rendered += 1
+
+    def _render_more(self):
+        """Add the next page of older entries to the bottom of the tree."""
+        self._render_pending = False
+        total = len(self.current_errors)
+        stop = min(total, self._rendered + PAGE_SIZE)
+        for back in range(self._rendered + 1, stop + 1):
+            iid, err = self.current_errors[total - back]
+            self._insert_row(iid, err, "end")
+        self._rendered = stop
+
+    def _on_scroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if float(last) > 0.9 and self._rendered < len(self.current_errors) and not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render_more)
+
+    def _insert_row(self, iid, err, index):
+        self._errors_by_iid[iid] = err
+        tags = (err.get("level", "INFO"),)
+        values = (
+            err.get("timestamp", "")[:19].replace("T", " "), # Clean up timestamp
+            err.get("level", ""),
+            err.get("context", ""),
+            err.get("message", "")
+        )
+        self.tree.insert("", index, iid=iid, values=values, tags=tags)
+
+    def _reset_rows(self):
+        self.tree.delete(*self.tree.get_children())
+        self.current_errors.clear()
+        self._rendered = 0
+        self._errors_by_iid.clear()
             
     def _on_select(self, event):
         selected = self.tree.selection()
         if not selected:
             return
             
-        iid = selected[0]
-        try:
-            index = int(iid)
-            # data was reversed
-            err = list(reversed(self.current_errors))[index]
+        err = self._errors_by_iid.get(selected[0])
+        if err is None:
+            return
             
-            # Construct details
-            details = f"Time: {err.get('timestamp')}\n"
-            details += f"Level: {err.get('level')}\n"
-            details += f"Context: {err.get('context')}\n"
-            details += f"Message: {err.get('message')}\n"
+        # Construct details
+        parts = [
+            f"Time: {err.get('timestamp')}",
+            f"Level: {err.get('level')}",
+            f"Context: {err.get('context')}",
+            f"Message: {err.get('message')}",
+        ]
+        
+        exc = err.get("exception")
+        if exc:
+            parts.append(f"\nException: {exc}")
             
-            exc = err.get("exception")
-            if exc:
-                details += f"\nException: {exc}\n"
-                
-            trace = err.get("stack_trace")
-            if trace:
-                details += f"\nStack Trace:\n{trace}"
-                
-            self.txt_details.delete("1.0", END)
-            self.txt_details.insert("1.0", details)
+        trace = err.get("stack_trace")
+        if trace:
+            parts.append(f"\nStack Trace:\n{trace}")
             
-        except (ValueError, IndexError):
-            pass
+        self.txt_details.delete("1.0", END)
+        self.txt_details.insert("1.0", "\n".join(parts))
 
     def _clear_log(self):
         ErrorHandler.clear_log_file()
+        self._loaded = False
         self._load_data()
 
     def show(self):
@@ -6,7 +6,7 @@ Connects to MS Access databases (.mdb, .accdb) via pyodbc.
 
 import pyodbc
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 
 from src.backends.base import Backend, ColumnInfo
 
@@ -25,6 +25,12 @@ class AccessBackend(Backend):
     
     # System tables to exclude from get_tables()
     SYSTEM_TABLE_PREFIXES = ('MSys', 'USys', '~')
+    # Max keys bound into one IN (...) clause by update_many
+    UPDATE_CHUNK_SIZE = 500
+    # Rows pulled per round trip when streaming a single column
+    ITER_COLUMN_ARRAYSIZE = 5000
+    # Rows pulled per round trip when streaming whole rows
+    ITER_ROWS_ARRAYSIZE = 1000
     
     def __init__(self, connection_string: str):
         """
@@ -212,6 +218,50 @@ class AccessBackend(Backend):
         finally:
             cursor.close()
     
+    def iter_column(
+        self,
+        table: str,
+        column: str,
+        batch_size: Optional[int] = None
+    ) -> Iterator[Any]:
+        """Stream one column's values in fetchmany() batches, no row dicts."""
+        batch_size = batch_size or self.ITER_COLUMN_ARRAYSIZE
+        cursor = self._get_cursor()
+        try:
+            cursor.arraysize = batch_size
+            cursor.execute(f"SELECT [{column}] FROM [{table}]")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row[0]
+        finally:
+            cursor.close()
+    
+    def iter_rows(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream whole rows as dicts in fetchmany() batches."""
+        batch_size = batch_size or self.ITER_ROWS_ARRAYSIZE
+        cursor = self._get_cursor()
+        try:
+            cursor.arraysize = batch_size
+            col_str = "*" if not columns else ", ".join(f"[{c}]" for c in columns)
+            cursor.execute(f"SELECT {col_str} FROM [{table}]")
+            col_names = [desc[0] for desc in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(col_names, row))
+        finally:
+            cursor.close()
+    
     def fetch_one(
         self, 
         table: str, 
@@ -335,6 +385,42 @@ class AccessBackend(Backend):
         finally:
             cursor.close()
     
+    def update_many(
+        self,
+        table: str,
+        primary_key_values: List[Any],
+        fields: Dict[str, Any],
+        primary_key_column: str = "id"
+    ) -> int:
+        """Update several records with one UPDATE ... WHERE pk IN (...) per chunk, in one transaction."""
+        if not fields or not primary_key_values:
+            return 0
+            
+        cursor = self._get_cursor()
+        try:
+            set_parts = [f"[{col}] = ?" for col in fields.keys()]
+            values = list(fields.values())
+            pks = list(primary_key_values)
+            updated = 0
+            
+            for start in range(0, len(pks), self.UPDATE_CHUNK_SIZE):
+                chunk = pks[start:start + self.UPDATE_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                query = (
+                    f"UPDATE [{table}] SET {', '.join(set_parts)} "
+                    f"WHERE [{primary_key_column}] IN ({placeholders})"
+                )
+                cursor.execute(query, values + chunk)
+                updated += max(cursor.rowcount, 0)
+            
+            self._connection.commit()
+            return updated
+        except Exception as e:
+            self._connection.rollback()
+            raise e
+        finally:
+            cursor.close()
+    
     def insert(
         self,
         table: str,
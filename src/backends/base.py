@@ -6,7 +6,7 @@ consistent behavior across different database types.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from dataclasses import dataclass
 
 
@@ -32,6 +32,9 @@ class Backend(ABC):
     is managed internally and should be opened/closed as needed.
     """
     
+    # Row cap for the generic iter_column()/iter_rows() fallbacks
+    ITER_COLUMN_LIMIT = 200000
+    
     def __init__(self, connection_string: str):
         """
         Initialize the backend with a connection string.
@@ -127,6 +130,45 @@ class Backend(ABC):
         """
         pass
     
+    def iter_column(
+        self,
+        table: str,
+        column: str,
+        batch_size: Optional[int] = None
+    ) -> Iterator[Any]:
+        """
+        Yield every value of a single column.
+        
+        The default implementation goes through fetch(); backends should
+        override it to stream scalars without building a dict per row.
+        
+        Args:
+            table: Name of the table
+            column: Column to read
+            batch_size: Rows fetched per round trip (backend default if None)
+        """
+        for row in self.fetch(table, columns=[column], limit=self.ITER_COLUMN_LIMIT):
+            yield row.get(column)
+    
+    def iter_rows(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        batch_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every row of a table as a dict.
+        
+        The default implementation goes through fetch(); backends should
+        override it to stream rows instead of loading the whole table.
+        
+        Args:
+            table: Name of the table
+            columns: List of column names to fetch (None = all)
+            batch_size: Rows fetched per round trip (backend default if None)
+        """
+        yield from self.fetch(table, columns=columns, limit=self.ITER_COLUMN_LIMIT)
+    
     @abstractmethod
     def fetch_one(
         self, 
@@ -213,6 +255,33 @@ class Backend(ABC):
         """
         pass
     
+    def update_many(
+        self,
+        table: str,
+        primary_key_values: List[Any],
+        fields: Dict[str, Any],
+        primary_key_column: str = "id"
+    ) -> int:
+        """
+        Apply the same field values to several records.
+        
+        The default implementation calls update() per record; backends
+        should override it with a batched statement.
+        
+        Args:
+            table: Name of the table
+            primary_key_values: Primary keys of the records to update
+            fields: Dict of column->new_value to update
+            primary_key_column: Name of the primary key column
+            
+        Returns:
+            Number of records updated
+        """
+        return sum(
+            1 for pk in primary_key_values
+            if self.update(table, pk, fields, primary_key_column=primary_key_column)
+        )
+    
     @abstractmethod
     def insert(
         self,
@@ -37,6 +37,9 @@ DEFAULT_CONFIG = {
 class Config:
     def __init__(self):
         self._data = self._load_from_file()
+        # Frozensets of genre_rules lists, rebuilt when the rules dict is replaced
+        self._rule_sets_source = None
+        self._rule_sets = {}
         
     def _load_from_file(self) -> Dict[str, Any]:
         if not path.exists(CONFIG_FILE):
@@ -130,6 +133,18 @@ class Config:
     def genre_rules(self) -> Dict[str, Any]:
         return self._data.get("genre_rules", DEFAULT_CONFIG["genre_rules"])
 
+    def genre_rule_set(self, key: str) -> frozenset:
+        """genre_rules[key] as a frozenset, for membership tests."""
+        rules = self.genre_rules
+        # reload() and the save_* methods replace the dict, so identity tracks changes
+        if rules is not self._rule_sets_source:
+            self._rule_sets = {}
+            self._rule_sets_source = rules
+        rule_set = self._rule_sets.get(key)
+        if rule_set is None:
+            rule_set = self._rule_sets[key] = frozenset(rules.get(key, ()))
+        return rule_set
+
     @property
     def base_songs_path(self) -> str:
         return self._data.get("base_songs_path", DEFAULT_CONFIG["base_songs_path"])
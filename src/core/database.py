@@ -1,15 +1,153 @@
+import datetime
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from decimal import Decimal
+from functools import lru_cache
+
 from src.utils.error_handler import ErrorHandler
-from pyodbc import connect
+from pyodbc import connect, Error as OdbcError
+
+# Rows per fetchmany() call when streaming query results
+FETCH_BATCH_SIZE = 500
+# Compiled statements the SQLite mirror keeps per connection
+MIRROR_STATEMENT_CACHE = 256
+# Seconds before the mirror is rebuilt; Jazler and other tools write to
+# the Access file directly, and those changes never reach the copy
+MIRROR_MAX_AGE = 300.0
+
+
+class SongQuery:
+    """
+    Column store for the editor's query results.
+    Keeps only the AUID of each row; the full row is read again by AUID
+    (Database.fetch_song) when a song is opened.
+    """
+    ID_COLUMN = 0
+
+    def __init__(self, rows=()):
+        self.ids = array('q')
+        self.extend(rows)
+
+    def extend(self, rows):
+        self.ids.extend([row[self.ID_COLUMN] for row in rows])
+
+    def __len__(self):
+        return len(self.ids)
+
+
+# How Access values are stored in the SQLite mirror, and read back
+_MIRROR_ENCODE = {
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    Decimal: str,
+}
+_MIRROR_DECODE = {
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.date: datetime.date.fromisoformat,
+    Decimal: Decimal,
+    bool: bool,
+}
+
+# Column declarations in the mirror, by Access type. Numeric columns need an
+# affinity so '=' with a string parameter ('1999' from the query box)
+# converts it and matches as Access does
+_MIRROR_COLUMN_TYPES = {
+    str: "TEXT COLLATE CASEFOLD",
+    int: "INTEGER",
+    bool: "INTEGER",
+    float: "REAL",
+}
+
+
+def _mirror_value(value):
+    encode = _MIRROR_ENCODE.get(type(value))
+    return encode(value) if encode else value
+
+
+@lru_cache(maxsize=256)
+def _like_regex(pattern):
+    parts = (".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern)
+    return re.compile("".join(parts), re.IGNORECASE | re.DOTALL)
+
+
+def _casefold_collation(a, b):
+    """Access-style text comparison for '=' in the mirror (Unicode casefold)."""
+    a, b = a.casefold(), b.casefold()
+    return (a > b) - (a < b)
+
+
+def _like(pattern, value):
+    """Access-style LIKE: case-insensitive for all letters, not just ASCII."""
+    if pattern is None or value is None:
+        return None
+    return _like_regex(pattern).fullmatch(str(value)) is not None
 
 
 class Database:
-    def __init__(self, db_path, table_name):
+    def __init__(self, db_path, table_name, mirror=False):
         self.db_path = db_path
         self.table_name = table_name
+        # Optional in-memory SQLite copy of the song table for LIKE/equals
+        # scans. It is filled in the background and rebuilt once older than
+        # MIRROR_MAX_AGE; reads go to Access until it is ready, and every
+        # write through this class is applied to both. Single-song reads
+        # (fetch_song) always go to Access.
+        self._mirror = None
+        self._mirror_built = 0.0
+        self._mirror_decoders = None
+        self._mirror_pending = [] if mirror else None
+        self._mirror_lock = threading.Lock()
+        # One SQL string per (column, exact_match) so repeated queries hit
+        # the mirror's statement cache
+        self._song_queries = {}
+        # One Access connection per thread, kept open: connecting costs far
+        # more than a single-row read, and separate connections let song
+        # loads in worker threads run alongside a save on the Tk thread
+        self._local = threading.local()
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        if mirror:
+            self._start_mirror_build()
 
-    def _get_connection(self):
+    def _connect(self):
         return connect(f'Driver={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={self.db_path}')
 
+    def _get_connection(self):
+        """The calling thread's pooled connection, opened on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._pool_lock:
+                self._pool.append(conn)
+        return conn
+
+    def _discard_connection(self):
+        """Drop the calling thread's connection after an error; the next call reconnects."""
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        if conn is not None:
+            with self._pool_lock:
+                if conn in self._pool:
+                    self._pool.remove(conn)
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def close(self):
+        """Close every pooled connection."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            try:
+                conn.close()
+            except Exception as e:
+                ErrorHandler.log_silent(e, "Closing database connection")
+        self._local = threading.local()
+
     def _fetch(self, query, params=None):
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -19,10 +157,126 @@ class Database:
             else:
                 cursor.execute(query)
             return cursor.fetchall()
+        except OdbcError:
+            self._discard_connection()
+            raise
+        finally:
+            cursor.close()
+
+    def _fetch_batches(self, query, params=None, batch_size=FETCH_BATCH_SIZE):
+        """
+        Yield result rows in lists of up to batch_size.
+        Uses its own connection (the generator may be advanced from several
+        threads), open until the generator is exhausted or closed.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
         finally:
             cursor.close()
             conn.close()
 
+    def _start_mirror_build(self):
+        threading.Thread(target=self._build_mirror, daemon=True).start()
+
+    def _build_mirror(self):
+        """Copy the song table into an in-memory SQLite database."""
+        try:
+            mem = sqlite3.connect(':memory:', check_same_thread=False, cached_statements=MIRROR_STATEMENT_CACHE)
+            mem.create_function("like", 2, _like, deterministic=True)
+            mem.create_collation("CASEFOLD", _casefold_collation)
+            conn = self._connect()
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"SELECT * FROM {self.table_name}")
+                # Access compares text case-insensitively, for '=' as well
+                columns = ", ".join(
+                    f"[{d[0]}] {_MIRROR_COLUMN_TYPES.get(d[1], '')}".rstrip()
+                    for d in cursor.description
+                )
+                decoders = [_MIRROR_DECODE.get(d[1]) for d in cursor.description]
+                mem.execute(f"CREATE TABLE {self.table_name} ({columns})")
+                insert = f"INSERT INTO {self.table_name} VALUES ({', '.join('?' * len(decoders))})"
+                while True:
+                    rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+                    if not rows:
+                        break
+                    mem.executemany(insert, [tuple(map(_mirror_value, row)) for row in rows])
+            finally:
+                cursor.close()
+                conn.close()
+            mem.execute(f"CREATE INDEX idx_auid ON {self.table_name} (AUID)")
+            with self._mirror_lock:
+                # Writes made while copying may or may not be in the copy; replay them
+                for query, params in self._mirror_pending:
+                    mem.execute(query, params)
+                mem.commit()
+                self._mirror_pending = None
+                self._mirror_decoders = decoders
+                self._mirror_built = time.monotonic()
+                self._mirror = mem
+        except Exception as e:
+            ErrorHandler.log_silent(e, "Building in-memory song table")
+            with self._mirror_lock:
+                self._mirror_pending = None
+
+    def _mirror_rows(self, rows):
+        decoders = self._mirror_decoders
+        return [
+            tuple(v if f is None or v is None else f(v) for f, v in zip(decoders, row))
+            for row in rows
+        ]
+
+    def _fresh_mirror(self):
+        """
+        The mirror, or None if it is not built yet or has just expired.
+        An expired mirror is dropped and copied again in the background.
+        Call with _mirror_lock held.
+        """
+        mem = self._mirror
+        if mem is not None and time.monotonic() - self._mirror_built > MIRROR_MAX_AGE:
+            mem.close()
+            mem = self._mirror = None
+            self._mirror_pending = []
+            self._start_mirror_build()
+        return mem
+
+    def _read(self, query, params=None):
+        """_fetch for song-table scans; served from the mirror while it is fresh."""
+        with self._mirror_lock:
+            mem = self._fresh_mirror()
+            if mem is not None:
+                return self._mirror_rows(mem.execute(query, params or ()).fetchall())
+        return self._fetch(query, params)
+
+    def _read_batches(self, query, params=None, batch_size=FETCH_BATCH_SIZE):
+        with self._mirror_lock:
+            mem = self._fresh_mirror()
+            if mem is not None:
+                rows = self._mirror_rows(mem.execute(query, params or ()).fetchall())
+                return (rows[i:i + batch_size] for i in range(0, len(rows), batch_size))
+        return self._fetch_batches(query, params, batch_size)
+
+    def _write(self, query, params=None):
+        """_execute for song-table writes; also applied to the mirror."""
+        self._execute(query, params)
+        params = tuple(map(_mirror_value, params or ()))
+        with self._mirror_lock:
+            if self._mirror is not None:
+                self._mirror.execute(query, params)
+                self._mirror.commit()
+            elif self._mirror_pending is not None:
+                self._mirror_pending.append((query, params))
+
     def _execute(self, query, params=None):
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -32,9 +286,11 @@ class Database:
             else:
                 cursor.execute(query)
             conn.commit()
+        except OdbcError:
+            self._discard_connection()
+            raise
         finally:
             cursor.close()
-            conn.close()
 
     def generate_genre_map(self):
         query = "SELECT * from snCat1"
@@ -55,7 +311,7 @@ class Database:
 
     def update_song_filename(self, song_id, new_filename):
         query = f"UPDATE {self.table_name} SET fldFilename = ? WHERE AUID = ?"
-        self._execute(query, (new_filename, song_id))
+        self._write(query, (new_filename, song_id))
 
     def update_song_fields(self, song_id, fields):
         """
@@ -66,22 +322,42 @@ class Database:
         values = list(fields.values())
         values.append(song_id)
         query = f"UPDATE {self.table_name} SET {columns} WHERE AUID = ?"
-        self._execute(query, tuple(values))
+        self._write(query, tuple(values))
 
     def delete_song(self, song_id):
         ErrorHandler.log_info(f"Deleting song with ID: {song_id}")
         query = f"DELETE FROM {self.table_name} WHERE AUID = ?"
-        self._execute(query, (song_id,))
+        self._write(query, (song_id,))
+
+    def _songs_query(self, field, value, exact_match):
+        query = self._song_queries.get((field, exact_match))
+        if query is None:
+            op = "=" if exact_match else "LIKE"
+            query = self._song_queries[(field, exact_match)] = f"SELECT * FROM {self.table_name} WHERE {field} {op} ?"
+        return query, ((value,) if exact_match else (f'%{value}%',))
 
     def fetch_songs(self, field, value, exact_match):
-        if exact_match:
-            query = f"SELECT * FROM {self.table_name} WHERE {field} = ?"
-            return self._fetch(query, (value,))
-        else:
-            query = f"SELECT * FROM {self.table_name} WHERE {field} LIKE ?"
-            return self._fetch(query, (f'%{value}%',))
+        return self._read(*self._songs_query(field, value, exact_match))
 
     def fetch_all_songs(self):
         query = f"SELECT * FROM {self.table_name}"
-        return self._fetch(query)
+        return self._read(query)
+
+    def fetch_song(self, song_id):
+        """
+        Return the full row for one AUID, or None if it no longer exists.
+        Always read from Access, so an opened song reflects edits made by
+        other programs since the mirror was copied.
+        """
+        rows = self._fetch(f"SELECT * FROM {self.table_name} WHERE AUID = ?", (song_id,))
+        return rows[0] if rows else None
+
+    def iter_songs(self, field, value, exact_match, batch_size=FETCH_BATCH_SIZE):
+        """Same rows as fetch_songs, yielded in batches as they are read."""
+        query, params = self._songs_query(field, value, exact_match)
+        return self._read_batches(query, params, batch_size)
+
+    def iter_all_songs(self, batch_size=FETCH_BATCH_SIZE):
+        """Same rows as fetch_all_songs, yielded in batches as they are read."""
+        return self._read_batches(f"SELECT * FROM {self.table_name}", batch_size=batch_size)
 
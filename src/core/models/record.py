@@ -8,6 +8,8 @@ A schema-aware wrapper around database records that provides:
 - Change tracking for updates
 """
 
+from itertools import repeat
+from operator import attrgetter
 from typing import Dict, Any, Optional, List, Set
 from src.core.schema.definition import TableDefinition
 
@@ -25,6 +27,9 @@ class Record:
     """
     
     # FIELD_ALIASES removed - now handled by table schema
+
+    # Slots keep per-row overhead low when thousands of records are built
+    __slots__ = ('_data', '_schema', '_changes', '_display_map', '_lower_map')
     
     def __init__(self, data: Dict[str, Any], schema: Optional[TableDefinition] = None):
         """
@@ -38,25 +43,37 @@ class Record:
         object.__setattr__(self, '_data', dict(data))
         object.__setattr__(self, '_schema', schema)
         object.__setattr__(self, '_changes', {})
-        object.__setattr__(self, '_display_to_column', {})
-        
-        # Build lowercase -> actual column name map for case-insensitive access
-        lower_map = {k.lower(): k for k in data.keys()}
-        object.__setattr__(self, '_lower_column_map', lower_map)
-        
-        # Build display name -> column name mapping
-        if schema:
-            for col in schema.columns:
-                if col.display_name:
-                    # Store as lowercase for case-insensitive access
-                    key = col.display_name.lower().replace(' ', '_')
-                    self._display_to_column[key] = col.name
-                # Also allow access by column name (lowercase, no prefix)
-                # e.g., "fldArtistName" -> "artistname"
-                simple_name = col.name.lower()
-                if simple_name.startswith('fld'):
-                    simple_name = simple_name[3:]
-                self._display_to_column[simple_name] = col.name
+        # Name maps are built on first non-exact lookup; exact column
+        # access (the common case) never needs them
+        object.__setattr__(self, '_display_map', None)
+        object.__setattr__(self, '_lower_map', None)
+
+    @property
+    def _lower_column_map(self) -> Dict[str, str]:
+        """Lowercase -> actual column name map for case-insensitive access."""
+        if self._lower_map is None:
+            object.__setattr__(self, '_lower_map', {k.lower(): k for k in self._data})
+        return self._lower_map
+
+    @property
+    def _display_to_column(self) -> Dict[str, str]:
+        """Display name / short name -> column name mapping."""
+        if self._display_map is None:
+            mapping = {}
+            if self._schema:
+                for col in self._schema.columns:
+                    if col.display_name:
+                        # Store as lowercase for case-insensitive access
+                        key = col.display_name.lower().replace(' ', '_')
+                        mapping[key] = col.name
+                    # Also allow access by column name (lowercase, no prefix)
+                    # e.g., "fldArtistName" -> "artistname"
+                    simple_name = col.name.lower()
+                    if simple_name.startswith('fld'):
+                        simple_name = simple_name[3:]
+                    mapping[simple_name] = col.name
+            object.__setattr__(self, '_display_map', mapping)
+        return self._display_map
     
     def _resolve_column(self, name: str) -> Optional[str]:
         """Resolve a display name or alias to the actual column name."""
@@ -99,6 +116,9 @@ class Record:
     
     def __getattr__(self, name: str) -> Any:
         """Allow attribute-style access to fields."""
+        if name.startswith('_'):
+            # Internal slot not set yet (e.g. during copy); never a column
+            raise AttributeError(name)
         col = self._resolve_column(name)
         if col:
             return self._data.get(col)
@@ -106,6 +126,9 @@ class Record:
     
     def __setattr__(self, name: str, value: Any) -> None:
         """Track changes when setting attributes."""
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+            return
         col = self._resolve_column(name)
         if col:
             old_value = self._data.get(col)
@@ -214,6 +237,9 @@ class Record:
         return " ".join(parts)
 
 
+_ROW_DATA = attrgetter('_data')
+
+
 class RecordSet:
     """
     A collection of Records with navigation support.
@@ -284,6 +310,36 @@ class RecordSet:
         """Index access to records."""
         return self._records[index]
     
+    def column(self, name: str) -> List[Any]:
+        """
+        Values of one field across all records, in order.
+        
+        The name is resolved once against the first record (records in a set
+        share a schema) and values are read straight from the row dicts,
+        skipping per-record attribute resolution.
+        """
+        if not self._records:
+            return []
+        col = self._records[0]._resolve_column(name)
+        if col is None:
+            raise KeyError(name)
+        return list(map(dict.get, map(_ROW_DATA, self._records), repeat(col)))
+    
+    def columnar(self, columns: Optional[List[str]] = None) -> Dict[str, List[Any]]:
+        """
+        Column-oriented view: {name: [value per record]}.
+        
+        Suited to JSON grid payloads - M lists instead of N row dicts.
+        
+        Args:
+            columns: Field names to include (None = every column of the first record)
+        """
+        if not self._records:
+            return {name: [] for name in columns or []}
+        if columns is None:
+            columns = list(self._records[0]._data)
+        return {name: self.column(name) for name in columns}
+    
     def __iter__(self):
         """Iterate over records."""
         return iter(self._records)
@@ -1,4 +1,5 @@
 from src.core.config import app_config
+from functools import lru_cache
 from os import path
 from src.utils.audio import AudioMetadata
 from typing import List, Dict, Any, Tuple, Optional
@@ -7,6 +8,12 @@ from src.utils.id3_tags import ID3Tags
 from src.models.db_schema import SongColumns as Col
 
 
+@lru_cache(maxsize=4096)
+def _fold_path(p: str) -> str:
+    # Bulk validation compares the same few thousand paths over and over
+    return p.casefold()
+
+
 class Song:
     def __init__(self, input_data: Tuple[Any, ...], genres: Dict[int, str], decades: Dict[int, str], tempos: Dict[int, str]):
         self.id = input_data[Col.AUID]
@@ -99,16 +106,16 @@ class Song:
         base_path = app_config.base_songs_path
         
         # Check overrides
-        if genre in app_config.genre_rules["path_overrides"]:
-            folder = app_config.genre_rules["path_overrides"][genre]
-            return path.join(folder, filename)
+        override = app_config.genre_rules["path_overrides"].get(genre)
+        if override is not None:
+            return path.join(override, filename)
 
         folder = path.join(base_path, genre, str(self.year)).lower()
         
-        if genre in app_config.genre_rules["no_year_subfolder"]:
+        if genre in app_config.genre_rule_set("no_year_subfolder"):
             folder = path.join(base_path, genre).lower()
             
-        if genre in app_config.genre_rules["no_genre_subfolder"]:
+        if genre in app_config.genre_rule_set("no_genre_subfolder"):
             folder = path.join(base_path, str(self.year)).lower()
 
         return path.join(folder, filename)
@@ -118,6 +125,11 @@ class Song:
     def list_to_string(genre0: str, strings: List[str]) -> str:
         return ', '.join(strings).replace(f', {genre0}', "")
 
+    @staticmethod
+    def same_path(path_a: str, path_b: str) -> bool:
+        """Case-insensitive path comparison (song paths live on Windows shares)."""
+        return path_a == path_b or _fold_path(path_a) == _fold_path(path_b)
+
     @staticmethod
     def calc_decade(year: Any) -> str:
         if year == "" or year is None:
@@ -137,7 +149,8 @@ class Song:
     @staticmethod
     def check_genre(database_genre: str, id3_genre: str) -> bool:
         list_db = list(dict.fromkeys(database_genre.split(", ")))[:3]
-        list_id3 = list(dict.fromkeys(id3_genre.split(", ")))
+        # Lower-cased once here rather than once per DB genre below
+        list_id3 = [g.lower() for g in dict.fromkeys(id3_genre.split(", "))]
         
         for item in list_db:
             item_clean = item.lower().strip()
@@ -146,14 +159,8 @@ class Song:
             if item_clean == "za obradu":
                 continue
                 
-            found = False
-            for id3_item in list_id3:
-                # Partial match: DB "Zabavne" matches ID3 "Cro Zabavne"
-                if item_clean in id3_item.lower():
-                    found = True
-                    break
-            
-            if not found:
+            # Partial match: DB "Zabavne" matches ID3 "Cro Zabavne"
+            if not any(item_clean in id3_item for id3_item in list_id3):
                 return False
         return True
 
@@ -183,14 +190,10 @@ class Song:
         current_genres = [g for g in self.genres_all.split(", ") if g and g != default_genre]
         
         # Ensure at least 3 slots
-        self.genre_01_name = current_genres[0] if len(current_genres) > 0 else default_genre
-        self.genre_01_id = Song.get_genre_id(self.genre_01_name, reverse_genre_map)
-        
-        self.genre_02_name = current_genres[1] if len(current_genres) > 1 else default_genre
-        self.genre_02_id = Song.get_genre_id(self.genre_02_name, reverse_genre_map)
-        
-        self.genre_03_name = current_genres[2] if len(current_genres) > 2 else default_genre
-        self.genre_03_id = Song.get_genre_id(self.genre_03_name, reverse_genre_map)
+        for i, slot in enumerate(("01", "02", "03")):
+            name = current_genres[i] if i < len(current_genres) else default_genre
+            setattr(self, f"genre_{slot}_name", name)
+            setattr(self, f"genre_{slot}_id", Song.get_genre_id(name, reverse_genre_map))
 
     def __str__(self):
         return f"{self.artist} - {self.title} ({self.year})"
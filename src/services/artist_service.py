@@ -10,24 +10,25 @@ class ArtistService:
     """
     Service for managing Artists (snArtists table).
     Extends generic lookup functionality but with specific artist logic.
+
+    Name searches (the autocomplete endpoint, hit on every keystroke) go
+    through LookupService's TTL/LRU search cache; writes made here
+    invalidate it.
     """
     
     def __init__(self, backend, registry):
         self.backend = backend
         self.registry = registry
         self.table_name = "snArtists"
+        self._lookups = LookupService(backend, registry)
         
     def search(self, query: str, limit: int = 20) -> List[Record]:
         """Search artists by name."""
         if not query:
             return []
             
-        return self.backend.search(
-            table=self.table_name,
-            column="fldName",
-            value=query,
-            match_type="contains"
-        )
+        # A database error must not look like "no artists found"
+        return self._lookups.search(self.table_name, "fldName", query, raise_errors=True)
 
     def get_by_id(self, artist_id: int) -> Optional[Record]:
         """Get artist by ID."""
@@ -68,7 +69,10 @@ class ArtistService:
             # Default other fields (F1, F2...) will be handled by DB or ignored
         }
         
-        pk = self.backend.insert(self.table_name, data)
+        try:
+            pk = self.backend.insert(self.table_name, data)
+        finally:
+            self._lookups.invalidate(self.table_name)
         logger.info(f"Created new artist '{name}' with ID {pk}")
         return pk
 
@@ -78,12 +82,15 @@ class ArtistService:
         If 'fldName' is changed, propagates the new name to all linked songs in snDatabase.
         """
         # 1. Update the artist record itself
-        success = self.backend.update(
-            self.table_name, 
-            artist_id, 
-            data,
-            primary_key_column="AUID"
-        )
+        try:
+            success = self.backend.update(
+                self.table_name, 
+                artist_id, 
+                data,
+                primary_key_column="AUID"
+            )
+        finally:
+            self._lookups.invalidate(self.table_name)
         
         if not success:
             logger.error(f"Failed to update artist {artist_id}")
@@ -140,6 +147,8 @@ class ArtistService:
         except Exception as e:
             logger.error(f"Merge failed: {e}")
             return False
+        finally:
+            self._lookups.invalidate(self.table_name)
 
     def get_all_with_counts(self, limit: int = 2000, query_filter: str = None) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,92 @@
+"""
+Audit Cache - Keeps the latest audit results on disk between requests.
+Lets the report and export pages read results produced by another worker process.
+"""
+
+import atexit
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Open caches, closed once at exit. Held weakly so a dropped cache isn't
+# pinned by atexit.
+_instances: "weakref.WeakSet[AuditCache]" = weakref.WeakSet()
+
+
+def _close_all():
+    for cache in list(_instances):
+        cache.close()
+
+
+atexit.register(_close_all)
+
+
+class AuditCache:
+    """
+    Dict-style store for audit results, backed by a SQLite file.
+
+    Each key maps to one pickled value (the full audit results, or the list
+    of untracked files). Entries older than ttl seconds are dropped when the
+    file is first opened, so a stale audit isn't shown days later.
+    """
+
+    def __init__(self, db_path: str, ttl: float = 24 * 60 * 60):
+        self.db_path = db_path
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        # Flask serves requests from several threads
+        self._lock = threading.RLock()
+        _instances.add(self)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS audit_cache ("
+                "key TEXT PRIMARY KEY, value BLOB, created REAL)"
+            )
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM audit_cache WHERE created < ?", (time.time() - self.ttl,)
+                )
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the stored value for key, or default if missing or expired."""
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    "SELECT value FROM audit_cache WHERE key = ? AND created >= ?",
+                    (key, time.time() - self.ttl)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Failed to read audit cache entry {key}: {e}")
+            return default
+        if row is None:
+            return default
+        return pickle.loads(row[0])
+
+    def __setitem__(self, key: str, value: Any):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO audit_cache (key, value, created) VALUES (?, ?, ?)",
+                    (key, data, time.time())
+                )
+        except Exception as e:
+            logger.error(f"Failed to store audit cache entry {key}: {e}")
@@ -71,12 +71,12 @@ class AuditService:
             "missing": []
         }
         
-        for song in songs:
+        # Stat all files up front; the batch overlaps per-file I/O latency
+        songs = [song for song in songs if song.filename]
+        file_infos = self.media.get_file_info_batch([song.filename for song in songs])
+
+        for song, file_info in zip(songs, file_infos):
             db_path = song.filename
-            if not db_path:
-                continue
-                
-            file_info = self.media.get_file_info(db_path)
             
             if file_info['exists']:
                 results['found'] += 1
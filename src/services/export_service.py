@@ -1,9 +1,10 @@
 import csv
 import json
 import io
+import itertools
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,19 @@ class ExportService:
         """
         Export list of Records to CSV string.
         """
-        if not records:
-            return ""
+        return "".join(self.iter_csv(records, include_resolved=include_resolved))
+
+    def iter_csv(self, records: Iterable[Any], include_resolved: bool = True) -> Iterator[str]:
+        """
+        Export Records to CSV, yielding the header and then one chunk per row.
+
+        Nothing is yielded for no records. Only one row is buffered at a
+        time, so the result can be streamed straight into a response.
+        """
+        records = iter(records)
+        first = next(records, None)
+        if first is None:
+            return
 
         output = io.StringIO()
         
@@ -34,14 +46,21 @@ class ExportService:
         writer = csv.DictWriter(output, fieldnames=field_names, extrasaction='ignore')
         writer.writeheader()
 
+        def take():
+            # The buffer is reused for every row
+            chunk = output.getvalue()
+            output.seek(0)
+            output.truncate()
+            return chunk
+
         # Prepare lookup maps if resolving
         genre_map = self.song_service.genre_map if include_resolved else {}
         decade_map = self.song_service.decade_map if include_resolved else {}
         tempo_map = self.song_service.tempo_map if include_resolved else {}
 
-        for record in records:
-            row = record.to_dict(use_display_names=True)
-            
+        yield take()
+
+        for record in itertools.chain((first,), records):
             # Add alias-mapped basics
             entry = {
                 'id': record.primary_key,
@@ -66,8 +85,7 @@ class ExportService:
                 entry['tempo'] = record.tempo
 
             writer.writerow(entry)
-
-        return output.getvalue()
+            yield take()
 
     def to_json(self, records: List[Any], include_resolved: bool = True) -> str:
         """
@@ -11,7 +11,7 @@ Coordinates between:
 import logging
 import os
 from os import path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import List, Dict, Any, Optional, Callable
 
 from src.core.config import app_config
@@ -28,7 +28,7 @@ logger = logging.getLogger(__name__)
 # Jazler Defaults Configuration
 # ─────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JazlerDefaults:
     """Default values for new Jazler song records."""
     fldEnabled: bool = True
@@ -52,6 +52,14 @@ class JazlerDefaults:
     DEFAULT_GENRE_ID: int = 18        # "za obradu"
 
 
+@dataclass(slots=True)
+class ExistingRecord:
+    """Cached snDatabase row used for artist+title conflict detection."""
+    auid: int
+    path: str
+    raw: Dict[str, Any]               # Row as fetched, normalized on demand
+
+
 # ─────────────────────────────────────────────────────────────
 # Import Service Class
 # ─────────────────────────────────────────────────────────────
@@ -84,6 +92,14 @@ class ImportService:
     TABLE_NAME = "snDatabase"
     PK_COLUMN = "AUID"
 
+    # Templates for files that fail analysis (copied per error, never mutated)
+    _ERROR_META_TEMPLATE = ParsedMetadata(artist="Error", title="", confidence=0.0)
+    _ERROR_TEMPLATE = ImportCandidate(
+        file_path="",
+        metadata=_ERROR_META_TEMPLATE,
+        status=ImportStatus.NEW
+    )
+
     def __init__(
         self,
         backend,  # AccessBackend
@@ -112,7 +128,7 @@ class ImportService:
         self._genre_name_to_id: Optional[Dict[str, int]] = None
         self._decade_name_to_id: Optional[Dict[str, int]] = None
         self._existing_paths: Optional[set] = None
-        self._existing_artist_titles: Optional[Dict[str, Dict]] = None
+        self._existing_artist_titles: Optional[Dict[str, ExistingRecord]] = None
 
     # ─────────────────────────────────────────────────────────────
     # Preview Mode (Dry Run)
@@ -147,22 +163,23 @@ class ImportService:
                 candidates.append(candidate)
             except Exception as e:
                 logger.error(f"Failed to analyze {path}: {e}")
-                # Create error candidate
-                candidates.append(ImportCandidate(
-                    file_path=path,
-                    metadata=ParsedMetadata(
-                        artist="Error",
-                        title=str(e),
-                        confidence=0.0
-                    ),
-                    status=ImportStatus.NEW
-                ))
+                candidates.append(self._make_error_candidate(path, e))
 
             if progress_callback:
                 progress_callback(idx + 1, total)
 
         return candidates
 
+    def _make_error_candidate(self, path: str, err: Exception) -> ImportCandidate:
+        """Build a placeholder candidate for a file that could not be analyzed."""
+        return replace(
+            self._ERROR_TEMPLATE,
+            file_path=path,
+            metadata=replace(self._ERROR_META_TEMPLATE, title=str(err)),
+            # genre_ids is a list - give each candidate its own copy
+            genre_ids=list(self._ERROR_TEMPLATE.genre_ids)
+        )
+
     def _load_existing_data(self) -> None:
         """Load/cache data needed for duplicate detection."""
         if self._existing_paths is None:
@@ -192,32 +209,11 @@ class ImportService:
                     artist = self.parser.normalize_for_comparison(row.get('fldArtistName') or '')
                     title = self.parser.normalize_for_comparison(row.get('fldTitle') or '')
                     key = f"{artist}|||{title}"
-                    self._existing_artist_titles[key] = {
-                        'id': row['AUID'],
-                        'path': row['fldFilename'],
-                        # Full record data for comparison
-                        'full_record': {
-                            'artist': row.get('fldArtistName') or '',
-                            'title': row.get('fldTitle') or '',
-                            'album': row.get('fldAlbum') or '',
-                            'year': row.get('fldYear') or 0,
-                            'duration': row.get('fldDuration') or 0.0,
-                            'composer': row.get('fldComposer') or '',
-                            'publisher': row.get('fldLabel') or '',
-                            'isrc': row.get('fldCDKey') or '',
-                            'genre_ids': [
-                                row.get('fldCat1a') or 0,
-                                row.get('fldCat1b') or 0,
-                                row.get('fldCat1c') or 0,
-                            ],
-                            'decade_id': row.get('fldCat2') or 0,
-                            'tempo_id': row.get('fldCat3') or 0,
-                            'enabled': row.get('fldEnabled'),
-                            'enabled_auto': row.get('fldEnabledAuto'),
-                            'priority': row.get('fldPriority') or 0,
-                            'path': row.get('fldFilename') or '',
-                        }
-                    }
+                    self._existing_artist_titles[key] = ExistingRecord(
+                        auid=row['AUID'],
+                        path=row['fldFilename'],
+                        raw=row
+                    )
             except Exception as e:
                 logger.error(f"Failed to load existing artist+titles: {e}")
                 self._existing_artist_titles = {}
@@ -262,8 +258,8 @@ class ImportService:
         if key in self._existing_artist_titles:
             existing = self._existing_artist_titles[key]
             candidate.status = ImportStatus.CONFLICT
-            candidate.existing_song_id = existing['id']
-            candidate.existing_path = existing['path']
+            candidate.existing_song_id = existing.auid
+            candidate.existing_path = existing.path
             
             # Fetch FULL existing record for deep comparison
             try:
@@ -311,34 +307,14 @@ class ImportService:
                         }
                 
                 # Normalize raw record to "pretty" format expected by frontend
-                normalized_existing = {
-                    'artist': full_existing.get('fldArtistName') or '',
-                    'title': full_existing.get('fldTitle') or '',
-                    'album': full_existing.get('fldAlbum') or '',
-                    'year': full_existing.get('fldYear') or 0,
-                    'duration': full_existing.get('fldDuration') or 0.0,
-                    'composer': full_existing.get('fldComposer') or '',
-                    'publisher': full_existing.get('fldLabel') or '',
-                    'isrc': full_existing.get('fldCDKey') or '',
-                    'genre_ids': [
-                        full_existing.get('fldCat1a') or 0,
-                        full_existing.get('fldCat1b') or 0,
-                        full_existing.get('fldCat1c') or 0,
-                    ],
-                    'decade_id': full_existing.get('fldCat2') or 0,
-                    'tempo_id': full_existing.get('fldCat3') or 0,
-                    'enabled': full_existing.get('fldEnabled'),
-                    'enabled_auto': full_existing.get('fldEnabledAuto'),
-                    'priority': full_existing.get('fldPriority') or 0,
-                    'path': full_existing.get('fldFilename') or '',
-                    '_diff': diff
-                }
+                normalized_existing = self._normalize_existing(full_existing)
+                normalized_existing['_diff'] = diff
                 
                 candidate.existing_data = normalized_existing
                 
             except Exception as e:
                 logger.error(f"Failed to fetch comparison record: {e}")
-                candidate.existing_data = existing.get('full_record')
+                candidate.existing_data = self._normalize_existing(existing.raw)
 
             return candidate
 
@@ -350,6 +326,31 @@ class ImportService:
 
         return candidate
 
+    @staticmethod
+    def _normalize_existing(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a raw snDatabase row to the comparison format used by the frontend."""
+        return {
+            'artist': row.get('fldArtistName') or '',
+            'title': row.get('fldTitle') or '',
+            'album': row.get('fldAlbum') or '',
+            'year': row.get('fldYear') or 0,
+            'duration': row.get('fldDuration') or 0.0,
+            'composer': row.get('fldComposer') or '',
+            'publisher': row.get('fldLabel') or '',
+            'isrc': row.get('fldCDKey') or '',
+            'genre_ids': [
+                row.get('fldCat1a') or 0,
+                row.get('fldCat1b') or 0,
+                row.get('fldCat1c') or 0,
+            ],
+            'decade_id': row.get('fldCat2') or 0,
+            'tempo_id': row.get('fldCat3') or 0,
+            'enabled': row.get('fldEnabled'),
+            'enabled_auto': row.get('fldEnabledAuto'),
+            'priority': row.get('fldPriority') or 0,
+            'path': row.get('fldFilename') or '',
+        }
+
     def _resolve_artist(self, candidate: ImportCandidate) -> None:
         """Look up or mark artist for creation."""
         artist_name = candidate.metadata.artist
@@ -517,6 +518,11 @@ class ImportService:
                          final_filename = server_prefix + final_filename[len(local_prefix):]
                          break
 
+        # Hoist defaults to locals once (read for every candidate in a batch)
+        d = self.defaults
+        genre_ids = candidate.genre_ids
+        n_genres = len(genre_ids)
+
         # Build record data
         data = {
             # Core fields
@@ -532,28 +538,28 @@ class ImportService:
             'fldCDKey': meta.isrc,
 
             # Category fields
-            'fldCat1a': candidate.genre_ids[0] if len(candidate.genre_ids) > 0 else 0,
-            'fldCat1b': candidate.genre_ids[1] if len(candidate.genre_ids) > 1 else 0,
-            'fldCat1c': candidate.genre_ids[2] if len(candidate.genre_ids) > 2 else 0,
+            'fldCat1a': genre_ids[0] if n_genres > 0 else 0,
+            'fldCat1b': genre_ids[1] if n_genres > 1 else 0,
+            'fldCat1c': genre_ids[2] if n_genres > 2 else 0,
             'fldCat2': candidate.decade_id,
-            'fldCat3': self.defaults.fldCat3,
+            'fldCat3': d.fldCat3,
 
             # Jazler defaults
-            'fldEnabled': self.defaults.fldEnabled,
-            'fldEnabledAuto': self.defaults.fldEnabledAuto,
-            'fldVocalPresent': self.defaults.fldVocalPresent,
-            'fldPriority': self.defaults.fldPriority,
-            'fldIntroPos': self.defaults.fldIntroPos,
-            'fldMixPos': self.defaults.fldMixPos,
-            'fldFadeDur': self.defaults.fldFadeDur,
-            'fldFadePos': self.defaults.fldFadePos,
-            'fldStartPos': self.defaults.fldStartPos,
-            'fldFadeInDur': self.defaults.fldFadeInDur,
-            'fldVolume': self.defaults.fldVolume,
-            'fldBroadcasts': self.defaults.fldBroadcasts,
-            'fldVoteCount': self.defaults.fldVoteCount,
-            'fldNoRDS': self.defaults.fldNoRDS,
-            'fldDoNotAutoAlter': self.defaults.fldDoNotAutoAlter,
+            'fldEnabled': d.fldEnabled,
+            'fldEnabledAuto': d.fldEnabledAuto,
+            'fldVocalPresent': d.fldVocalPresent,
+            'fldPriority': d.fldPriority,
+            'fldIntroPos': d.fldIntroPos,
+            'fldMixPos': d.fldMixPos,
+            'fldFadeDur': d.fldFadeDur,
+            'fldFadePos': d.fldFadePos,
+            'fldStartPos': d.fldStartPos,
+            'fldFadeInDur': d.fldFadeInDur,
+            'fldVolume': d.fldVolume,
+            'fldBroadcasts': d.fldBroadcasts,
+            'fldVoteCount': d.fldVoteCount,
+            'fldNoRDS': d.fldNoRDS,
+            'fldDoNotAutoAlter': d.fldDoNotAutoAlter,
         }
         return data
 
@@ -4,9 +4,13 @@ Handles simple lookups (Genre, Decade) AND complex entities (Artist).
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from src.backends.base import Backend
 from src.core.schema.registry import SchemaRegistry
+from src.core.schema.definition import TableDefinition
 from src.core.models.record import Record
 
 logger = logging.getLogger(__name__)
@@ -15,51 +19,196 @@ class LookupService:
     """
     Generic service for lookup table operations.
     Supports reading, searching, creating, and merging entries.
+
+    Reads are cached in memory for CACHE_TTL seconds. Writes made through
+    this service invalidate the cache for the affected table. The cache
+    holds plain rows; every read returns new Records, so callers may edit
+    them freely.
     """
+
+    # Seconds a cached read stays valid (lookup tables change rarely)
+    CACHE_TTL = 30.0
+    # Max single-entry reads kept before the least recently used is evicted
+    BY_ID_CACHE_SIZE = 1024
+    # Max distinct search queries kept (LRU)
+    SEARCH_CACHE_SIZE = 256
+    # Characters with special meaning in a LIKE pattern
+    _LIKE_WILDCARDS = frozenset('%_[*?#')
     
     def __init__(self, backend: Backend, registry: SchemaRegistry):
         self.backend = backend
         self.registry = registry
 
+        # (table_name, sort_field) -> (timestamp, sorted rows)
+        self._all_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[Dict[str, Any]]]] = {}
+        # (table_name, pk_value) -> (timestamp, row)
+        self._by_id_cache: "OrderedDict[Tuple[str, Any], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # (table_name, field, lowercase query) -> (timestamp, rows)
+        self._search_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # table_name -> primary key column
+        self._pk_cache: Dict[str, str] = {}
+
     def _get_table_def(self, table_name: str):
         return self.registry.get_table(table_name)
 
+    def _pk(self, table_name: str) -> str:
+        """Primary key column for a table (defaults to AUID), resolved once per table."""
+        pk = self._pk_cache.get(table_name)
+        if pk is None:
+            table_def = self._get_table_def(table_name)
+            pk = table_def.primary_key if table_def else "AUID"
+            self._pk_cache[table_name] = pk
+        return pk
+
+    def _is_fresh(self, timestamp: float) -> bool:
+        return time.monotonic() - timestamp < self.CACHE_TTL
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """Drop cached reads for one table, or for all tables if None."""
+        with self._cache_lock:
+            caches = (self._all_cache, self._by_id_cache, self._search_cache)
+            if table_name is None:
+                for cache in caches:
+                    cache.clear()
+                return
+            for cache in caches:
+                for key in [k for k in cache if k[0] == table_name]:
+                    del cache[key]
+
     def get_all(self, table_name: str, sort_field: str = None) -> List[Record]:
         """Get all entries from a lookup table."""
+        key = (table_name, sort_field)
+        table_def = self._get_table_def(table_name)
+        with self._cache_lock:
+            cached = self._all_cache.get(key)
+        if cached and self._is_fresh(cached[0]):
+            return [Record(row, table_def) for row in cached[1]]
+
+        # Fetch without the lock so a slow table doesn't block other lookups
         try:
-            rows = self.backend.fetch(table_name, limit=10000)
-            records = [Record(row, self._get_table_def(table_name)) for row in rows]
+            # Let the database order real columns so TOP keeps the right rows
+            order_by = sort_field if table_def and table_def.get_column(sort_field) else None
+            rows = self.backend.fetch(table_name, order_by=order_by, limit=10000)
+            records = [Record(row, table_def) for row in rows]
             
             if sort_field:
-                records.sort(key=lambda x: str(x.get(sort_field, '')).lower())
-            
-            return records
+                # Materialize sort keys once instead of per comparison
+                keys = [str(r.get(sort_field, '')).lower() for r in records]
+                order = sorted(range(len(records)), key=keys.__getitem__)
+                records = [records[i] for i in order]
+                rows = [rows[i] for i in order]
         except Exception as e:
             logger.error(f"Failed to fetch lookups for {table_name}: {e}")
             return []
 
+        with self._cache_lock:
+            self._all_cache[key] = (time.monotonic(), rows)
+        return records
+
+    def get_all_raw(self, table_name: str) -> Tuple[Optional[TableDefinition], List[Dict[str, Any]]]:
+        """
+        Get all entries as plain row dicts, without wrapping each in a Record.
+
+        For callers that only index a couple of columns (e.g. id -> name).
+        Returns (table_def, rows).
+        """
+        table_def = self._get_table_def(table_name)
+        try:
+            return table_def, self.backend.fetch(table_name, limit=10000)
+        except Exception as e:
+            logger.error(f"Failed to fetch lookups for {table_name}: {e}")
+            return table_def, []
+
     def get_by_id(self, table_name: str, pk_value: int) -> Optional[Record]:
         """Get a single lookup entry."""
         if not pk_value: return None
-        
-        table_def = self._get_table_def(table_name)
-        pk_col = table_def.primary_key if table_def else "AUID"
+
+        key = (table_name, pk_value)
+        with self._cache_lock:
+            cached = self._by_id_cache.get(key)
+            if cached and self._is_fresh(cached[0]):
+                self._by_id_cache.move_to_end(key)
+                return Record(cached[1], self._get_table_def(table_name))
         
         row = self.backend.fetch_one(
             table_name, 
             pk_value, 
-            primary_key_column=pk_col
+            primary_key_column=self._pk(table_name)
         )
-        return Record(row, table_def) if row else None
+        if not row:
+            return None
 
-    def search(self, table_name: str, field: str, query: str) -> List[Record]:
-        """Search for lookup entries."""
-        try:
-            rows = self.backend.search(table_name, field, query, "contains")
-            return [Record(row, self._get_table_def(table_name)) for row in rows]
-        except Exception as e:
-            logger.error(f"Search failed for {table_name}: {e}")
-            return []
+        record = Record(row, self._get_table_def(table_name))
+        with self._cache_lock:
+            self._by_id_cache[key] = (time.monotonic(), row)
+            self._by_id_cache.move_to_end(key)
+            if len(self._by_id_cache) > self.BY_ID_CACHE_SIZE:
+                self._by_id_cache.popitem(last=False)
+        return record
+
+    def _cached_search_rows(self, table_name: str, field: str, query: str) -> Optional[Tuple[float, List[Dict[str, Any]]]]:
+        """
+        (timestamp, rows) for a "contains" search served from the cache, or None.
+
+        Besides exact hits, a cached result for a shorter query contained in
+        this one (e.g. "beat" while typing "beatles") is a superset of the
+        answer and is filtered in Python instead of querying the backend.
+        Must be called with _cache_lock held.
+        """
+        key = (table_name, field, query)
+        cached = self._search_cache.get(key)
+        if cached and self._is_fresh(cached[0]):
+            self._search_cache.move_to_end(key)
+            return cached
+
+        if self._LIKE_WILDCARDS.intersection(query):
+            return None
+        for (t, f, q), (timestamp, rows) in reversed(self._search_cache.items()):
+            if t != table_name or f != field or q not in query or not self._is_fresh(timestamp):
+                continue
+            if not rows:
+                return timestamp, []
+            col = next((c for c in rows[0] if c.lower() == field.lower()), None)
+            if col is None:
+                return None
+            # Keep the superset's timestamp so derived entries expire with it
+            return timestamp, [r for r in rows if query in str(r.get(col) or '').lower()]
+        return None
+
+    def search(self, table_name: str, field: str, query: str, raise_errors: bool = False) -> List[Record]:
+        """
+        Search for lookup entries.
+
+        Backend failures are logged and return [], unless raise_errors is
+        set, in which case they are logged and re-raised.
+        """
+        # Access LIKE is case-insensitive, so lowercase queries share entries
+        key = (table_name, field, (query or '').lower())
+        with self._cache_lock:
+            entry = self._cached_search_rows(*key)
+
+        if entry is None:
+            try:
+                entry = (time.monotonic(), self.backend.search(table_name, field, query, "contains"))
+            except Exception as e:
+                logger.error(f"Search failed for {table_name}: {e}")
+                if raise_errors:
+                    raise
+                return []
+
+        with self._cache_lock:
+            current = self._search_cache.get(key)
+            # Replace expired entries too, or they would never be served again
+            if current is None or not self._is_fresh(current[0]):
+                self._search_cache[key] = entry
+                self._search_cache.move_to_end(key)
+                if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+        rows = entry[1]
+
+        table_def = self._get_table_def(table_name)
+        return [Record(row, table_def) for row in rows]
 
     def create(self, table_name: str, data: Dict[str, Any]) -> Optional[int]:
         """
@@ -70,7 +219,9 @@ class LookupService:
             # Backend insert not yet fully unified, assuming Access backend 'insert' method exists
             # or extending backend interface. For now, we need to check backend capabilities.
             if hasattr(self.backend, 'insert'):
-                 return self.backend.insert(table_name, data)
+                 new_id = self.backend.insert(table_name, data)
+                 self.invalidate(table_name)
+                 return new_id
             else:
                 logger.error("Backend does not support INSERT yet")
                 return None
@@ -80,9 +231,10 @@ class LookupService:
 
     def update(self, table_name: str, pk_value: int, data: Dict[str, Any]) -> bool:
         """Update a lookup entry."""
-        table_def = self._get_table_def(table_name)
-        pk_col = table_def.primary_key if table_def else "AUID"
-        return self.backend.update(table_name, pk_value, data, primary_key_column=pk_col)
+        try:
+            return self.backend.update(table_name, pk_value, data, primary_key_column=self._pk(table_name))
+        finally:
+            self.invalidate(table_name)
 
     def delete(self, table_name: str, pk_value: int) -> bool:
         """
@@ -90,10 +242,10 @@ class LookupService:
         WARNING: Does not check for orphans (songs still using this ID).
         Client must verify usage before calling.
         """
-        table_def = self._get_table_def(table_name)
-        pk_col = table_def.primary_key if table_def else "AUID"
-        
         # We need a delete method on backend
         if hasattr(self.backend, 'delete'):
-            return self.backend.delete(table_name, pk_value, primary_key_column=pk_col)
+            try:
+                return self.backend.delete(table_name, pk_value, primary_key_column=self._pk(table_name))
+            finally:
+                self.invalidate(table_name)
         return False
@@ -9,18 +9,54 @@ Includes:
 """
 
 import os
+import time
 import logging
+import concurrent.futures
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, List, Tuple, Iterable, Iterator
 from src.services.vfs_service import VfsService
 from src.services.snapshot_service import SnapshotService
+from src.utils.fs_walk import iter_mp3_entries
 
 logger = logging.getLogger(__name__)
 
+
+def _build_prefix_index(pairs) -> Tuple[Dict[str, str], List[int]]:
+    """
+    Index (prefix, replacement) pairs by lowercased prefix.
+
+    Returns the lookup dict and the distinct prefix lengths, longest first,
+    so a match needs one slice + dict lookup per length instead of a
+    lower()/startswith() per mapping. The first pair wins on duplicates.
+    """
+    index: Dict[str, str] = {}
+    for prefix, replacement in pairs:
+        if prefix:
+            index.setdefault(prefix.lower(), replacement)
+    lengths = sorted({len(k) for k in index}, reverse=True)
+    return index, lengths
+
+
+def _match_prefix(path: str, index: Dict[str, str], lengths: List[int]) -> Optional[Tuple[int, str]]:
+    """Return (prefix_length, replacement) for the longest matching prefix."""
+    for n in lengths:
+        replacement = index.get(path[:n].lower())
+        if replacement is not None:
+            return n, replacement
+    return None
+
+
 class MediaService:
     """
     Service for file and media operations.
     """
+
+    # Characters Windows forbids in filenames, each mapped to '_'
+    _SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+    # Seconds a directory stays marked missing before it is stat'ed again
+    MISSING_DIR_TTL = 60.0
+    # Upper bound on remembered missing dirs; the whole set is dropped when full
+    MISSING_DIR_LIMIT = 1024
     
     def __init__(self, drive_map: Optional[Dict[str, str]] = None, 
                  base_path: Optional[str] = None, 
@@ -36,9 +72,17 @@ class MediaService:
             snapshot_service: Optional SnapshotService for offline metadata
         """
         self.drive_map = {k.lower(): v for k, v in (drive_map or {}).items()}
+        # Precomputed prefix indexes: remote -> local and local -> remote
+        self._drive_index, self._drive_lengths = _build_prefix_index(self.drive_map.items())
+        self._reverse_index, self._reverse_lengths = _build_prefix_index(
+            (local, remote) for remote, local in self.drive_map.items()
+        )
+        self._has_drive_map = bool(self._drive_index)
         self.base_path = base_path
         self.vfs = vfs_service
         self.snapshot = snapshot_service
+        # Parent dirs recently found missing (dir -> monotonic time)
+        self._known_missing_dirs: Dict[str, float] = {}
     
     def resolve_path(self, db_path: str) -> str:
         """
@@ -49,33 +93,65 @@ class MediaService:
         """
         if not db_path:
             return ""
+        if not self._has_drive_map:
+            return db_path
         
-        resolved = db_path
-        
-        # Apply drive mapping if present
-        for remote_drive, local_drive in self.drive_map.items():
-            if db_path.lower().startswith(remote_drive):
-                resolved = local_drive + db_path[len(remote_drive):]
-                break
+        # Apply drive mapping if present (longest matching drive wins)
+        match = _match_prefix(db_path, self._drive_index, self._drive_lengths)
+        if match:
+            n, local_drive = match
+            return local_drive + db_path[n:]
                 
-        return resolved
+        return db_path
+
+    def _stat(self, path: str) -> Optional[os.stat_result]:
+        """
+        Stat a path, returning None if it does not exist.
+
+        Files inside a directory that was recently found missing are
+        reported missing without touching the filesystem (e.g. a whole
+        unmapped network drive).
+        """
+        if not path:
+            return None
+        parent = os.path.dirname(path)
+        missing_since = self._known_missing_dirs.get(parent)
+        if missing_since is not None:
+            if time.monotonic() - missing_since < self.MISSING_DIR_TTL:
+                return None
+            # Batch lookups run on worker threads; another may have expired it
+            self._known_missing_dirs.pop(parent, None)
+        try:
+            return os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            if parent and not os.path.isdir(parent):
+                if len(self._known_missing_dirs) >= self.MISSING_DIR_LIMIT:
+                    self._known_missing_dirs.clear()
+                self._known_missing_dirs[parent] = time.monotonic()
+            return None
+        except (OSError, ValueError):
+            return None
 
     def exists(self, path: str) -> bool:
         """Check if a file exists on the local filesystem."""
-        if not path:
-            return False
-        return os.path.exists(path)
+        return self._stat(path) is not None
 
     def get_file_info(self, db_path: str) -> dict:
         """
         Get info about a file (resolved path, existence, size, VFS status).
         """
         resolved = self.resolve_path(db_path)
-        exists = self.exists(resolved)
+        extension = os.path.splitext(resolved)[1].lower()
+        # Single stat gives both existence and size
+        stats = self._stat(resolved)
+        exists = stats is not None
         vfs_status = 'live' if exists else 'missing'
         
+        # Without a drive remap both names are the same path; check it once
+        candidates = (db_path,) if resolved == db_path else (db_path, resolved)
+
         if not exists and self.vfs:
-            if self.vfs.exists(db_path) or self.vfs.exists(resolved):
+            if any(self.vfs.exists(p) for p in candidates):
                 vfs_status = 'virtual'
         
         info = {
@@ -90,28 +166,35 @@ class MediaService:
         
         # Prefer physical metadata if exists, otherwise fallback to snapshot
         if exists:
-            try:
-                stats = os.stat(resolved)
-                info["size_bytes"] = stats.st_size
-                info["extension"] = os.path.splitext(resolved)[1].lower()
-                # We could read ID3 here, but usually it's read selectively in the route
-            except Exception as e:
-                logger.warning(f"Could not get file stats for {resolved}: {e}")
+            info["size_bytes"] = stats.st_size
+            info["extension"] = extension
+            # We could read ID3 here, but usually it's read selectively in the route
         elif vfs_status == 'virtual' and self.snapshot:
             # Try to get cached info
-            cached = self.snapshot.get_metadata(db_path) or self.snapshot.get_metadata(resolved)
+            cached = None
+            for p in candidates:
+                cached = self.snapshot.get_metadata(p)
+                if cached:
+                    break
             if cached:
                 info["metadata"] = cached
-                info["extension"] = os.path.splitext(resolved)[1].lower()
+                info["extension"] = extension
         
         return info
+
+    def get_file_info_batch(self, db_paths: Iterable[str], max_workers: int = 16) -> List[dict]:
+        """
+        get_file_info for many paths, in input order.
+
+        Stat calls release the GIL, so a thread pool overlaps the disk/SMB
+        latency of each lookup.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_file_info, db_paths))
                 
     def sanitize_filename(self, filename: str) -> str:
         """Remove invalid characters from filenames."""
-        invalid = '<>:"/\\|?*'
-        for char in invalid:
-            filename = filename.replace(char, '_')
-        return filename.strip()
+        return filename.translate(self._SANITIZE_TABLE).strip()
 
     def rename_file(self, db_path: str, new_name_basis: str) -> Optional[str]:
         """
@@ -148,32 +231,27 @@ class MediaService:
             # Convert back to database-relative path
             # We reverse the drive mapping
             new_db_path = str(new_local_path)
-            for remote_drive, local_drive in self.drive_map.items():
-                if new_db_path.lower().startswith(local_drive.lower()):
-                    new_db_path = remote_drive + new_db_path[len(local_drive):]
-                    break
+            match = self._has_drive_map and _match_prefix(new_db_path, self._reverse_index, self._reverse_lengths)
+            if match:
+                n, remote_drive = match
+                new_db_path = remote_drive + new_db_path[n:]
             
             return new_db_path
         except Exception as e:
             logger.error(f"Rename failed: {e}")
             return None
 
-    def scan_files(self) -> list[str]:
+    def scan_files(self) -> Iterator[str]:
         """
         Recursively scan base_path for MP3 files.
-        Returns list of absolute paths.
+        Yields absolute paths as they are found (wrap in list() if needed).
         """
-        files = []
         if not self.base_path or not os.path.exists(self.base_path):
             logger.warning(f"Cannot scan: Base path not found: {self.base_path}")
-            return []
+            return
             
         try:
-            for root, _, filenames in os.walk(self.base_path):
-                for f in filenames:
-                    if f.lower().endswith('.mp3'):
-                        files.append(os.path.join(root, f))
+            for entry in iter_mp3_entries(self.base_path):
+                yield entry.path
         except Exception as e:
             logger.error(f"Scan failed: {e}")
-            
-        return files
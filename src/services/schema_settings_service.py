@@ -1,22 +1,55 @@
+import atexit
+import hashlib
 import json
 import os
 import logging
-from typing import Dict, List, Set
+import threading
+import weakref
+from typing import Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# Live instances, flushed once at exit. Held weakly so instances dropped by
+# reset_services can be collected instead of pinned by atexit.
+_instances: "weakref.WeakSet[SchemaSettingsService]" = weakref.WeakSet()
+
+
+def _flush_all():
+    for settings in list(_instances):
+        settings.flush()
+
+
+atexit.register(_flush_all)
+
+
 class SchemaSettingsService:
     """
     Manages persistence for schema browsing preferences,
     such as hidden tables and hidden fields.
+
+    Toggles schedule a debounced save, so a burst of clicks results in a
+    single write. Call flush() to write pending changes immediately.
     """
+
+    # Seconds to wait for further toggles before writing
+    SAVE_DELAY = 0.5
+    # Shared result for tables with no hidden fields
+    _EMPTY: frozenset = frozenset()
     
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.hidden_tables: Set[str] = set()
         self.hidden_fields: Dict[str, Set[str]] = {} # table_name -> set(field_names)
         self.show_hidden = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        self._last_saved_hash: Optional[str] = None
+        # Read-only snapshots used by the is_*_hidden hot path
+        self._hidden_tables_frozen: frozenset = self._EMPTY
+        self._hidden_fields_frozen: Dict[str, frozenset] = {}
         self.load()
+        # Don't lose a pending debounced save on shutdown
+        _instances.add(self)
 
     def load(self):
         """Load settings from JSON file."""
@@ -32,23 +65,63 @@ class SchemaSettingsService:
                 self.hidden_fields = {k: set(v) for k, v in hf.items()}
                 
                 self.show_hidden = data.get('show_hidden', False)
+            self._refresh_lookup()
             logger.info(f"Loaded schema settings from {self.config_path}")
         except Exception as e:
             logger.error(f"Failed to load schema settings: {e}")
 
     def save(self):
-        """Save settings to JSON file."""
-        try:
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            data = {
-                'hidden_tables': list(self.hidden_tables),
-                'hidden_fields': {k: list(v) for k, v in self.hidden_fields.items()},
-                'show_hidden': self.show_hidden
-            }
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            logger.error(f"Failed to save schema settings: {e}")
+        """Save settings to JSON file (skipped if nothing changed since the last save)."""
+        with self._save_lock:
+            try:
+                data = {
+                    'hidden_tables': sorted(self.hidden_tables),
+                    'hidden_fields': {k: sorted(v) for k, v in self.hidden_fields.items()},
+                    'show_hidden': self.show_hidden
+                }
+                payload = json.dumps(data, indent=4)
+                digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+                if digest == self._last_saved_hash:
+                    return
+
+                os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+                # Write to a temp file and swap it in so readers never see a partial file
+                tmp_path = self.config_path + '.tmp'
+                with open(tmp_path, 'w') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.config_path)
+                self._last_saved_hash = digest
+            except Exception as e:
+                logger.error(f"Failed to save schema settings: {e}")
+
+    def _refresh_lookup(self):
+        """Rebuild the frozen views read by is_table_hidden/is_field_hidden."""
+        self._hidden_tables_frozen = frozenset(self.hidden_tables)
+        self._hidden_fields_frozen = {k: frozenset(v) for k, v in self.hidden_fields.items()}
+
+    def _schedule_save(self):
+        """(Re)arm the debounce timer; the save runs SAVE_DELAY after the last toggle."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._run_scheduled_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _run_scheduled_save(self):
+        with self._save_lock:
+            # A newer toggle may already have re-armed the timer
+            if self._save_timer is threading.current_thread():
+                self._save_timer = None
+        self.save()
+
+    def flush(self):
+        """Write any pending debounced save now."""
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+            self.save()
 
     def toggle_table_visibility(self, table_name: str):
         """Toggle whether a table is hidden."""
@@ -56,10 +129,11 @@ class SchemaSettingsService:
             self.hidden_tables.remove(table_name)
         else:
             self.hidden_tables.add(table_name)
-        self.save()
+        self._refresh_lookup()
+        self._schedule_save()
 
     def is_table_hidden(self, table_name: str) -> bool:
-        return table_name in self.hidden_tables
+        return table_name in self._hidden_tables_frozen
 
     def toggle_field_visibility(self, table_name: str, field_name: str):
         """Toggle whether a field in a table is hidden."""
@@ -70,12 +144,13 @@ class SchemaSettingsService:
             self.hidden_fields[table_name].remove(field_name)
         else:
             self.hidden_fields[table_name].add(field_name)
-        self.save()
+        self._refresh_lookup()
+        self._schedule_save()
 
     def is_field_hidden(self, table_name: str, field_name: str) -> bool:
-        return field_name in self.hidden_fields.get(table_name, set())
+        return field_name in self._hidden_fields_frozen.get(table_name, self._EMPTY)
 
     def toggle_show_hidden(self):
         """Toggle global view of hidden items."""
         self.show_hidden = not self.show_hidden
-        self.save()
+        self._schedule_save()
@@ -1,112 +1,327 @@
 """
 Snapshot Service - Handles indexing of ID3 tags for offline use.
-Uses ThreadPoolExecutor for high-speed parallel scanning.
+Uses ProcessPoolExecutor so tag parsing scales across CPU cores.
 """
 
 import os
-import json
 import logging
+import sqlite3
+import threading
+import functools
 import concurrent.futures
+from collections.abc import MutableMapping
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from mutagen.easyid3 import EasyID3
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 from mutagen.mp3 import MP3
+from src.utils.id3_tags import ID3Tags
+from src.utils.fs_walk import iter_mp3_entries
+from src.utils import json_codec
 
 logger = logging.getLogger(__name__)
 
+# Files handed to each worker process per round trip
+SCAN_CHUNK_SIZE = 64
+# Parsed entries written to the store per transaction
+WRITE_BATCH_SIZE = 1000
+# Threads used to prefetch file stats before parsing
+STAT_WORKERS = 32
+
+
+def _normalize_path(path: str) -> str:
+    """Canonical snapshot key: normalized separators and case-folded."""
+    return os.path.normcase(os.path.normpath(path)).casefold()
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_path_key(path: str) -> str:
+    """Memoized _normalize_path for lookups; hot paths repeat across requests."""
+    return _normalize_path(path)
+
+
+def _safe_stat(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """DirEntry.stat() that returns None instead of raising."""
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+# Snapshot key -> ID3 text frame read as plain text
+_TEXT_FRAMES = (
+    ('artist', ID3Tags.ARTIST),
+    ('title', ID3Tags.TITLE),
+    ('album', ID3Tags.ALBUM),
+    ('year', ID3Tags.YEAR),
+)
+
+
+def read_file_metadata(filepath: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads ID3 tags and tech info from a single file.
+
+    Module-level so it can be pickled into worker processes. Frames are
+    read straight from the ID3 dict rather than through EasyID3's per-key
+    dispatch.
+    """
+    try:
+        audio = MP3(filepath)
+        tags = audio.tags or {}
+
+        metadata = {}
+        for key, frame_id in _TEXT_FRAMES:
+            frame = tags.get(frame_id)
+            metadata[key] = str(frame.text[0]) if frame is not None and frame.text else None
+
+        # TCON.genres resolves numeric ID3v1 references like "(17)"
+        genre = tags.get(ID3Tags.GENRE)
+        metadata['genre'] = genre.genres[0] if genre is not None and genre.genres else None
+
+        info = audio.info
+        metadata['duration'] = info.length
+        metadata['bitrate'] = info.bitrate // 1000
+        metadata['sample_rate'] = info.sample_rate
+        return metadata
+    except Exception:
+        # Silently skip files we can't read
+        return None
+
+
+class SnapshotStore(MutableMapping):
+    """
+    SQLite-backed mapping of normalized path -> metadata dict.
+
+    Entries live on disk instead of as nested dicts in RAM, so lookups stay
+    O(1) and memory stays flat regardless of library size. Writes are
+    buffered in the open transaction until commit().
+    """
+
+    COLUMNS = ('artist', 'title', 'album', 'year', 'genre', 'duration', 'bitrate', 'sample_rate')
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        # Flask serves requests from several threads
+        self._lock = threading.RLock()
+        cols = ', '.join(self.COLUMNS)
+        marks = ', '.join('?' * (len(self.COLUMNS) + 3))
+        self._select_sql = f"SELECT size, mtime, {cols} FROM meta WHERE path = ?"
+        self._upsert_sql = f"INSERT OR REPLACE INTO meta (path, size, mtime, {cols}) VALUES ({marks})"
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, "
+                "artist TEXT, title TEXT, album TEXT, year TEXT, genre TEXT, "
+                "duration REAL, bitrate INTEGER, sample_rate INTEGER)"
+            )
+        return self._conn
+
+    def _to_row(self, path: str, metadata: Dict[str, Any]) -> Tuple:
+        size, mtime = metadata.get('_stat') or (None, None)
+        return (path, size, mtime) + tuple(metadata.get(c) for c in self.COLUMNS)
+
+    def _from_row(self, row: Tuple) -> Dict[str, Any]:
+        metadata = dict(zip(self.COLUMNS, row[2:]))
+        if row[0] is not None:
+            metadata['_stat'] = [row[0], row[1]]
+        return metadata
+
+    def __getitem__(self, path: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self.conn.execute(self._select_sql, (path,)).fetchone()
+        if row is None:
+            raise KeyError(path)
+        return self._from_row(row)
+
+    def __setitem__(self, path: str, metadata: Dict[str, Any]):
+        self.update_many([(path, metadata)])
+
+    def __delitem__(self, path: str):
+        with self._lock:
+            cur = self.conn.execute("DELETE FROM meta WHERE path = ?", (path,))
+        if cur.rowcount == 0:
+            raise KeyError(path)
+
+    def __contains__(self, path) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM meta WHERE path = ?", (path,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            paths = [r[0] for r in self.conn.execute("SELECT path FROM meta")]
+        return iter(paths)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM meta").fetchone()[0]
+
+    def update_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Insert or replace several entries with one executemany."""
+        with self._lock:
+            self.conn.executemany(self._upsert_sql, (self._to_row(p, m) for p, m in items))
+
+    def delete_many(self, paths: Iterable[str]):
+        """Delete several entries with one executemany."""
+        with self._lock:
+            self.conn.executemany("DELETE FROM meta WHERE path = ?", ((p,) for p in paths))
+
+    @property
+    def version(self) -> int:
+        """Number of committed saves (PRAGMA user_version)."""
+        with self._lock:
+            return self.conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def commit(self):
+        """Commit pending writes and bump the version in the same transaction."""
+        with self._lock:
+            if self.conn.in_transaction:
+                version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+                self.conn.execute(f"PRAGMA user_version = {int(version) + 1}")
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+
+
 class SnapshotService:
     """
     Service to generate and manage metadata snapshots of the music library.
+
+    Entries are kept in a SQLite file next to cache_path (cache_path + '.db').
+    A legacy JSON snapshot at cache_path is imported on first load.
     """
     
     def __init__(self, cache_path: str):
         self.cache_path = cache_path
-        self.metadata_cache: Dict[str, Dict[str, Any]] = {}
+        self.metadata_cache = SnapshotStore(cache_path + '.db')
 
     def load_cache(self) -> bool:
-        """Loads the metadata cache from disk."""
-        if os.path.exists(self.cache_path):
-            try:
-                with open(self.cache_path, 'r', encoding='utf-8') as f:
-                    self.metadata_cache = json.load(f)
-                logger.info(f"Loaded {len(self.metadata_cache)} entries from snapshot cache.")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to load snapshot cache: {e}")
+        """Opens the metadata store, importing a legacy JSON snapshot if the store is empty."""
+        try:
+            count = len(self.metadata_cache)
+            if count == 0 and os.path.exists(self.cache_path):
+                legacy = json_codec.load_file(self.cache_path)
+                self.metadata_cache.update_many((_normalize_path(k), v) for k, v in legacy.items())
+                self.metadata_cache.commit()
+                count = len(legacy)
+                logger.info(f"Imported {count} entries from JSON snapshot {self.cache_path}.")
+            logger.info(f"Loaded {count} entries from snapshot cache (version {self.metadata_cache.version}).")
+            return count > 0
+        except Exception as e:
+            logger.error(f"Failed to load snapshot cache: {e}")
         return False
 
     def save_cache(self):
-        """Saves current metadata cache to disk."""
+        """Commits pending metadata writes to disk."""
         try:
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata_cache, f, indent=2)
-            logger.info(f"Saved snapshot cache to {self.cache_path}")
+            self.metadata_cache.commit()
+            logger.info(f"Saved snapshot cache to {self.metadata_cache.db_path}")
         except Exception as e:
             logger.error(f"Failed to save snapshot cache: {e}")
 
     def _read_file_metadata(self, filepath: str) -> Optional[Dict[str, Any]]:
         """Reads ID3 tags and tech info from a single file."""
-        try:
-            audio = MP3(filepath, ID3=EasyID3)
-            
-            def get_tag(key):
-                val = audio.get(key)
-                return val[0] if val else None
-
-            return {
-                'artist': get_tag('artist'),
-                'title': get_tag('title'),
-                'album': get_tag('album'),
-                'year': get_tag('date'),
-                'genre': get_tag('genre'),
-                'duration': audio.info.length,
-                'bitrate': audio.info.bitrate // 1000,
-                'sample_rate': audio.info.sample_rate
-            }
-        except Exception:
-            # Silently skip files we can't read
-            return None
-
-    def generate_snapshot(self, folder_paths: List[str], max_workers: int = 20):
+        return read_file_metadata(filepath)
+
+    @staticmethod
+    def _fingerprint(stats: os.stat_result) -> List[int]:
+        """(size, mtime_ns) pair used to detect changed files. List so it round-trips through JSON."""
+        return [stats.st_size, stats.st_mtime_ns]
+
+    def generate_snapshot(self, folder_paths: List[str], max_workers: Optional[int] = None,
+                          incremental: bool = True):
         """
         Scans folders and builds a metadata snapshot in parallel.
         
         Args:
             folder_paths: List of local folder paths to scan
-            max_workers: Number of parallel threads
+            max_workers: Number of worker processes (defaults to CPU count)
+            incremental: Reuse cached entries whose size and mtime are unchanged
         """
-        all_files = []
+        if incremental:
+            self.load_cache()
+
+        # Walk once; only files whose fingerprint changed need to be parsed again
+        entries = []
+        scanned_roots = []
         for folder in folder_paths:
             path = Path(folder)
-            if path.exists():
-                logger.info(f"Indexing files in {folder}...")
-                all_files.extend([str(f) for f in path.rglob('*.mp3')])
+            if not path.exists():
+                continue
+            logger.info(f"Indexing files in {folder}...")
+            scanned_roots.append(os.path.join(_normalize_path(str(path)), ''))
+            entries.extend(iter_mp3_entries(str(path)))
 
-        total_files = len(all_files)
-        logger.info(f"Found {total_files} MP3s. Starting parallel metadata scan...")
+        # Prefetch stats on an I/O thread pool; stat releases the GIL, so
+        # per-file latency on network shares overlaps
+        with concurrent.futures.ThreadPoolExecutor(max_workers=STAT_WORKERS) as io_pool:
+            stats = list(io_pool.map(_safe_stat, entries, chunksize=SCAN_CHUNK_SIZE))
+
+        to_scan = []
+        fingerprints = {}
+        seen = set()
+        for entry, stats_result in zip(entries, stats):
+            key = _normalize_path(entry.path)
+            seen.add(key)
+            # Unreadable or empty files have nothing to parse
+            if stats_result is None or stats_result.st_size == 0:
+                continue
+            fingerprint = self._fingerprint(stats_result)
+            cached = self.metadata_cache.get(key)
+            if incremental and cached and cached.get('_stat') == fingerprint:
+                continue
+            fingerprints[key] = fingerprint
+            to_scan.append(entry.path)
+
+        # Drop entries for files that disappeared from the scanned folders
+        # (unreachable folders are left alone)
+        if incremental and scanned_roots:
+            roots = tuple(scanned_roots)
+            stale = [k for k in self.metadata_cache if k.startswith(roots) and k not in seen]
+            self.metadata_cache.delete_many(stale)
+
+        total_files = len(to_scan)
+        logger.info(f"Found {len(entries)} MP3s, {total_files} new or changed. Starting parallel metadata scan...")
 
         results_count = 0
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Map paths to futures
-            future_to_path = {executor.submit(self._read_file_metadata, p): p for p in all_files}
-            
-            for future in concurrent.futures.as_completed(future_to_path):
-                path = future_to_path[future]
-                try:
-                    metadata = future.result()
+        batch = []
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                # Results stream back in input order, chunked to amortize IPC
+                results = executor.map(read_file_metadata, to_scan, chunksize=SCAN_CHUNK_SIZE)
+                
+                for path, metadata in zip(to_scan, results):
                     if metadata:
-                        # Store by lowercase path for easy lookup
-                        self.metadata_cache[path.lower()] = metadata
+                        # Keys are normalized once here so lookups need no extra work
+                        key = _normalize_path(path)
+                        metadata['_stat'] = fingerprints[key]
+                        batch.append((key, metadata))
                         results_count += 1
+
+                        if len(batch) >= WRITE_BATCH_SIZE:
+                            self.metadata_cache.update_many(batch)
+                            batch.clear()
                         
                         if results_count % 1000 == 0:
                             logger.info(f"Scanned {results_count}/{total_files} files...")
-                except Exception as e:
-                    logger.error(f"Error scanning {path}: {e}")
+        except Exception as e:
+            logger.error(f"Parallel scan aborted after {results_count} files: {e}")
+        finally:
+            if batch:
+                self.metadata_cache.update_many(batch)
 
         logger.info(f"Finished. Snapshot contains {len(self.metadata_cache)} files.")
         self.save_cache()
 
     def get_metadata(self, path: str) -> Optional[Dict[str, Any]]:
         """Lookup metadata for a specific path in the cache."""
-        return self.metadata_cache.get(path.lower())
+        return self.metadata_cache.get(normalize_path_key(path))
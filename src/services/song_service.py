@@ -9,7 +9,9 @@ Provides high-level operations for:
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple
 from src.backends.base import Backend
 from src.core.schema.registry import SchemaRegistry
 from src.core.models.record import Record, RecordSet
@@ -38,6 +40,18 @@ class SongService:
     # Default table name for songs
     DEFAULT_TABLE = "snDatabase"
     DEFAULT_PK = "AUID"
+    # Max IDs bound into a single IN (...) clause
+    IN_CLAUSE_CHUNK = 500
+    # Fields compared by get_bulk_summary, and its marker for differing values
+    BULK_SUMMARY_FIELDS = ('genre', 'decade', 'tempo', 'album', 'publisher', 'year')
+    MIXED = "__mixed__"
+    # Max grid views / form layouts whose column lists are cached
+    SCHEMA_CACHE_SIZE = 16
+    # Distinct (genre x3, decade, tempo) combinations memoized for display
+    DISPLAY_CACHE_SIZE = 4096
+    # TOP n values used in search SQL. Access can't bind TOP as a parameter, so
+    # limits round up to one of these to keep the set of query texts small
+    LIMIT_CAPS = (100, 500, 1000, 5000)
     
     def __init__(self, backend: Backend, registry: SchemaRegistry):
         """
@@ -56,6 +70,34 @@ class SongService:
         self._genre_map: Optional[Dict[int, str]] = None
         self._decade_map: Optional[Dict[int, str]] = None
         self._tempo_map: Optional[Dict[int, str]] = None
+        # LOOKUP_TABLES index -> (source map, ((id, lowercased name), ...))
+        self._lowered_lookups: Dict[int, Tuple[Dict[int, str], Tuple[Tuple[int, str], ...]]] = {}
+        self._reset_display_cache()
+        
+        # Schema-derived lists (schema is fixed for the service's lifetime)
+        self._searchable_fields: Optional[List[tuple[str, str]]] = None
+        self._grid_columns: Dict[str, List[Any]] = {}
+        self._form_fields: Dict[str, List[Any]] = {}
+        
+        # Field name resolver indexes (see _resolve_field_name)
+        self._columns_by_name: Dict[str, Any] = {}
+        self._columns_by_display: Dict[str, str] = {}
+        self._columns_by_simple: Dict[str, str] = {}
+        # Column name -> "[name]" for SQL building
+        self._bracketed: Dict[str, str] = {}
+        # (columns, ID count) -> "[a] IN (?,..) OR [b] IN (?,..)" for inline lookup filters
+        self._inline_in_snippets: Dict[Tuple[Tuple[str, ...], int], str] = {}
+        if self._schema:
+            for col in self._schema.columns:
+                self._bracketed[col.name] = f"[{col.name}]"
+                # setdefault keeps the first match, as the old linear scans did
+                self._columns_by_name.setdefault(col.name, col)
+                if col.display_name:
+                    self._columns_by_display.setdefault(col.display_name.lower(), col.name)
+                simple = col.name.lower()
+                if simple.startswith('fld'):
+                    simple = simple[3:]
+                self._columns_by_simple.setdefault(simple, col.name)
     
     # ─────────────────────────────────────────────────────────────
     # Lookup Maps
@@ -70,28 +112,61 @@ class SongService:
             logger.warning(f"Could not load lookup table '{table}': {e}")
             return {}
     
+    # (table, key column, value column) per lookup, in _ensure_lookups order
+    LOOKUP_TABLES = (
+        ("snCat1", "AUID", "fldMusicType"),   # genre
+        ("snCat2", "AUID", "fldMusicType"),   # decade
+        ("snCat3", "AUID", "fldMusicType"),   # tempo
+    )
+
+    def _load_all_lookups(self) -> List[Dict[int, str]]:
+        """
+        Load all lookup tables in one UNION ALL round trip.
+        
+        Returns one dict per LOOKUP_TABLES entry. Falls back to a query per
+        table if the combined query fails.
+        """
+        parts = [
+            f"SELECT {i} AS src, [{key}] AS k, [{value}] AS v FROM [{table}]"
+            for i, (table, key, value) in enumerate(self.LOOKUP_TABLES)
+        ]
+        try:
+            rows = self.backend.fetch_sql(" UNION ALL ".join(parts))
+        except Exception as e:
+            logger.warning(f"Combined lookup load failed, loading tables separately: {e}")
+            return [self._load_lookup_map(*spec) for spec in self.LOOKUP_TABLES]
+
+        maps: List[Dict[int, str]] = [{} for _ in self.LOOKUP_TABLES]
+        for row in rows:
+            if row['k'] is not None:
+                maps[int(row['src'])][int(row['k'])] = row['v']
+        return maps
+
+    def _ensure_lookups(self) -> None:
+        """Load genre/decade/tempo maps together on first access."""
+        if self._genre_map is None or self._decade_map is None or self._tempo_map is None:
+            genre, decade, tempo = self._load_all_lookups()
+            # Handle null/zero IDs
+            genre[0] = decade[0] = tempo[0] = ""
+            self._genre_map, self._decade_map, self._tempo_map = genre, decade, tempo
+            self._reset_display_cache()
+    
     @property
     def genre_map(self) -> Dict[int, str]:
         """Get genre ID -> name mapping."""
-        if self._genre_map is None:
-            self._genre_map = self._load_lookup_map("snCat1", "AUID", "fldMusicType")
-            self._genre_map[0] = ""  # Handle null/zero genre
+        self._ensure_lookups()
         return self._genre_map
     
     @property
     def decade_map(self) -> Dict[int, str]:
         """Get decade ID -> name mapping."""
-        if self._decade_map is None:
-            self._decade_map = self._load_lookup_map("snCat2", "AUID", "fldMusicType")
-            self._decade_map[0] = ""
+        self._ensure_lookups()
         return self._decade_map
     
     @property
     def tempo_map(self) -> Dict[int, str]:
         """Get tempo ID -> name mapping."""
-        if self._tempo_map is None:
-            self._tempo_map = self._load_lookup_map("snCat3", "AUID", "fldMusicType")
-            self._tempo_map[0] = ""
+        self._ensure_lookups()
         return self._tempo_map
     
     def resolve_genre(self, genre_id: int) -> str:
@@ -133,32 +208,82 @@ class SongService:
             return self._row_to_record(row)
         return None
 
-    def get_all(self, limit: int = 200000) -> RecordSet:
+    def get_many(self, song_ids: Iterable[int]) -> RecordSet:
+        """
+        Get several songs by AUID using chunked IN (...) queries.
+        
+        Args:
+            song_ids: AUIDs to fetch
+            
+        Returns:
+            RecordSet in the order of song_ids (missing IDs are skipped)
+        """
+        ids = list(dict.fromkeys(song_ids))
+        rows_by_id = {}
+        it = iter(ids)
+        while True:
+            chunk = list(islice(it, self.IN_CLAUSE_CHUNK))
+            if not chunk:
+                break
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT * FROM [{self._table}] WHERE [{self.DEFAULT_PK}] IN ({placeholders})"
+            for row in self.backend.fetch_sql(query, tuple(chunk)):
+                rows_by_id[row.get(self.DEFAULT_PK)] = row
+        
+        return RecordSet([self._row_to_record(rows_by_id[sid]) for sid in ids if sid in rows_by_id])
+
+    def get_all(self, limit: int = 200000, columns: Optional[List[str]] = None) -> RecordSet:
         """
         Get all songs.
         
         Args:
             limit: Maximum number of songs to retrieve (default: 200,000)
+            columns: Only fetch these columns (plus the primary key); None = all
             
         Returns:
             RecordSet of all songs
         """
-        rows = self.backend.fetch(self._table, limit=limit)
+        rows = self.backend.fetch(
+            self._table,
+            columns=self._projection(columns),
+            limit=limit
+        )
         records = [self._row_to_record(row) for row in rows]
         return RecordSet(records)
 
-    def get_all_paths(self) -> List[str]:
-        """Get list of all filenames in DB."""
-        # Use a large limit to ensure we get all paths. 
-        # Access backend defaults to 100 if not specified.
-        rows = self.backend.fetch(self._table, columns=['fldFilename'], limit=200000)
-        return [row['fldFilename'] for row in rows if row.get('fldFilename')]
+    def iter_all(self, columns: Optional[List[str]] = None) -> Iterator[Record]:
+        """
+        Yield every song as a Record, streamed from the backend in batches.
+        
+        Unlike get_all() the full song list is never held in memory, so
+        large exports can be written out as rows arrive.
+        """
+        for row in self.backend.iter_rows(self._table, columns=self._projection(columns)):
+            yield self._row_to_record(row)
+
+    def get_all_paths(self) -> Iterator[str]:
+        """
+        Yield every non-empty filename in the DB.
+        
+        Streams the single column through the backend instead of building
+        a dict per row; callers that need it twice should wrap it in a set/list.
+        """
+        for path in self.backend.iter_column(self._table, 'fldFilename'):
+            if path:
+                yield path
 
     def get_searchable_fields(self) -> List[tuple[str, str]]:
         """
         Get list of (key, label) for search dropdowns based on Config/Schema.
         """
+        if self._searchable_fields is None:
+            self._searchable_fields = self._build_searchable_fields()
+        return self._searchable_fields
+
+    def _build_searchable_fields(self) -> List[tuple[str, str]]:
         fields = []
+        if not self._schema:
+            return fields
         # Create reverse alias map for friendly URLs
         reverse_aliases = {}
         if self._schema and self._schema.aliases:
@@ -181,6 +306,15 @@ class SongService:
         Get list of column definitions for a named grid view.
         Returns list of objects (col.name, col.label, col.type, etc.)
         """
+        columns = self._grid_columns.get(view_name)
+        if columns is None:
+            columns = self._build_grid_columns(view_name)
+            # View names come from the query string; don't let them grow the cache
+            if len(self._grid_columns) < self.SCHEMA_CACHE_SIZE:
+                self._grid_columns[view_name] = columns
+        return columns
+
+    def _build_grid_columns(self, view_name: str) -> List[Any]:
         col_names = self.registry.get_grid_view(view_name)
         columns = []
         
@@ -196,6 +330,14 @@ class SongService:
         Get list of field definitions for a named form layout.
         Returns list of objects (col.name, col.label, col.type, etc.)
         """
+        fields = self._form_fields.get(layout_name)
+        if fields is None:
+            fields = self._build_form_fields(layout_name)
+            if len(self._form_fields) < self.SCHEMA_CACHE_SIZE:
+                self._form_fields[layout_name] = fields
+        return fields
+
+    def _build_form_fields(self, layout_name: str) -> List[Any]:
         layout = self.registry.overrides.get('form_layouts', {}).get(layout_name, ['*'])
         
         fields = []
@@ -222,16 +364,23 @@ class SongService:
         """Legacy search wrapper."""
         return self.search_advanced([{'field': field, 'value': value, 'match': match_type}], limit)
 
-    def search_advanced(self, criteria_list: List[Dict[str, str]], limit: int = 1000) -> RecordSet:
+    def search_advanced(
+        self,
+        criteria_list: List[Dict[str, str]],
+        limit: int = 1000,
+        columns: Optional[List[str]] = None
+    ) -> RecordSet:
         """
         Multi-criteria search with AND logic.
         
         Args:
             criteria_list: List of dicts with 'field', 'value', 'match'
             limit: Max results
+            columns: Only fetch these columns (plus the primary key), e.g. the
+                grid view's columns; None = all
         """
         if not criteria_list:
-            return self.get_all(limit)
+            return self.get_all(limit, columns)
             
         sql_parts = []
         params = []
@@ -258,84 +407,150 @@ class SongService:
                 params.extend(p)
                 
         if not sql_parts:
-            return self.get_all(limit)
+            return self.get_all(limit, columns)
             
         where_clause = " AND ".join(sql_parts)
-        query = f"SELECT TOP {limit} * FROM [{self._table}] WHERE {where_clause}"
+        top = self._limit_cap(limit)
+        projection = self._projection(columns)
+        select_list = ", ".join(map(self._bracket, projection)) if projection else "*"
+        query = f"SELECT TOP {top} {select_list} FROM [{self._table}] WHERE {where_clause}"
         
         rows = self.backend.fetch_sql(query, tuple(params))
+        if top > limit:
+            rows = rows[:limit]
         records = [self._row_to_record(row) for row in rows]
         return RecordSet(records)
 
+    def _projection(self, columns: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        Column list for a narrowed SELECT: the primary key first, then the
+        requested columns (deduplicated, unknown names dropped when a schema
+        is available). None means SELECT *.
+        """
+        if not columns:
+            return None
+        pk = self._schema.primary_key if self._schema and self._schema.primary_key else self.DEFAULT_PK
+        projection = [pk]
+        for name in columns:
+            if name in projection:
+                continue
+            if self._schema and name not in self._columns_by_name:
+                continue
+            projection.append(name)
+        return projection
+
+    def _limit_cap(self, limit: int) -> int:
+        """Smallest LIMIT_CAPS entry >= limit (limit itself beyond the largest)."""
+        for cap in self.LIMIT_CAPS:
+            if limit <= cap:
+                return cap
+        return limit
+
+    # Song column -> index into LOOKUP_TABLES
+    LOOKUP_FIELDS = {'fldCat1a': 0, 'fldCat1b': 0, 'fldCat1c': 0, 'fldCat2': 1, 'fldCat3': 2}
+    # Up to this many matching IDs are inlined as IN (?, ...); more use a subquery
+    INLINE_ID_LIMIT = 50
+
+    def _loaded_lookup_map(self, index: int) -> Optional[Dict[int, str]]:
+        """The lookup map for a LOOKUP_TABLES index, only if already loaded."""
+        return (self._genre_map, self._decade_map, self._tempo_map)[index]
+
+    def _bracket(self, name: str) -> str:
+        """'[name]', prebuilt for schema columns."""
+        return self._bracketed.get(name) or f"[{name}]"
+
+    def _lowered_lookup(self, lookup_map: Dict[int, str], index: int) -> Tuple[Tuple[int, str], ...]:
+        """(id, lowercased name) pairs for a loaded map, rebuilt only when the map changes."""
+        cached = self._lowered_lookups.get(index)
+        if cached is None or cached[0] is not lookup_map:
+            pairs = tuple((id_val, name.lower()) for id_val, name in lookup_map.items() if name)
+            cached = self._lowered_lookups[index] = (lookup_map, pairs)
+        return cached[1]
+
     def _build_lookup_filter(self, field: str, value: str, match: str) -> tuple[Optional[str], List[Any]]:
         """Build SQL snippet for lookup fields."""
-        lookup_map = None
-        if field in ['fldCat1a', 'fldCat1b', 'fldCat1c']:
-            self.genre_map # ensure loaded
-            lookup_map = self._genre_map
-        elif field == 'fldCat2':
-            self.decade_map # ensure loaded
-            lookup_map = self._decade_map
-        elif field == 'fldCat3':
-            self.tempo_map # ensure loaded
-            lookup_map = self._tempo_map
-            
-        if not lookup_map or (not value and match != 'is_empty'):
+        index = self.LOOKUP_FIELDS.get(field)
+        if index is None or (not value and match != 'is_empty'):
             return None, []
             
         if match == 'is_empty':
              # For numeric IDs, empty is usually 0
-            return f"[{field}] = 0 OR [{field}] IS NULL", []
+            col = self._bracket(field)
+            return f"{col} = 0 OR {col} IS NULL", []
 
-        # Find matching IDs
-        matching_ids = []
-        search_val_lower = value.lower()
-        
-        for id_val, name in lookup_map.items():
-            if not name: continue
-            name_lower = name.lower()
-            is_match = False
-            
-            if match == 'equals': is_match = (name_lower == search_val_lower)
-            elif match == 'starts_with': is_match = name_lower.startswith(search_val_lower)
-            elif match == 'contains': is_match = (search_val_lower in name_lower)
-                
-            if is_match: matching_ids.append(id_val)
-        
-        if not matching_ids:
-            return "1=0", [] # Force no match
-            
-        ids_str = ",".join(str(i) for i in matching_ids)
-        
         # Special logic for Genre: search all 3 columns if looking for "Rock"
-        if field == 'fldCat1a':
-             return f"fldCat1a IN ({ids_str}) OR fldCat1b IN ({ids_str}) OR fldCat1c IN ({ids_str})", []
-             
-        return f"[{field}] IN ({ids_str})", []
+        columns = ('fldCat1a', 'fldCat1b', 'fldCat1c') if field == 'fldCat1a' else (field,)
+
+        if match == 'equals':
+            op, pattern = "=", value
+        elif match == 'starts_with':
+            op, pattern = "LIKE", f"{value}%"
+        elif match == 'ends_with':
+            op, pattern = "LIKE", f"%{value}"
+        else: # contains
+            op, pattern = "LIKE", f"%{value}%"
+
+        # Small match sets from an already-loaded map are cheapest inline
+        lookup_map = self._loaded_lookup_map(index)
+        if lookup_map is not None:
+            search_val_lower = value.lower()
+            pairs = self._lowered_lookup(lookup_map, index)
+            # One comprehension per match type keeps the branch out of the scan
+            if match == 'equals':
+                matching_ids = [i for i, name in pairs if name == search_val_lower]
+            elif match == 'starts_with':
+                matching_ids = [i for i, name in pairs if name.startswith(search_val_lower)]
+            elif match == 'ends_with':
+                matching_ids = [i for i, name in pairs if name.endswith(search_val_lower)]
+            else:
+                matching_ids = [i for i, name in pairs if search_val_lower in name]
+
+            if not matching_ids:
+                return "1=0", [] # Force no match
+            if len(matching_ids) < self.INLINE_ID_LIMIT:
+                # Pad to a power of two (repeating the last ID) so the driver
+                # sees a handful of statement shapes instead of one per count
+                size = 1 << (len(matching_ids) - 1).bit_length()
+                matching_ids += matching_ids[-1:] * (min(size, self.INLINE_ID_LIMIT) - len(matching_ids))
+                key = (columns, len(matching_ids))
+                snippet = self._inline_in_snippets.get(key)
+                if snippet is None:
+                    placeholders = ",".join("?" * len(matching_ids))
+                    snippet = " OR ".join(f"{self._bracket(col)} IN ({placeholders})" for col in columns)
+                    # Bounded: few column sets x power-of-two sizes
+                    self._inline_in_snippets[key] = snippet
+                return snippet, matching_ids * len(columns)
+
+        # Let the database match names with its own collation
+        table, key_col, value_col = self.LOOKUP_TABLES[index]
+        subquery = f"SELECT [{key_col}] FROM [{table}] WHERE [{value_col}] {op} ?"
+        snippet = " OR ".join(f"{self._bracket(col)} IN ({subquery})" for col in columns)
+        return snippet, [pattern] * len(columns)
 
     def _build_standard_filter(self, field: str, value: str, match: str) -> tuple[str, List[Any]]:
         """Build standard Text/Numeric SQL filter."""
         # Determine column type if possible
         is_numeric = False
         if self._schema:
-            col = self._schema.get_column(field)
-            if col and col.type_name in ('INTEGER', 'LONG', 'SHORT', 'BYTE', 'CURRENCY', 'SINGLE', 'DOUBLE', 'NUMERIC'):
+            column = self._columns_by_name.get(field) or self._schema.get_column(field)
+            if column and column.type_name in ('INTEGER', 'LONG', 'SHORT', 'BYTE', 'CURRENCY', 'SINGLE', 'DOUBLE', 'NUMERIC'):
                 is_numeric = True
 
+        col = self._bracket(field)
         if match == 'is_empty':
             if is_numeric:
-                return f"[{field}] IS NULL OR [{field}] = 0", []
+                return f"{col} IS NULL OR {col} = 0", []
             else:
-                return f"[{field}] IS NULL OR [{field}] = ''", []
+                return f"{col} IS NULL OR {col} = ''", []
             
         if match == 'equals':
-            return f"[{field}] = ?", [value]
+            return f"{col} = ?", [value]
         elif match == 'starts_with':
-            return f"[{field}] LIKE ?", [f"{value}%"]
+            return f"{col} LIKE ?", [f"{value}%"]
         elif match == 'ends_with':
-             return f"[{field}] LIKE ?", [f"%{value}"]
+             return f"{col} LIKE ?", [f"%{value}"]
         else: # contains
-            return f"[{field}] LIKE ?", [f"%{value}%"]
+            return f"{col} LIKE ?", [f"%{value}%"]
     
     # FIELD_ALIASES removed - now handled by table schema
     
@@ -353,29 +568,24 @@ class SongService:
             return field
         
         # Check direct match (exact column name)
-        col = self._schema.get_column(field)
-        if col:
+        if field in self._columns_by_name:
             return field
         
         field_lower = field.lower()
         
         # Check display names first (case insensitive)
-        for col in self._schema.columns:
-            if col.display_name and col.display_name.lower() == field_lower:
-                return col.name
+        name = self._columns_by_display.get(field_lower)
+        if name:
+            return name
                 
         # Check aliases from schema
-        if self._schema and self._schema.aliases:
-            if field_lower in self._schema.aliases:
-                return self._schema.aliases[field_lower]
+        if self._schema.aliases and field_lower in self._schema.aliases:
+            return self._schema.aliases[field_lower]
         
         # Check simplified name (fldArtistName -> artistname)
-        for col in self._schema.columns:
-            simple = col.name.lower()
-            if simple.startswith('fld'):
-                simple = simple[3:]
-            if simple == field_lower:
-                return col.name
+        name = self._columns_by_simple.get(field_lower)
+        if name:
+            return name
         
         # Fallback to original (let the database error if invalid)
         return field
@@ -446,19 +656,22 @@ class SongService:
         Analyze a list of songs and find common field values.
         Returns a dict of fields: value (or "__mixed__" if different).
         """
-        songs = [self.get_by_id(sid) for sid in song_ids]
-        songs = [s for s in songs if s]
-        
-        if not songs:
+        return self.summarize_records(self.get_many(song_ids))
+
+    def summarize_records(self, songs: Iterable[Record]) -> Dict[str, Any]:
+        """
+        Common field values across already-loaded songs (see get_bulk_summary).
+        """
+        records = songs if isinstance(songs, RecordSet) else RecordSet(list(songs))
+        if not records:
             return {}
 
-        fields = ['genre', 'decade', 'tempo', 'album', 'publisher', 'year']
-        summary = {f: getattr(songs[0], f) for f in fields}
-        
-        for s in songs[1:]:
-            for f in fields:
-                if getattr(s, f) != summary[f]:
-                    summary[f] = "__mixed__"
+        summary = {}
+        for f in self.BULK_SUMMARY_FIELDS:
+            # Column-wise: one name resolution per field, equality counted in C
+            values = records.column(f)
+            first = values[0]
+            summary[f] = first if values.count(first) == len(values) else self.MIXED
         
         return summary
 
@@ -467,22 +680,33 @@ class SongService:
         Update multiple songs at once.
         Returns the number of successful updates.
         """
-        if not updates:
+        if not updates or not song_ids:
             return 0
             
-        count = 0
-        for sid in song_ids:
-            try:
-                if self.backend.update(self._table, sid, updates, primary_key_column=self.DEFAULT_PK):
-                    count += 1
-            except Exception as e:
-                logger.error(f"Bulk update failed for #{sid}: {e}")
-        return count
+        try:
+            return self.backend.update_many(self._table, list(song_ids), updates, primary_key_column=self.DEFAULT_PK)
+        except Exception as e:
+            logger.error(f"Bulk update failed for {len(song_ids)} songs: {e}")
+            return 0
     
     # ─────────────────────────────────────────────────────────────
     # Enriched Record Access
     # ─────────────────────────────────────────────────────────────
     
+    def _reset_display_cache(self) -> None:
+        """(Re)create the display memo; called whenever the lookup maps are (re)loaded."""
+        self._resolve_display = lru_cache(maxsize=self.DISPLAY_CACHE_SIZE)(self._build_display)
+
+    def _build_display(self, cat1a: int, cat1b: int, cat1c: int, cat2: int, cat3: int) -> Tuple[Tuple[str, ...], str, str, str]:
+        """Resolve one lookup combination to (genres, genre display, decade, tempo)."""
+        genres = []
+        for gid in (cat1a, cat1b, cat1c):
+            if gid:
+                name = self.resolve_genre(gid)
+                if name:
+                    genres.append(name)
+        return tuple(genres), ', '.join(genres), self.resolve_decade(cat2), self.resolve_tempo(cat3)
+
     def get_display_data(self, record: Record) -> Dict[str, Any]:
         """
         Get a record with resolved lookups for display.
@@ -492,29 +716,25 @@ class SongService:
         - Resolved genre/decade/tempo names
         - Computed display values
         """
+        # raw_data is already a copy, so it can be extended in place
         data = record.raw_data
+        self._ensure_lookups()
+        
+        # Grid rows repeat the same few lookup combinations; resolve each once
+        genres, genre_display, decade_display, tempo_display = self._resolve_display(
+            data.get('fldCat1a', 0) or 0,
+            data.get('fldCat1b', 0) or 0,
+            data.get('fldCat1c', 0) or 0,
+            data.get('fldCat2', 0) or 0,
+            data.get('fldCat3', 0) or 0,
+        )
         
-        # Resolve lookups
-        cat1a = data.get('fldCat1a', 0) or 0
-        cat1b = data.get('fldCat1b', 0) or 0
-        cat1c = data.get('fldCat1c', 0) or 0
-        
-        genres = []
-        for gid in [cat1a, cat1b, cat1c]:
-            if gid:
-                name = self.resolve_genre(gid)
-                if name:
-                    genres.append(name)
-        
-        cat2 = data.get('fldCat2', 0) or 0
-        cat3 = data.get('fldCat3', 0) or 0
-        
-        return {
-            **data,
-            'genres_resolved': genres,
-            'genre_display': ', '.join(genres),
-            'decade_display': self.resolve_decade(cat2),
-            'tempo_display': self.resolve_tempo(cat3),
+        data.update({
+            'genres_resolved': list(genres),
+            'genre_display': genre_display,
+            'decade_display': decade_display,
+            'tempo_display': tempo_display,
             # Pass raw duration for precision sync
             'duration_raw': data.get('fldDuration', 0.0)
-        }
+        })
+        return data
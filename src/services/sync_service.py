@@ -3,46 +3,116 @@ Sync Service - Manages offline change queuing and synchronization.
 Allows users to "save" changes locally when the database is unreachable or read-only.
 """
 
+import atexit
 import os
-import json
 import logging
 import datetime
+import sqlite3
+import threading
+import weakref
 from typing import Dict, Any, List, Optional
+from src.utils import json_codec
 
 logger = logging.getLogger(__name__)
 
+# Live instances, closed once at exit. Held weakly so instances dropped by
+# reset_services can be collected instead of pinned by atexit.
+_instances: "weakref.WeakSet[SyncService]" = weakref.WeakSet()
+
+
+def _close_all():
+    for sync in list(_instances):
+        sync.close()
+
+
+atexit.register(_close_all)
+
+
 class SyncService:
     """
     Handles queuing of database changes and their eventual application.
+
+    The queue lives in a SQLite file next to queue_path (queue_path + '.db'),
+    one row per queued song plus one row per (song, field). Every mutation is
+    a small indexed write instead of a rewrite of the whole queue. Nothing is
+    opened until first use; a legacy JSON queue at queue_path is imported
+    then. The pending count is kept in memory (this service is the queue's
+    only writer) so the per-page status badge doesn't query the file.
     """
-    
+
     def __init__(self, queue_path: str):
         self.queue_path = queue_path
-        self.pending_changes: Dict[str, Dict[str, Any]] = {}
-        self.load_queue()
+        self.db_path = queue_path + '.db'
+        self._conn: Optional[sqlite3.Connection] = None
+        self._count: Optional[int] = None
+        # Flask serves requests from several threads
+        self._lock = threading.RLock()
+        _instances.add(self)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS songs ("
+                "sid TEXT PRIMARY KEY, id, artist TEXT, title TEXT, timestamp TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fields ("
+                "sid TEXT, field TEXT, value TEXT, PRIMARY KEY (sid, field))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_songs_ts ON songs (timestamp)")
+            self.load_queue()
+        return self._conn
 
     def load_queue(self):
-        """Loads pending changes from disk."""
-        if os.path.exists(self.queue_path):
-            try:
-                with open(self.queue_path, 'r', encoding='utf-8') as f:
-                    self.pending_changes = json.load(f)
-                logger.info(f"Loaded {len(self.pending_changes)} pending changes.")
-            except Exception as e:
-                logger.error(f"Failed to load sync queue: {e}")
+        """Imports a legacy JSON queue if one is present (runs when the DB is first opened)."""
+        if not os.path.exists(self.queue_path):
+            return
+        try:
+            legacy = json_codec.load_file(self.queue_path)
+            with self._lock, self.conn:
+                for sid, item in legacy.items():
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO songs (sid, id, artist, title, timestamp) VALUES (?, ?, ?, ?, ?)",
+                        (sid, item.get('id', sid), item.get('artist'), item.get('title'), item.get('timestamp'))
+                    )
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO fields (sid, field, value) VALUES (?, ?, ?)",
+                        ((sid, k, json_codec.dumps(v)) for k, v in item.get('fields', {}).items())
+                    )
+            # Imported; don't merge it again on the next start
+            os.remove(self.queue_path)
+            self._count = None
+            logger.info(f"Imported {len(legacy)} pending changes from {self.queue_path}")
+        except Exception as e:
+            logger.error(f"Failed to load sync queue: {e}")
 
     def save_queue(self):
-        """Saves current pending changes to disk."""
+        """Commits any open transaction (mutations already commit themselves)."""
         try:
-            with open(self.queue_path, 'w', encoding='utf-8') as f:
-                json.dump(self.pending_changes, f, indent=2)
+            with self._lock:
+                self.conn.commit()
         except Exception as e:
             logger.error(f"Failed to save sync queue: {e}")
 
+    def flush(self):
+        """Kept for callers that flush before shutdown; see save_queue()."""
+        self.save_queue()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+
     def queue_change(self, song_id: int, artist: str, title: str, changes: Dict[str, Any]):
         """
         Adds or updates a change in the queue.
-        
+
         Args:
             song_id: Database ID of the song
             artist: Current artist (for display in sync list)
@@ -50,41 +120,75 @@ class SyncService:
             changes: Dict of field -> new_value
         """
         sid = str(song_id)
-        
-        if sid not in self.pending_changes:
-            self.pending_changes[sid] = {
-                'id': song_id,
-                'artist': artist,
-                'title': title,
-                'timestamp': datetime.datetime.now().isoformat(),
-                'fields': {}
-            }
-        
-        # Merge changes
-        self.pending_changes[sid]['fields'].update(changes)
-        self.pending_changes[sid]['timestamp'] = datetime.datetime.now().isoformat()
-        
-        self.save_queue()
+        now = datetime.datetime.now().isoformat()
+
+        try:
+            with self._lock, self.conn:
+                # Artist/title are captured when the song is first queued
+                added = self.conn.execute(
+                    "INSERT OR IGNORE INTO songs (sid, id, artist, title, timestamp) VALUES (?, ?, ?, ?, ?)",
+                    (sid, song_id, artist, title, now)
+                ).rowcount
+                self.conn.execute("UPDATE songs SET timestamp = ? WHERE sid = ?", (now, sid))
+                # Merge changes
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO fields (sid, field, value) VALUES (?, ?, ?)",
+                    ((sid, k, json_codec.dumps(v)) for k, v in changes.items())
+                )
+                if added and self._count is not None:
+                    self._count += 1
+        except Exception as e:
+            logger.error(f"Failed to queue changes for song #{song_id}: {e}")
+            self._count = None
+            return
         logger.info(f"Queued {len(changes)} changes for song #{song_id}")
 
     def get_pending(self) -> List[Dict[str, Any]]:
         """Returns a list of all pending changes for UI display."""
-        return sorted(self.pending_changes.values(), key=lambda x: x['timestamp'], reverse=True)
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT s.sid, s.id, s.artist, s.title, s.timestamp, f.field, f.value "
+                "FROM songs s LEFT JOIN fields f ON f.sid = s.sid "
+                "ORDER BY s.timestamp DESC, s.sid"
+            ).fetchall()
+
+        pending: Dict[str, Dict[str, Any]] = {}
+        for sid, song_id, artist, title, timestamp, field, value in rows:
+            item = pending.get(sid)
+            if item is None:
+                item = pending[sid] = {
+                    'id': song_id,
+                    'artist': artist,
+                    'title': title,
+                    'timestamp': timestamp,
+                    'fields': {}
+                }
+            if field is not None:
+                item['fields'][field] = json_codec.loads(value)
+        return list(pending.values())
 
     def remove_change(self, song_id: int):
         """Removes a change from the queue."""
         sid = str(song_id)
-        if sid in self.pending_changes:
-            del self.pending_changes[sid]
-            self.save_queue()
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM fields WHERE sid = ?", (sid,))
+            removed = self.conn.execute("DELETE FROM songs WHERE sid = ?", (sid,)).rowcount
+            if removed and self._count is not None:
+                self._count -= removed
 
     def clear(self):
         """Clears the entire queue."""
-        self.pending_changes = {}
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM fields")
+            self.conn.execute("DELETE FROM songs")
+            self._count = 0
         if os.path.exists(self.queue_path):
             os.remove(self.queue_path)
         logger.info("Sync queue cleared.")
 
     def count(self) -> int:
         """Returns the number of pending songs."""
-        return len(self.pending_changes)
+        with self._lock:
+            if self._count is None:
+                self._count = self.conn.execute("SELECT COUNT(*) FROM songs").fetchone()[0]
+            return self._count
@@ -3,72 +3,211 @@ VFS (Virtual File System) Service.
 Handles offline file visibility by parsing log files (e.g. log.txt).
 """
 
+import concurrent.futures
+import io
+import mmap
 import os
 import re
 import logging
-from typing import Set, Optional
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Logs larger than this are split into chunks and parsed in worker processes
+PARALLEL_THRESHOLD = 64 * 1024 * 1024
+# Target bytes per worker chunk (rounded up to the next line break)
+PARSE_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Matches: "    Directory: B:\songs" (ASCII classes: the prefix is always ASCII)
+_DIR_PATTERN = re.compile(r"^\s*Directory:\s*(.*)$", re.IGNORECASE | re.ASCII)
+# Matches: "-a----  29/10/2025  14:28  5483047  Filename.mp3"
+# We look for the attribute string at the start
+_FILE_PATTERN = re.compile(r"^[da-]{5,6}\s+", re.ASCII)
+# First characters an attribute string can start with
+_ATTR_HEADS = frozenset('da-')
+
+# Result of parsing a run of lines:
+# (names seen before the first header, dir key -> names, saw a header, key of the last header)
+ParseResult = Tuple[List[str], Dict[str, List[str]], bool, Optional[str]]
+
+
+def _normalize(path: str) -> str:
+    """Lowercase and use backslashes, so 'B:/Songs' and 'b:\\songs' compare equal."""
+    return path.lower().replace('/', '\\')
+
+
+def _split_path(path: str) -> Tuple[str, str]:
+    """Split a normalized path at the last separator, keeping it on the directory part."""
+    i = path.rfind('\\') + 1
+    return path[:i], path[i:]
+
+
+@lru_cache(maxsize=4096)
+def _path_key(path: str) -> Tuple[str, str]:
+    """Cached (directory, name) key for lookups; grids re-check the same paths."""
+    return _split_path(_normalize(path))
+
+
+def _dir_key(directory: str) -> str:
+    """Index key for a 'Directory:' header: normalized, with one trailing separator."""
+    return _normalize(directory).rstrip('\\') + '\\'
+
+
+def _parse_lines(lines: Iterable[str]) -> ParseResult:
+    """
+    Parse PowerShell 'dir' output into directory key -> lowercased names.
+
+    Table rows that appear before any "Directory:" header are returned
+    separately so a caller parsing a chunk can attribute them to the header
+    that ended the previous chunk.
+    """
+    pending: Dict[str, List[str]] = defaultdict(list)
+    orphans: List[str] = []
+    # Name list of the current "Directory:" block (orphans until the first header)
+    names: Optional[List[str]] = orphans
+    saw_header = False
+    last_key: Optional[str] = None
+
+    for line in lines:
+        line = line.rstrip()
+        if not line:
+            continue
+        head = line[0]
+        
+        # Check for directory header (indented, or starting with "Directory:")
+        if head in ' \tDd':
+            dir_match = _DIR_PATTERN.match(line)
+            if dir_match:
+                current_dir = dir_match.group(1).strip()
+                saw_header = True
+                # Resolve the block's directory key once, not per file
+                last_key = _dir_key(current_dir) if current_dir else None
+                names = pending[last_key] if last_key else None
+                continue
+            if head in ' \t':
+                line = line.lstrip()
+                head = line[0]
+        
+        # Check for file line (table format)
+        if head in _ATTR_HEADS and _FILE_PATTERN.match(line):
+            # The filename is at the end. Table layout is tricky but usually:
+            # Attributes, Date, Time, Length, Name
+            parts = line.split(maxsplit=4)
+            if len(parts) >= 5 and names is not None:
+                names.append(parts[4].lower())
+            continue
+
+        # Fallback: Assume it's a flat list of FullNames if no table structure found
+        if os.path.isabs(line) or line.startswith('\\\\'):
+             directory, name = _split_path(_normalize(line))
+             pending[directory].append(name)
+
+    return orphans, dict(pending), saw_header, last_key
+
+
+def _parse_log_chunk(log_path: str, encoding: str, start: int, end: int) -> ParseResult:
+    """Worker: decode and parse bytes [start, end) of a log file."""
+    with open(log_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding, errors='ignore')
+    return _parse_lines(text.split('\n'))
+
+
+def _chunk_bounds(f: BinaryIO, start: int, newline: bytes, unit: int) -> List[Tuple[int, int]]:
+    """Split [start, EOF) of an open file into ~PARSE_CHUNK_SIZE ranges ending just after a newline."""
+    bounds = []
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        while start < size:
+            pos = start + PARSE_CHUNK_SIZE
+            end = size
+            while pos < size:
+                hit = mm.find(newline, pos)
+                if hit == -1:
+                    break
+                # UTF-16 newlines must sit on a code unit boundary
+                if (hit - start) % unit == 0:
+                    end = hit + len(newline)
+                    break
+                pos = hit + 1
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
 class VfsService:
     """
     Virtual File System service that simulates file existence 
     based on a snapshot log file.
+
+    Paths are indexed as normalized directory -> sorted tuple of file names
+    (lowercase, backslash separators).
+    Each directory string is stored once and tuples carry no hash-table
+    slack, which keeps multi-million entry logs at a fraction of the memory
+    of a flat set of full paths.
     """
     
     def __init__(self, log_path: Optional[str] = None):
-        self.files: Set[str] = set()
+        self._dirs: Dict[str, Tuple[str, ...]] = {}
         self.is_active = False
         
         if log_path and os.path.exists(log_path):
             self.load_log(log_path)
 
-    def load_log(self, log_path: str) -> bool:
+    def load_log(self, log_path: str, max_workers: Optional[int] = None) -> bool:
         """
         Parses a PowerShell 'dir' style log file and builds a set of full paths.
         Supports both 'FullName' format and table format.
+
+        Logs over PARALLEL_THRESHOLD bytes are split on line boundaries and
+        parsed in a process pool; rows at the top of a chunk inherit the
+        last directory header of the chunk before it.
         """
         try:
-            current_dir = ""
+            # One open: sniff the BOM (PowerShell redirects are often UTF-16),
+            # then decode the same handle
+            results: Optional[List[ParseResult]] = None
+            with open(log_path, 'rb') as f:
+                bom = f.read(2)
+                encoding, start, newline, unit = 'utf-8', 0, b'\n', 1
+                if bom == b'\xff\xfe':
+                    encoding, start, newline, unit = 'utf-16-le', 2, b'\n\x00', 2
+                elif bom == b'\xfe\xff':
+                    encoding, start, newline, unit = 'utf-16-be', 2, b'\x00\n', 2
+
+                if os.fstat(f.fileno()).st_size <= PARALLEL_THRESHOLD:
+                    f.seek(start)
+                    with io.TextIOWrapper(f, encoding=encoding, errors='ignore', newline=None) as text:
+                        results = [_parse_lines(text)]
+                else:
+                    bounds = _chunk_bounds(f, start, newline, unit)
+
+            if results is None:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                    results = list(executor.map(
+                        _parse_log_chunk,
+                        [log_path] * len(bounds), [encoding] * len(bounds),
+                        [b[0] for b in bounds], [b[1] for b in bounds]
+                    ))
+
+            # Fix up chunk seams: leading rows belong to the previous chunk's last header
+            pending: Dict[str, List[str]] = defaultdict(list)
+            carry: Optional[str] = None
             count = 0
-            
-            # Patterns
-            # Matches: "    Directory: B:\songs"
-            dir_pattern = re.compile(r"^\s*Directory:\s*(.*)$", re.IGNORECASE)
-            # Matches: "-a----  29/10/2025  14:28  5483047  Filename.mp3"
-            # We look for the attribute string at the start
-            file_pattern = re.compile(r"^[da-]{5,6}\s+")
-            
-            with open(log_path, 'r', encoding='utf-16' if self._is_utf16(log_path) else 'utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # Check for directory header
-                    dir_match = dir_pattern.match(line)
-                    if dir_match:
-                        current_dir = dir_match.group(1).strip()
-                        continue
-                    
-                    # Check for file line (table format)
-                    if file_pattern.match(line):
-                        # The filename is at the end. Table layout is tricky but usually:
-                        # Attributes, Date, Time, Length, Name
-                        parts = line.split(maxsplit=4)
-                        if len(parts) >= 5:
-                            filename = parts[4]
-                            if current_dir:
-                                full_path = os.path.join(current_dir, filename)
-                                self.files.add(full_path.lower())
-                                count += 1
-                        continue
-
-                    # Fallback: Assume it's a flat list of FullNames if no table structure found
-                    if os.path.isabs(line) or line.startswith('\\\\'):
-                         self.files.add(line.lower())
-                         count += 1
+            for orphans, chunk_pending, saw_header, last_key in results:
+                if orphans and carry:
+                    pending[carry].extend(orphans)
+                    count += len(orphans)
+                for directory, names in chunk_pending.items():
+                    pending[directory].extend(names)
+                    count += len(names)
+                if saw_header:
+                    carry = last_key
 
+            self._merge(pending)
             logger.info(f"VFS loaded {count} entries from {log_path}")
             self.is_active = True
             return True
@@ -77,20 +216,34 @@ class VfsService:
             logger.error(f"Failed to load VFS log: {e}")
             return False
 
-    def _is_utf16(self, path: str) -> bool:
-        """Check if file is UTF-16 (common for PowerShell redirects)."""
-        try:
-            with open(path, 'rb') as f:
-                header = f.read(2)
-                return header in (b'\xff\xfe', b'\xfe\xff')
-        except:
-            return False
+    def _merge(self, pending: Dict[str, List[str]]):
+        """Fold parsed (directory -> names) into the sorted index."""
+        for directory, names in pending.items():
+            existing = self._dirs.get(directory)
+            if existing:
+                names = names + list(existing)
+            self._dirs[directory] = tuple(sorted(set(names)))
+
+    @property
+    def files(self) -> Iterator[str]:
+        """Iterate every known path (lowercased, backslash-separated)."""
+        for directory, names in self._dirs.items():
+            for name in names:
+                yield directory + name
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self._dirs.values())
 
     def exists(self, path: str) -> bool:
         """Check if a path exists in the virtual snapshot."""
         if not path:
             return False
-        return path.lower() in self.files
+        directory, name = _path_key(path)
+        names = self._dirs.get(directory)
+        if not names:
+            return False
+        i = bisect_left(names, name)
+        return i < len(names) and names[i] == name
 
     def get_status(self, path: str, physically_exists: bool) -> str:
         """
@@ -1,5 +1,6 @@
 from mutagen.mp3 import MP3
 import mutagen.id3
+from mutagen.id3 import TPE1, TIT2, TALB, TCOM, TPUB, TDRC, TCON, TLEN, TSRC, TKEY, ID3NoHeaderError
 from typing import Optional, TYPE_CHECKING
 from src.utils.error_handler import ErrorHandler
 from src.utils.id3_tags import ID3Tags
@@ -7,11 +8,30 @@ from src.utils.id3_tags import ID3Tags
 if TYPE_CHECKING:
     from src.models.song import SongID3
 
+# (frame id, frame class, SongID3 attribute) for the plain text frames
+_TEXT_FRAMES = (
+    (ID3Tags.ARTIST, TPE1, 'artist'),
+    (ID3Tags.TITLE, TIT2, 'title'),
+    (ID3Tags.ALBUM, TALB, 'album'),
+    (ID3Tags.COMPOSER, TCOM, 'composer'),
+    (ID3Tags.PUBLISHER, TPUB, 'publisher'),
+    (ID3Tags.GENRE, TCON, 'genres_all'),
+)
+
+class _NoTags:
+    """Passed as MP3's ID3 class when only stream info is needed.
+
+    Raising ID3NoHeaderError makes mutagen skip the tag parse; MPEGInfo
+    still skips the ID3 header on its own before reading frames.
+    """
+    def __init__(self, *args, **kwargs):
+        raise ID3NoHeaderError
+
 class AudioMetadata:
     @staticmethod
     def song_length(path: str) -> Optional[float]:
         try:
-            audio = MP3(path)
+            audio = MP3(path, ID3=_NoTags)
             length = audio.info.length
             return length
         except Exception as e:
@@ -31,26 +51,23 @@ class AudioMetadata:
             return
 
         try:
-            tag.tags[ID3Tags.ARTIST] = mutagen.id3.TPE1(encoding=3, text=[id3_data.artist])
-            tag.tags[ID3Tags.TITLE] = mutagen.id3.TIT2(encoding=3, text=[id3_data.title])
-            tag.tags[ID3Tags.ALBUM] = mutagen.id3.TALB(encoding=3, text=[id3_data.album])
-            tag.tags[ID3Tags.COMPOSER] = mutagen.id3.TCOM(encoding=3, text=[id3_data.composer])
-            tag.tags[ID3Tags.PUBLISHER] = mutagen.id3.TPUB(encoding=3, text=[id3_data.publisher])
-            tag.tags[ID3Tags.YEAR] = mutagen.id3.TDRC(encoding=3, text=[str(id3_data.year)])
-            tag.tags[ID3Tags.GENRE] = mutagen.id3.TCON(encoding=3, text=[id3_data.genres_all])
+            tags = tag.tags
+            for key, frame, attr in _TEXT_FRAMES:
+                tags[key] = frame(encoding=3, text=[getattr(id3_data, attr)])
+            tags[ID3Tags.YEAR] = TDRC(encoding=3, text=[str(id3_data.year)])
             try:
                 # TLEN expects milliseconds, typically integer
                 duration_val = str(int(float(str(id3_data.duration)) * 1000))
             except (ValueError, TypeError):
                 duration_val = "0"
-            tag.tags[ID3Tags.DURATION] = mutagen.id3.TLEN(encoding=3, text=[duration_val])
+            tags[ID3Tags.DURATION] = TLEN(encoding=3, text=[duration_val])
             if id3_data.isrc != "":
-                tag.tags[ID3Tags.ISRC] = mutagen.id3.TSRC(encoding=3, text=[id3_data.isrc])
+                tags[ID3Tags.ISRC] = TSRC(encoding=3, text=[id3_data.isrc])
             
             # Write 'Done' status (KEY)
             # Convert boolean to "true"/"false" string to match Java app convention
             done_str = "true" if getattr(id3_data, "done", False) else "false"
-            tag.tags[ID3Tags.KEY] = mutagen.id3.TKEY(encoding=3, text=[done_str])
+            tags[ID3Tags.KEY] = TKEY(encoding=3, text=[done_str])
             
             tag.save(v2_version=3)
         except Exception as e:
@@ -5,6 +5,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def _is_current(live_path, target_path) -> bool:
+    """True if target is an unchanged copy2 of live (same size and mtime)."""
+    try:
+        live, target = os.stat(live_path), os.stat(target_path)
+    except OSError:
+        return False
+    return live.st_size == target.st_size and live.st_mtime_ns == target.st_mtime_ns
+
 def sync_test_db(live_path: str, target_filename: str = "JZRS2DB-V5.accdb") -> tuple[str, bool]:
     """
     Syncs the live database to the local Downloads folder for testing.
@@ -29,6 +37,11 @@ def sync_test_db(live_path: str, target_filename: str = "JZRS2DB-V5.accdb") -> t
                 # Ensure target directory exists (should exist but good practice)
                 downloads_path.mkdir(parents=True, exist_ok=True)
                 
+                # copy2 keeps the mtime, so an untouched live DB needs no new copy
+                if _is_current(live_path, target_path):
+                    logger.info(f"Test DB at {target_path} is already up to date.")
+                    return str(target_path), True
+                
                 logger.info(f"Attempting to sync live DB from {live_path} to {target_path}")
                 shutil.copy2(live_path, target_path)
                 logger.info("Successfully copied live DB to Downloads.")
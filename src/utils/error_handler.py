@@ -5,14 +5,18 @@ This module provides the ErrorHandler class for managing all application errors
 with appropriate logging, user notifications, and badge updates.
 """
 
-import json
+import atexit
 import logging
+import queue
+import sys
+import threading
 import traceback
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Tuple
 from tkinter import messagebox
+from src.utils import json_codec
 
 
 class ErrorSeverity(Enum):
@@ -44,6 +48,17 @@ class ErrorHandler:
     _error_callback = None
     _logger = None
     _initialized = False
+    # (path, mtime, size, limit) -> (errors, offset) for the last tail read
+    _tail_cache = None
+    # Log lines are appended by a background writer, in batches, through
+    # one handle it keeps open (reopened only if the log path changes)
+    _log_queue = queue.Queue()
+    _writer = None
+    LOG_BATCH_SIZE = 64
+
+    # Logs smaller than this are read whole; larger ones from the end
+    TAIL_FULL_READ_SIZE = 64 * 1024
+    TAIL_CHUNK_SIZE = 8192
     
     @classmethod
     def initialize(cls, log_file: str = "app_errors.log"):
@@ -60,6 +75,10 @@ class ErrorHandler:
         cls._error_count = 0
         cls._critical_count = 0
         cls._initialized = True
+        if cls._writer is None:
+            cls._writer = threading.Thread(target=cls._log_writer, daemon=True)
+            cls._writer.start()
+            atexit.register(cls.flush)
     
     # ============ Main Error Handling ============
     
@@ -181,6 +200,12 @@ class ErrorHandler:
         if not cls._log_file:
             return
         
+        # Only format a trace when an exception is being handled; show_error()
+        # outside an except block would just log "NoneType: None"
+        stack_trace = None
+        if severity in (ErrorSeverity.CRITICAL, ErrorSeverity.ERROR) and sys.exc_info()[2] is not None:
+            stack_trace = traceback.format_exc()
+
         # Create log entry
         log_entry = {
             "timestamp": datetime.now().isoformat(),
@@ -188,17 +213,11 @@ class ErrorHandler:
             "context": context,
             "message": str(error),
             "exception": type(error).__name__,
-            "stack_trace": traceback.format_exc() if severity in [ErrorSeverity.CRITICAL, ErrorSeverity.ERROR] else None
+            "stack_trace": stack_trace
         }
         
         # Append to log file (JSON Lines format)
-        try:
-            with open(cls._log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry) + '\n')
-        except Exception as e:
-            # If logging fails, print to console as fallback
-            print(f"Failed to write to log file: {e}")
-            print(f"Original error: {error}")
+        cls._write_entry(log_entry)
     
     @classmethod
     def log_info(cls, message: str, context: str = ""):
@@ -215,11 +234,53 @@ class ErrorHandler:
             "stack_trace": None
         }
         
-        try:
-            with open(cls._log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry) + '\n')
-        except Exception as e:
-            print(f"Failed to write to log file: {e}")
+        cls._write_entry(log_entry)
+
+    @classmethod
+    def _write_entry(cls, log_entry: Dict):
+        """Queue one JSON line for the writer thread."""
+        cls._log_queue.put((cls._log_file, json_codec.dumps(log_entry) + '\n'))
+
+    @classmethod
+    def _log_writer(cls):
+        """
+        Writer thread: appends queued lines, up to LOG_BATCH_SIZE per write.
+        The file is opened on the first line and kept open; each batch is
+        flushed, so readers and clear_log_file() see complete lines.
+        """
+        f = None
+        f_path = None
+        while True:
+            batch = [cls._log_queue.get()]
+            while len(batch) < cls.LOG_BATCH_SIZE:
+                try:
+                    batch.append(cls._log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                for log_path, line in batch:
+                    if log_path != f_path:
+                        if f:
+                            f.close()
+                        f = open(log_path, 'a', encoding='utf-8')
+                        f_path = log_path
+                    f.write(line)
+                f.flush()
+            except Exception as e:
+                # If logging fails, print to console as fallback
+                print(f"Failed to write to log file: {e}")
+                if f:
+                    f.close()
+                f = f_path = None
+            finally:
+                for _ in batch:
+                    cls._log_queue.task_done()
+
+    @classmethod
+    def flush(cls):
+        """Block until every queued log line has been written."""
+        if cls._writer is not None:
+            cls._log_queue.join()
     
     # ============ Badge Management ============
     
@@ -276,23 +337,30 @@ class ErrorHandler:
         Returns:
             List of error dictionaries
         """
+        return cls.tail_errors(limit)[0]
+
+    @classmethod
+    def tail_errors(cls, limit: int = 50) -> Tuple[List[Dict], int]:
+        """
+        Like get_recent_errors, but also returns the byte offset just past the
+        last complete line read, for use with read_errors_since().
+        """
         # Ensure initialized
         if not cls._initialized:
             cls.initialize()
+        cls.flush()
             
         if not cls._log_file or not cls._log_file.exists():
-            return []
+            return [], 0
         
-        errors = []
         try:
-            with open(cls._log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                # Get last N lines
-                for line in lines[-limit:]:
-                    try:
-                        errors.append(json.loads(line.strip()))
-                    except json.JSONDecodeError:
-                        continue
+            stat = cls._log_file.stat()
+            key = (cls._log_file, stat.st_mtime_ns, stat.st_size, limit)
+            if cls._tail_cache and cls._tail_cache[0] == key:
+                errors, end = cls._tail_cache[1]
+                return list(errors), end
+            with open(cls._log_file, 'rb') as f:
+                data, start = cls._read_tail(f, limit)
         except Exception as e:
             print(f"Failed to read log file: {e}")
             # Return a fake error so the user knows reading failed
@@ -302,8 +370,80 @@ class ErrorHandler:
                 "context": "System",
                 "message": f"Failed to read log file: {e}",
                 "exception": "IOError"
-            }]
-        
+            }], 0
+
+        end = data.rfind(b'\n') + 1
+        # Get last N lines
+        lines = data[:end].splitlines()[-limit:] if limit > 0 else []
+        errors = cls._parse_log_lines(lines)
+        cls._tail_cache = (key, (errors, start + end))
+        return list(errors), start + end
+
+    @classmethod
+    def _read_tail(cls, f, limit: int) -> Tuple[bytes, int]:
+        """
+        Read enough of the end of f to hold its last `limit` lines.
+        Returns (data, offset of data in the file).
+        """
+        size = f.seek(0, 2)
+        if size <= cls.TAIL_FULL_READ_SIZE:
+            f.seek(0)
+            return f.read(), 0
+        buf = bytearray()
+        pos = size
+        # One newline more than limit, so the first line kept is whole
+        while pos > 0 and buf.count(b'\n') <= limit:
+            step = min(cls.TAIL_CHUNK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            buf[:0] = f.read(step)
+        if pos > 0:
+            # Drop the partial line at the front
+            cut = buf.index(b'\n') + 1
+            del buf[:cut]
+            pos += cut
+        return bytes(buf), pos
+
+    @classmethod
+    def read_errors_since(cls, offset: int) -> Tuple[List[Dict], int]:
+        """
+        Read the log entries appended after byte offset.
+
+        Returns (entries, new_offset). A partly written last line is left for
+        the next call. Callers should check log_size() first: a log smaller
+        than their offset was cleared and needs a full reload.
+        """
+        if not cls._log_file:
+            return [], offset
+        cls.flush()
+        try:
+            with open(cls._log_file, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError as e:
+            print(f"Failed to read log file: {e}")
+            return [], offset
+
+        end = data.rfind(b'\n') + 1
+        return cls._parse_log_lines(data[:end].splitlines()), offset + end
+
+    @classmethod
+    def log_size(cls) -> int:
+        """Current size of the log file in bytes (0 if it does not exist)."""
+        cls.flush()
+        try:
+            return cls._log_file.stat().st_size if cls._log_file else 0
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _parse_log_lines(lines: List[bytes]) -> List[Dict]:
+        errors = []
+        for line in lines:
+            try:
+                errors.append(json_codec.loads(line))
+            except (json_codec.JSONDecodeError, UnicodeDecodeError):
+                continue
         return errors
 
     @classmethod
@@ -311,6 +451,7 @@ class ErrorHandler:
         """Clear the error log file."""
         if not cls._log_file:
             return
+        cls.flush()
         try:
             with open(cls._log_file, 'w', encoding='utf-8') as f:
                 f.write("")
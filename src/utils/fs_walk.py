@@ -0,0 +1,36 @@
+"""
+Filesystem walking helpers.
+
+Uses os.scandir directly so each directory is listed once and file type
+checks come from the directory entry instead of extra stat calls.
+"""
+
+import os
+import logging
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def iter_mp3_entries(root: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield DirEntry objects for *.mp3 files under root.
+
+    Symlinked directories are not followed. Directories that cannot be
+    listed are logged and skipped.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name[-4:].lower() == '.mp3':
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Cannot list {current}: {e}")
@@ -0,0 +1,42 @@
+"""
+Compact JSON encode/decode helpers.
+
+Uses orjson when it is installed (several times faster on the small dicts
+and lists this app stores) and falls back to the standard json module.
+Output is compact and never indented; files meant to be edited by hand
+keep using json.dump with indent.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch it either way
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+else:
+    def dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj)
+
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+
+def load_file(path) -> object:
+    """Read and parse a JSON file in one go."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
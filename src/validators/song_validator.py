@@ -1,11 +1,51 @@
-from typing import Dict
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, Iterable, List, Tuple
 from src.models.song import Song, SongID3
 from src.validators.validation_result import ValidationResult
 from src.core.config import app_config
 
+# Fields that must be set and match the ID3 tag, checked (and reported) in this order
+REQUIRED_FIELDS = ('artist', 'title', 'album', 'year', 'composer', 'publisher')
+_REQUIRED_GETTERS = tuple((attr, attrgetter(attr)) for attr in REQUIRED_FIELDS)
+
 class SongValidator:
     def __init__(self, genre_map: Dict[int, str]):
         self.genre_map = genre_map
+        self.reload_rules()
+
+    @property
+    def genre_map(self) -> Dict[int, str]:
+        return self._genre_map
+
+    @genre_map.setter
+    def genre_map(self, genre_map: Dict[int, str]):
+        self._genre_map = genre_map
+        # Valid genre names for O(1) membership tests; rebuilt when the map is replaced
+        self._genre_names = frozenset(genre_map.values())
+        # Placeholder name for an unset genre slot ('x'), skipped when validating
+        self._empty_genre = genre_map.get(0)
+
+    def reload_rules(self):
+        """Drop the cached genre rule sets; they are rebuilt on next use."""
+        self._rules_source = None
+        self._standard_genres = frozenset()
+        self._special_genres = frozenset()
+
+    def _path_rules(self):
+        """Lower-cased (standard, special) genre sets for the current config rules."""
+        rules = app_config.genre_rules
+        # Config replaces the dict on reload/save, so identity tracks changes
+        if rules is not self._rules_source:
+            # Safety check for missing config keys and normalize to lower case
+            self._standard_genres = frozenset(g.lower() for g in rules.get("standard_subfolder", []))
+            self._special_genres = frozenset(
+                g.lower()
+                for key in ("path_overrides", "no_year_subfolder", "no_genre_subfolder")
+                for g in rules.get(key, [])
+            )
+            self._rules_source = rules
+        return self._standard_genres, self._special_genres
 
     def validate(self, song: Song, id3: SongID3) -> ValidationResult:
         """
@@ -31,29 +71,35 @@ class SongValidator:
         
         return result
 
+    def validate_batch(self, pairs: Iterable[Tuple[Song, SongID3]]) -> List[ValidationResult]:
+        """Validates many (song, id3) pairs; one result per pair, in order."""
+        # Resolve the config rule sets once for the whole batch
+        self._path_rules()
+        validate = self.validate
+        return [validate(song, id3) for song, id3 in pairs]
+
     def _validate_fields(self, song: Song, id3: SongID3, result: ValidationResult) -> bool:
-        attributes = ['artist', 'title', 'album', 'year', 'composer', 'publisher']
-        
-        for attr in attributes:
-            val_song = getattr(song, attr)
+        for attr, get in _REQUIRED_GETTERS:
+            val_song = get(song)
             
             # Check if set
             if val_song is None or val_song == "":
                  result.add_error(f"'{attr}' not set!", attr)
                  return False # Fail fast to match legacy behavior
                  
-            val_song_str = str(val_song)
-            val_id3_str = str(getattr(id3, attr))
+            # Most values are already str; only convert the rest (year, tag frames)
+            val_song_str = val_song if type(val_song) is str else str(val_song)
+            val_id3 = get(id3)
+            val_id3_str = val_id3 if type(val_id3) is str else str(val_id3)
             
-            # Check match
+            # Check match (artist: ID3 may extend the shorter DB value)
             if attr == 'artist':
-                if val_song_str and not val_id3_str.startswith(val_song_str):
-                    result.add_error(f"'{attr}' not the same!", attr)
-                    return False
+                matches = val_id3_str.startswith(val_song_str)
             else:
-                if val_song_str != val_id3_str:
-                    result.add_error(f"'{attr}' not the same!", attr)
-                    return False
+                matches = val_song_str == val_id3_str
+            if not matches:
+                result.add_error(f"'{attr}' not the same!", attr)
+                return False
 
         if not song.isrc == id3.isrc:
              # ISRC mismatch prevents save but had no explicit message in old code
@@ -74,43 +120,40 @@ class SongValidator:
         # Check if genres exist in map
         # song.genres_all is expected to be normalized (no 'x' unless empty)
         
-        current_genres = [g for g in song.genres_all.split(", ") if g and g != self.genre_map[0]]
+        genres_all = song.genres_all
+        empty = self._empty_genre
+        current_genres = (g for g in genres_all.split(", ") if g and g != empty)
         
         # Check validity (limit to 3)
-        for genre in current_genres[:3]:
-            # self.genre_map.values() contains all valid genre names
-            if genre not in self.genre_map.values():
+        for genre in islice(current_genres, 3):
+            if genre not in self._genre_names:
                 result.add_error(f"Genre '{genre}' not found!", "genre")
                 return False
                 
         # Check vs ID3
-        if not Song.check_genre(song.genres_all, id3.genres_all):
+        if not Song.check_genre(genres_all, id3.genres_all):
              result.add_error("Genres not the same!", "genre")
              return False
              
         return True
 
     def _validate_path(self, song: Song, result: ValidationResult) -> bool:
-        g1 = song.genre_01_name.lower()
-        rules = app_config.genre_rules
-
-        # Safety check for missing config keys and normalize to lower case
-        standard = [g.lower() for g in rules.get("standard_subfolder", [])]
-        overrides = [g.lower() for g in rules.get("path_overrides", {}).keys()]
-        no_year = [g.lower() for g in rules.get("no_year_subfolder", [])]
-        no_genre = [g.lower() for g in rules.get("no_genre_subfolder", [])]
+        genre = song.genre_01_name
+        g1 = genre.lower()
+        standard, special = self._path_rules()
 
         is_standard = g1 in standard
-        is_special = (g1 in overrides or g1 in no_year or g1 in no_genre)
+        is_special = g1 in special
 
         if not is_standard and not is_special:
-             result.add_error(f"Genre '{song.genre_01_name}' is not defined in config rules!", "path")
+             result.add_error(f"Genre '{genre}' is not defined in config rules!", "path")
              return False
 
-        is_path_correct = song.location_local.lower() == song.location_correct.lower()
+        correct = song.location_correct
+        is_path_correct = Song.same_path(song.location_local, correct)
         if not is_path_correct:
              if is_standard:
-                  result.add_error(f"File is in the wrong folder!\nExpected: {song.location_correct}", "path")
+                  result.add_error(f"File is in the wrong folder!\nExpected: {correct}", "path")
                   return False
 
         return True
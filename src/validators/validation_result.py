@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Optional
 from enum import Enum
 
@@ -13,21 +13,37 @@ class ValidationIssue:
     level: ValidationLevel = ValidationLevel.WARNING
     field: Optional[str] = None
 
-@dataclass
 class ValidationResult:
-    is_valid: bool = True
-    issues: List[ValidationIssue] = field(default_factory=list)
+    # Issues are recorded as (message, level, field) tuples and only turned
+    # into ValidationIssue objects when .issues is read; bulk validation
+    # mostly just checks is_valid.
+    __slots__ = ('is_valid', '_issues', '_pending')
+
+    def __init__(self, is_valid: bool = True, issues: Optional[List[ValidationIssue]] = None):
+        self.is_valid = is_valid
+        self._issues = list(issues) if issues else []
+        self._pending = []
+
+    @property
+    def issues(self) -> List[ValidationIssue]:
+        if self._pending:
+            self._issues.extend(ValidationIssue(*raw) for raw in self._pending)
+            self._pending.clear()
+        return self._issues
     
     def add_error(self, message: str, field_name: str = None):
         self.is_valid = False
-        self.issues.append(ValidationIssue(message, ValidationLevel.ERROR, field_name))
+        self._pending.append((message, ValidationLevel.ERROR, field_name))
         
     def add_warning(self, message: str, field_name: str = None):
         # Warnings don't necessarily make is_valid False, depends on business logic. 
         # In current app, warnings often stop save (e.g. "Year not set" shows warning dialog).
         # We'll treat them as issues.
-        self.issues.append(ValidationIssue(message, ValidationLevel.WARNING, field_name))
+        self._pending.append((message, ValidationLevel.WARNING, field_name))
         
     @property
     def has_issues(self):
-        return len(self.issues) > 0
+        return bool(self._pending or self._issues)
+
+    def __repr__(self):
+        return f"ValidationResult(is_valid={self.is_valid!r}, issues={self.issues!r})"
@@ -2,9 +2,10 @@
 Flask application factory for the Database Toolkit web UI.
 """
 
-import json
 import logging
+import threading
 from pathlib import Path
+from cachelib import FileSystemCache
 from flask import Flask, render_template, request, redirect, url_for, session, flash, g
 from flask_session import Session
 
@@ -19,6 +20,7 @@ from src.services.audit_service import AuditService
 from src.services.schema_settings_service import SchemaSettingsService
 from src.services.export_service import ExportService
 from src.services.lookup_service import LookupService
+from src.utils import json_codec
 
 # Setup logging
 logging.basicConfig(
@@ -27,34 +29,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Service cache
-_services = {
-    'backend': None,
-    'registry': None,
-    'song_service': None,
-    'media_service': None,
-    'vfs_service': None,
-    'snapshot_service': None,
-    'sync_service': None,
-    'audit_service': None,
-    'schema_settings': None,
-    'export_service': None,
-    'lookup_service': None,
-    'import_service': None
-}
+# Service cache: filled lazily by the get_* functions below (see _get_or_create)
+_SERVICE_KEYS = (
+    'backend',
+    'registry',
+    'song_service',
+    'media_service',
+    'vfs_service',
+    'snapshot_service',
+    'sync_service',
+    'audit_service',
+    'schema_settings',
+    'export_service',
+    'lookup_service',
+    'artist_service',
+    'import_service',
+)
+_services = dict.fromkeys(_SERVICE_KEYS)
+# Guards service creation and reset_services(); Flask serves requests on threads
+_services_lock = threading.RLock()
 
 def load_connections():
     """Load database connections from config."""
     config_path = Path(__file__).parent.parent.parent / 'config' / 'connections.json'
     if config_path.exists():
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json_codec.load_file(config_path)
         except Exception as e:
             logger.error(f"Failed to load connections: {e}")
     return {'databases': {}}
 
 
+def session_dir() -> Path:
+    """
+    Directory for server-side session files: a tmpfs (/dev/shm) when the
+    host has one, so reading the session on each request doesn't hit the
+    disk; otherwise the .sessions folder in the project root.
+    """
+    shm = Path('/dev/shm')
+    if shm.is_dir():
+        return shm / 'jazler-editor-sessions'
+    return Path(__file__).parent.parent.parent / '.sessions'
+
+
 def create_app():
     """Application factory."""
     app = Flask(__name__, 
@@ -65,15 +82,19 @@ def create_app():
     app.secret_key = 'dev-key-change-in-production'
     
     # Configure Server-side sessions
-    # This stores session data in the .sessions folder instead of cookies
-    app.config['SESSION_TYPE'] = 'filesystem'
-    app.config['SESSION_FILE_DIR'] = str(Path(__file__).parent.parent.parent / '.sessions')
-    app.config['SESSION_PERMANENT'] = False
-    app.config['SESSION_USE_SIGNER'] = True
+    # This stores session data in files (see session_dir) instead of cookies
+    app.config['SESSION_FILE_DIR'] = str(session_dir())
     
     # Ensure session dir exists
     Path(app.config['SESSION_FILE_DIR']).mkdir(exist_ok=True)
     
+    app.config['SESSION_TYPE'] = 'cachelib'
+    app.config['SESSION_CACHELIB'] = FileSystemCache(
+        app.config['SESSION_FILE_DIR'], threshold=500, default_timeout=0
+    )
+    app.config['SESSION_PERMANENT'] = False
+    app.config['SESSION_USE_SIGNER'] = True
+    
     # Initialize session
     Session(app)
     
@@ -103,14 +124,17 @@ def create_app():
     
     @app.context_processor
     def inject_globals():
-        db_name = session.get('db_name', 'Not Connected')
-        is_live = 'live' in db_name.lower() or session.get('is_live', False)
-        logger.info(f"Context Processor: db_name={db_name}, is_live={is_live}")
+        # Runs on every render: one session lookup, lazy debug logging;
+        # the sync count is kept in memory by SyncService
+        s = session
+        db_name = s.get('db_name', 'Not Connected')
+        is_live = 'live' in db_name.lower() or s.get('is_live', False)
+        logger.debug("Context Processor: db_name=%s, is_live=%s", db_name, is_live)
         return dict(
             db_name=db_name,
             is_live=is_live,
             sync_count=get_sync_service(app).count(),
-            offline_mode=session.get('offline_mode', False)
+            offline_mode=s.get('offline_mode', False)
         )
     
     @app.teardown_appcontext
@@ -121,10 +145,30 @@ def create_app():
     return app
 
 
+def _get_or_create(key, build):
+    """
+    Return the cached service for key, building it on first use.
+
+    The cached case is a plain dict lookup. Building happens under
+    _services_lock, re-checked inside, so concurrent requests don't open
+    duplicate backends. The lock is re-entrant because builders fetch their
+    dependencies through the other getters. A builder returning None (e.g. no
+    database configured) leaves nothing cached, so the next call retries.
+    """
+    service = _services.get(key)
+    if service is None:
+        with _services_lock:
+            service = _services.get(key)
+            if service is None:
+                service = build()
+                if service is not None:
+                    _services[key] = service
+    return service
+
+
 def get_backend(app):
     """Get or create the database backend."""
-    global _services
-    if _services['backend'] is None:
+    def build():
         db_name = session.get('db_name', 'jazler_test')
         # Use session override path if available (common for synced test DB)
         db_path = session.get('active_db_path')
@@ -140,88 +184,87 @@ def get_backend(app):
             backend = AccessBackend(db_path)
             try:
                 backend.connect()
-                _services['backend'] = backend
+                return backend
             except Exception as e:
                 logger.error(f"Failed to connect to backend {db_name}: {e}")
+        return None
     
-    return _services['backend']
+    return _get_or_create('backend', build)
 
 
 def get_registry(app):
     """Get or create the schema registry."""
-    global _services
-    if _services['registry'] is None:
+    def build():
         backend = get_backend(app)
         if backend:
             logger.info("Initializing schema registry")
             config_path = Path(__file__).parent.parent.parent / 'config' / 'schema_overrides.json'
             registry = SchemaRegistry.from_config(str(config_path))
             registry.load(backend)
-            _services['registry'] = registry
+            return registry
+        return None
     
-    return _services['registry']
+    return _get_or_create('registry', build)
 
 
 def get_song_service(app):
     """Get or create the song service."""
-    global _services
-    if _services['song_service'] is None:
+    def build():
         backend = get_backend(app)
         registry = get_registry(app)
         if backend and registry:
             logger.info("Initializing SongService")
-            _services['song_service'] = SongService(backend, registry)
+            return SongService(backend, registry)
+        return None
     
-    return _services['song_service']
+    return _get_or_create('song_service', build)
 
 def get_audit_service(app):
     """Get or create the audit service."""
-    global _services
-    if _services['audit_service'] is None:
+    def build():
         song_service = get_song_service(app)
         vfs_service = get_vfs_service(app)
         media_service = get_media_service(app)
         if song_service and vfs_service and media_service:
             logger.info("Initializing AuditService")
             config = app.config.get('CONNECTIONS', {})
-            _services['audit_service'] = AuditService(song_service, vfs_service, media_service, config)
-    return _services['audit_service']
+            return AuditService(song_service, vfs_service, media_service, config)
+        return None
+    return _get_or_create('audit_service', build)
 
 def get_artist_service(app):
     """Get or create the ArtistService singleton."""
-    if 'artist_service' not in _services:
+    def build():
         backend = get_backend(app)
         registry = get_registry(app)
         if backend and registry:
             from src.services.artist_service import ArtistService
-            _services['artist_service'] = ArtistService(backend, registry)
-    return _services.get('artist_service')
+            return ArtistService(backend, registry)
+        return None
+    return _get_or_create('artist_service', build)
 
 def get_sync_service(app):
     """Get or create the sync service for offline changes."""
-    global _services
-    if _services['sync_service'] is None:
+    def build():
         queue_path = Path(app.root_path).parent.parent / 'config' / 'pending_sync.json'
         logger.info(f"Initializing SyncService with queue: {queue_path}")
-        _services['sync_service'] = SyncService(str(queue_path))
-    return _services['sync_service']
+        return SyncService(str(queue_path))
+    return _get_or_create('sync_service', build)
 
 def get_snapshot_service(app):
     """Get or create the metadata snapshot service."""
-    global _services
-    if _services['snapshot_service'] is None:
+    def build():
         cache_path = Path(app.root_path).parent.parent / 'config' / 'metadata_snapshot.json'
         logger.info(f"Initializing SnapshotService with cache: {cache_path}")
         service = SnapshotService(str(cache_path))
         service.load_cache()
-        _services['snapshot_service'] = service
-    return _services['snapshot_service']
+        return service
+    return _get_or_create('snapshot_service', build)
 
 
 def get_vfs_service(app):
     """Get or create the virtual file system service."""
-    global _services
-    if _services['vfs_service'] is None:
+    def build():
         # Look for log files in root
         log_file = None
         for candidate in ['log.txt', 'log_flat.txt']:
@@ -231,14 +274,13 @@ def get_vfs_service(app):
                 break
         
         logger.info(f"Initializing VfsService with log: {log_file}")
-        _services['vfs_service'] = VfsService(log_file)
+        return VfsService(log_file)
     
-    return _services['vfs_service']
+    return _get_or_create('vfs_service', build)
 
 def get_media_service(app):
     """Get or create the media service."""
-    global _services
-    if _services['media_service'] is None:
+    def build():
         connections = app.config['CONNECTIONS']
         drive_map = connections.get('drive_map', {})
         base_path = connections.get('base_songs_path')
@@ -247,77 +289,68 @@ def get_media_service(app):
         snapshot_service = get_snapshot_service(app)
         
         logger.info("Initializing MediaService")
-        _services['media_service'] = MediaService(drive_map, base_path, vfs_service, snapshot_service)
+        return MediaService(drive_map, base_path, vfs_service, snapshot_service)
     
-    return _services['media_service']
+    return _get_or_create('media_service', build)
 
 
 def reset_services():
     """Clear the service cache (e.g. when changing databases)."""
     global _services
-    if _services['backend']:
-        try:
-            _services['backend'].disconnect()
-        except:
-            pass
-    _services = {
-        'backend': None,
-        'registry': None,
-        'song_service': None,
-        'media_service': None,
-        'vfs_service': None,
-        'snapshot_service': None,
-        'sync_service': None,
-        'audit_service': None,
-        'schema_settings': None,
-        'export_service': None,
-        'lookup_service': None,
-        'import_service': None
-    }
+    with _services_lock:
+        if _services['schema_settings']:
+            _services['schema_settings'].flush()
+        if _services['sync_service']:
+            _services['sync_service'].flush()
+        if _services['backend']:
+            try:
+                _services['backend'].disconnect()
+            except:
+                pass
+        _services = dict.fromkeys(_SERVICE_KEYS)
 
 def get_schema_settings(app):
     """Get or create the schema settings service."""
-    global _services
-    if _services['schema_settings'] is None:
+    def build():
         config_path = Path(app.root_path).parent.parent / 'config' / 'schema_settings.json'
-        _services['schema_settings'] = SchemaSettingsService(str(config_path))
-    return _services['schema_settings']
+        return SchemaSettingsService(str(config_path))
+    return _get_or_create('schema_settings', build)
 
 
 def get_export_service(app):
     """Get or create the export service."""
-    global _services
-    if _services['export_service'] is None:
+    def build():
         song_service = get_song_service(app)
         if song_service:
-            _services['export_service'] = ExportService(song_service)
-    return _services['export_service']
+            return ExportService(song_service)
+        return None
+    return _get_or_create('export_service', build)
 
 
 def get_lookup_service(app):
     """Get or create the generic lookup service."""
-    global _services
-    if _services['lookup_service'] is None:
+    def build():
         backend = get_backend(app)
         registry = get_registry(app)
         if backend and registry:
             logger.info("Initializing LookupService")
-            _services['lookup_service'] = LookupService(backend, registry)
-    return _services['lookup_service']
+            return LookupService(backend, registry)
+        return None
+    return _get_or_create('lookup_service', build)
 
 
 def get_import_service(app):
     """Get or create the import service."""
-    global _services
-    if _services['import_service'] is None:
+    def build():
         backend = get_backend(app)
         artist_service = get_artist_service(app)
         song_service = get_song_service(app)
         if backend and artist_service and song_service:
             from src.services.import_service import ImportService
             logger.info("Initializing ImportService")
-            _services['import_service'] = ImportService(backend, artist_service, song_service)
-    return _services['import_service']
+            return ImportService(backend, artist_service, song_service)
+        return None
+    return _get_or_create('import_service', build)
 
 
 def get_services(app):
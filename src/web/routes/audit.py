@@ -3,14 +3,17 @@ Audit routes - library integrity reports and ghost management.
 """
 
 import logging
+from pathlib import Path
 from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, session
 from src.web.app import get_audit_service
+from src.services.audit_cache import AuditCache
 
 logger = logging.getLogger(__name__)
 audit_bp = Blueprint('audit', __name__)
 
-# Global cache for audit results to avoid session bloat
-app_audit_cache = {}
+# Cache for audit results to avoid session bloat; kept on disk so any
+# worker process can serve the report for an audit another one ran
+app_audit_cache = AuditCache(str(Path(__file__).parent.parent.parent.parent / 'config' / 'audit_cache.db'))
 
 @audit_bp.route('/')
 def index():
@@ -40,10 +43,7 @@ def run():
             'timestamp': results.get('timestamp') # we didn't add timestamp yet
         }
         
-        # We'll need a way to pass the full results to the report page.
-        # For now, let's keep it in a global or similar if it's too big for session.
-        # Actually, let's just re-run or use a cache file.
-        # For this demo, let's use a simple global cache for results.
+        # The full results go to the audit cache for the report page
         app_audit_cache[current_app.name] = results
         
         flash('Audit complete!', 'success')
@@ -2,14 +2,45 @@
 Export routes - data portability and reporting.
 """
 
+import itertools
 import logging
-from datetime import datetime
-from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, Response, session
+import os
+import tempfile
+import time
+from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, Response, session, stream_with_context, send_file
 from src.web.app import get_export_service, get_song_service, get_audit_service
+from src.services.export_service import ExportService
 
 logger = logging.getLogger(__name__)
 export_bp = Blueprint('export', __name__)
 
+# format -> (mimetype, file extension, ExportService writer, writer yields chunks)
+# Unknown formats are exported as JSON
+_FORMATS = {
+    'csv': ("text/csv", "csv", ExportService.iter_csv, True),
+    'json': ("application/json", "json", ExportService.to_json, False),
+}
+
+# Exports with more records than this are written to a temp file and sent
+# with send_file, so the server can hand the file to the socket directly
+SPOOL_THRESHOLD = 5000
+
+
+def _send_spooled(chunks, mimetype, ext, filename):
+    """Write chunks to a temp file and send it; the file is removed once sent."""
+    fd, path = tempfile.mkstemp(suffix=f".{ext}")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(chunks)
+        response = send_file(path, mimetype=mimetype, as_attachment=True,
+                             download_name=filename, conditional=True)
+    except Exception:
+        os.unlink(path)
+        raise
+    # Runs after the file has been sent and closed (needed on Windows)
+    response.call_on_close(lambda: os.unlink(path))
+    return response
+
 @export_bp.route('/')
 def index():
     """Export dashboard."""
@@ -39,7 +70,8 @@ def download():
 
     try:
         if export_type == 'songs_all':
-            records = song_service.get_all(limit=100000)
+            # Streamed from the DB; never held in memory as a whole
+            records = song_service.iter_all()
             filename_prefix = "all_songs"
         elif export_type == 'search_results':
             ids = session.get('result_ids', [])
@@ -47,11 +79,8 @@ def download():
                 flash('No search results to export. Run a search first.', 'warning')
                 return redirect(url_for('export.index'))
             
-            # Fetch these specifically
-            for sid in ids:
-                rec = song_service.get_by_id(sid)
-                if rec:
-                    records.append(rec)
+            # Fetch these specifically, in chunked IN (...) queries
+            records = song_service.get_many(ids)
             filename_prefix = "search_results"
         elif export_type == 'selected_songs':
             id_str = request.form.get('ids', '')
@@ -60,11 +89,7 @@ def download():
                 flash('No songs selected for export.', 'warning')
                 return redirect(url_for('export.index'))
             
-            for sid in ids:
-                if sid:
-                    rec = song_service.get_by_id(int(sid))
-                    if rec:
-                        records.append(rec)
+            records = song_service.get_many(int(sid) for sid in ids if sid)
             filename_prefix = "selected_songs"
         elif export_type == 'audit_ghosts':
             # Access the audit cache
@@ -76,26 +101,27 @@ def download():
                  return redirect(url_for('audit.index'))
             
             ghosts = audit_results.get('missing', [])
-            for g in ghosts:
-                rec = song_service.get_by_id(g['id'])
-                if rec:
-                    records.append(rec)
+            records = song_service.get_many(g['id'] for g in ghosts)
             filename_prefix = "audit_ghosts"
 
-        if not records:
+        # Only fetched lists know their size; songs_all is always streamed
+        size = len(records) if hasattr(records, '__len__') else None
+        records = iter(records)
+        first = next(records, None)
+        if first is None:
             flash('No records found to export.', 'warning')
             return redirect(url_for('export.index'))
+        records = itertools.chain((first,), records)
 
         # Generate content
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        if format == 'csv':
-            content = export_service.to_csv(records, include_resolved=include_resolved)
-            mimetype = "text/csv"
-            filename = f"{filename_prefix}_{timestamp}.csv"
-        else:
-            content = export_service.to_json(records, include_resolved=include_resolved)
-            mimetype = "application/json"
-            filename = f"{filename_prefix}_{timestamp}.json"
+        mimetype, ext, write, streamed = _FORMATS.get(format, _FORMATS['json'])
+        filename = f"{filename_prefix}_{time.strftime('%Y%m%d_%H%M')}.{ext}"
+        content = write(export_service, records, include_resolved=include_resolved)
+        if size is not None and size > SPOOL_THRESHOLD:
+            return _send_spooled(content if streamed else (content,), mimetype, ext, filename)
+        if streamed:
+            # Rows are written to the client as they are read
+            content = stream_with_context(content)
 
         return Response(
             content,
@@ -54,6 +54,10 @@ def search():
     results = None
     position = 0
     
+    # Grid columns decide what the search has to fetch
+    view_name = session.get('grid_view', 'default')
+    grid_columns = service.get_grid_columns(view_name)
+    
     if criteria_list:
         # Save primary search to session (simple version)
         if criteria_list:
@@ -62,7 +66,9 @@ def search():
             session['last_match'] = criteria_list[0]['match']
         
         # Execute search
-        results = service.search_advanced(criteria_list, limit=500)
+        results = service.search_advanced(
+            criteria_list, limit=500, columns=[c.name for c in grid_columns]
+        )
         
         # Store result IDs in session for batch navigation
         session['result_ids'] = [r.primary_key for r in results]
@@ -78,14 +84,10 @@ def search():
     # Dynamic field list from schema
     search_fields = service.get_searchable_fields()
     
-    # Get Grid Columns from Registry
+    # Registry for the view switcher
     from src.web.app import get_registry
     registry = get_registry(current_app)
     
-    # Get Grid Columns
-    view_name = session.get('grid_view', 'default')
-    grid_columns = service.get_grid_columns(view_name)
-    
     # Need PK field for rendering
     table_def = service._schema
             
@@ -369,12 +371,12 @@ def bulk_edit():
         flash('No songs selected', 'warning')
         return redirect(url_for('songs.search'))
     
-    songs = [service.get_by_id(sid) for sid in id_list if service.get_by_id(sid)]
+    songs = list(service.get_many(id_list))
     if not songs:
         flash('Selected songs not found', 'error')
         return redirect(url_for('songs.search'))
 
-    common_values = service.get_bulk_summary(id_list)
+    common_values = service.summarize_records(songs)
 
     return render_template('songs/bulk_edit.html',
                          songs=songs,
@@ -0,0 +1,81 @@
+"""
+Tests for AccessBackend SQL generation with a mocked pyodbc connection.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from src.backends.access import AccessBackend
+
+
+@pytest.fixture
+def backend():
+    """AccessBackend wired to a mock connection."""
+    b = AccessBackend("test.accdb")
+    b._connection = MagicMock()
+    return b
+
+
+def cursor_of(backend):
+    return backend._connection.cursor.return_value
+
+
+class TestUpdateMany:
+    """Test batched updates."""
+
+    def test_single_statement_per_chunk(self, backend):
+        cursor = cursor_of(backend)
+        cursor.rowcount = 2
+        backend.UPDATE_CHUNK_SIZE = 2
+
+        updated = backend.update_many("snDatabase", [1, 2, 3], {"fldAlbum": "X"}, primary_key_column="AUID")
+
+        assert cursor.execute.call_count == 2
+        query, params = cursor.execute.call_args_list[0][0]
+        assert query == "UPDATE [snDatabase] SET [fldAlbum] = ? WHERE [AUID] IN (?, ?)"
+        assert params == ["X", 1, 2]
+        assert updated == 4
+        backend._connection.commit.assert_called_once()
+
+    def test_rolls_back_on_error(self, backend):
+        cursor_of(backend).execute.side_effect = Exception("locked")
+
+        with pytest.raises(Exception):
+            backend.update_many("snDatabase", [1], {"fldAlbum": "X"}, primary_key_column="AUID")
+
+        backend._connection.rollback.assert_called_once()
+        backend._connection.commit.assert_not_called()
+
+    def test_nothing_to_do(self, backend):
+        assert backend.update_many("snDatabase", [], {"fldAlbum": "X"}) == 0
+        assert backend.update_many("snDatabase", [1], {}) == 0
+
+
+class TestIterColumn:
+    """Test single-column streaming."""
+
+    def test_yields_scalars_in_batches(self, backend):
+        cursor = cursor_of(backend)
+        cursor.fetchmany.side_effect = [[("a",), ("b",)], [("c",)], []]
+
+        values = list(backend.iter_column("snDatabase", "fldFilename", batch_size=2))
+
+        assert values == ["a", "b", "c"]
+        cursor.execute.assert_called_once_with("SELECT [fldFilename] FROM [snDatabase]")
+        assert cursor.arraysize == 2
+        cursor.close.assert_called_once()
+
+
+class TestIterRows:
+    """Test whole-row streaming."""
+
+    def test_yields_dicts_in_batches(self, backend):
+        cursor = cursor_of(backend)
+        cursor.description = [("AUID",), ("fldTitle",)]
+        cursor.fetchmany.side_effect = [[(1, "a"), (2, "b")], [(3, "c")], []]
+
+        rows = list(backend.iter_rows("snDatabase", columns=["AUID", "fldTitle"], batch_size=2))
+
+        assert rows == [{"AUID": 1, "fldTitle": "a"}, {"AUID": 2, "fldTitle": "b"}, {"AUID": 3, "fldTitle": "c"}]
+        cursor.execute.assert_called_once_with("SELECT [AUID], [fldTitle] FROM [snDatabase]")
+        cursor.fetchall.assert_not_called()
+        cursor.close.assert_called_once()
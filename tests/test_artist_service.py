@@ -0,0 +1,48 @@
+"""
+Tests for ArtistService search caching.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from src.services.artist_service import ArtistService
+
+
+class TestArtistSearch:
+    """Test that autocomplete searches are cached until an artist changes."""
+
+    @pytest.fixture
+    def mock_backend(self):
+        backend = MagicMock()
+        backend.search.return_value = [
+            {"AUID": 1, "fldName": "The Beatles"},
+            {"AUID": 2, "fldName": "Beat Happening"},
+        ]
+        backend.fetch.return_value = []
+        return backend
+
+    @pytest.fixture
+    def service(self, mock_backend):
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        return ArtistService(mock_backend, registry)
+
+    def test_keystrokes_share_one_query(self, service, mock_backend):
+        service.search("be")
+        service.search("Bea")
+        results = service.search("beatles")
+
+        assert mock_backend.search.call_count == 1
+        assert [(r["AUID"], r["fldName"]) for r in results] == [(1, "The Beatles")]
+
+    def test_backend_error_propagates(self, service, mock_backend):
+        mock_backend.search.side_effect = RuntimeError("ODBC link failure")
+
+        with pytest.raises(RuntimeError):
+            service.search("beat")
+
+    def test_create_invalidates_search(self, service, mock_backend):
+        service.search("beat")
+        service.create("Beatnik")
+        service.search("beat")
+
+        assert mock_backend.search.call_count == 2
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import MagicMock, patch
-from src.utils.audio import AudioMetadata
+from src.utils.audio import AudioMetadata, _NoTags
 from src.models.song import SongID3
 from mutagen import MutagenError
 
@@ -12,9 +12,22 @@ def test_song_length(mock_mp3):
     
     duration = AudioMetadata.song_length("test.mp3")
     
-    mock_mp3.assert_called_with("test.mp3")
+    mock_mp3.assert_called_with("test.mp3", ID3=_NoTags)
     assert duration == 120.5
 
+def test_song_length_skips_tags(tmp_path):
+    """Duration reads don't parse the ID3 tag."""
+    from mutagen.mp3 import MP3
+    frame = bytes([0xFF, 0xFB, 0x90, 0x00]) + bytes(413)  # 128kbps, 44.1kHz, 417 bytes
+    path = tmp_path / "a.mp3"
+    path.write_bytes(frame * 20)
+
+    audio = MP3(str(path), ID3=_NoTags)
+
+    assert audio.tags is None
+    assert audio.info.length > 0
+    assert AudioMetadata.song_length(str(path)) == audio.info.length
+
 @patch('src.utils.audio.MP3')
 def test_get_tag(mock_mp3):
     """Test retrieving tags."""
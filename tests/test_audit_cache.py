@@ -0,0 +1,40 @@
+"""
+Tests for the disk-backed audit result cache.
+"""
+
+import gc
+
+from src.services import audit_cache
+from src.services.audit_cache import AuditCache
+
+
+class TestAuditCache:
+    """Test storing and expiring audit results."""
+
+    def test_roundtrip_across_instances(self, tmp_path):
+        path = str(tmp_path / "audit_cache.db")
+        cache = AuditCache(path)
+        cache["app"] = {"total": 2, "missing": [{"id": 1}]}
+        cache["app_untracked"] = []
+        cache.close()
+
+        # A second process opening the same file sees the results
+        other = AuditCache(path)
+        assert other.get("app") == {"total": 2, "missing": [{"id": 1}]}
+        assert other.get("app_untracked") == []
+        assert other.get("unknown") is None
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        cache = AuditCache(str(tmp_path / "audit_cache.db"), ttl=-1)
+        cache["app"] = {"total": 1}
+
+        assert cache.get("app") is None
+
+    def test_exit_hook_does_not_keep_instances_alive(self, tmp_path):
+        path = str(tmp_path / "audit_cache.db")
+        cache = AuditCache(path)
+        assert cache in audit_cache._instances
+
+        del cache
+        gc.collect()
+        assert not any(c.db_path == path for c in audit_cache._instances)
@@ -82,3 +82,14 @@ def test_save_query_error(clean_config):
         assert isinstance(args[0], PermissionError)
         assert args[1] == "Saving last query"
 
+
+def test_genre_rule_set_follows_reload(clean_config):
+    cfg = Config()
+    assert "rock" in cfg.genre_rule_set("no_year_subfolder")
+    assert cfg.genre_rule_set("no_year_subfolder") is cfg.genre_rule_set("no_year_subfolder")
+    assert cfg.genre_rule_set("missing") == frozenset()
+
+    with open(clean_config, 'w') as f:
+        json.dump({"genre_rules": {"no_year_subfolder": ["metal"]}}, f)
+    cfg.reload()
+    assert cfg.genre_rule_set("no_year_subfolder") == frozenset({"metal"})
@@ -1,7 +1,7 @@
 import pytest
 import pyodbc
 from unittest.mock import MagicMock, patch
-from src.core.database import Database
+from src.core.database import Database, SongQuery
 
 @pytest.fixture
 def mock_cursor():
@@ -129,3 +129,151 @@ def test_execute_no_params(db_instance, mock_cursor):
     # We will invoke private method _execute directly for coverage.
     db_instance._execute("UPDATE snDatabase SET fldTitle = 'Fixed'")
     mock_cursor.execute.assert_called_with("UPDATE snDatabase SET fldTitle = 'Fixed'")
+
+# -- Batched Fetch --
+
+def test_iter_songs_yields_batches(db_instance, mock_cursor, mock_connection):
+    mock_cursor.fetchmany.side_effect = [[("a",), ("b",)], [("c",)], []]
+    batches = list(db_instance.iter_songs("fldArtistName", "Abba", False, batch_size=2))
+    assert batches == [[("a",), ("b",)], [("c",)]]
+    mock_cursor.fetchmany.assert_called_with(2)
+    args = mock_cursor.execute.call_args[0]
+    assert "WHERE fldArtistName LIKE ?" in args[0]
+    assert args[1] == ('%Abba%',)
+    mock_connection.close.assert_called_once()
+
+def test_iter_all_songs_closes_when_abandoned(db_instance, mock_cursor, mock_connection):
+    mock_cursor.fetchmany.return_value = [("a",)]
+    batches = db_instance.iter_all_songs()
+    assert next(batches) == [("a",)]
+    batches.close()
+    mock_cursor.close.assert_called_once()
+    mock_connection.close.assert_called_once()
+
+# -- SongQuery --
+
+def test_song_query_keeps_ids():
+    rows = [tuple([i] + [None] * 19 + [f"C:\\{i}.mp3"]) for i in (7, 9)]
+    songs = SongQuery(rows[:1])
+    songs.extend(rows[1:])
+    assert len(songs) == 2
+    assert list(songs.ids) == [7, 9]
+    assert not SongQuery()
+
+def test_fetch_song(db_instance, mock_cursor):
+    mock_cursor.fetchall.return_value = [(5, "Abba")]
+    assert db_instance.fetch_song(5) == (5, "Abba")
+    args = mock_cursor.execute.call_args[0]
+    assert "WHERE AUID = ?" in args[0]
+    assert args[1] == (5,)
+    mock_cursor.fetchall.return_value = []
+    assert db_instance.fetch_song(6) is None
+
+# -- In-memory Mirror --
+
+@pytest.fixture
+def mirrored_db(mock_cursor, mock_connection):
+    import datetime
+    mock_cursor.description = [("AUID", int), ("fldArtistName", str), ("fldAdded", datetime.datetime)]
+    mock_cursor.fetchmany.side_effect = [
+        [(1, "Čola", datetime.datetime(2020, 1, 2, 3, 4)), (2, "Abba", None)],
+        [],
+    ]
+    with patch('src.core.database.connect', return_value=mock_connection):
+        db = Database("fake.mdb", "snDatabase")
+        db._mirror_pending = []
+        db._build_mirror()
+        yield db
+
+def test_mirror_serves_reads(mirrored_db, mock_cursor):
+    import datetime
+    mock_cursor.execute.reset_mock()
+    assert mirrored_db.fetch_songs("fldArtistName", "čol", False) == [
+        (1, "Čola", datetime.datetime(2020, 1, 2, 3, 4))
+    ]
+    assert mirrored_db.fetch_songs("fldArtistName", "abba", True) == [(2, "Abba", None)]
+    # '=' folds non-ASCII letters too, as Access does
+    assert [r[0] for r in mirrored_db.fetch_songs("fldArtistName", "ČOLA", True)] == [1]
+    assert [len(b) for b in mirrored_db.iter_all_songs(batch_size=1)] == [1, 1]
+    mock_cursor.execute.assert_not_called()
+
+def test_mirror_numeric_equals_with_text_value(mock_cursor, mock_connection):
+    mock_cursor.description = [("AUID", int), ("fldYear", int)]
+    mock_cursor.fetchmany.side_effect = [[(1, 1999), (2, 2001)], []]
+    with patch('src.core.database.connect', return_value=mock_connection):
+        db = Database("fake.mdb", "snDatabase")
+        db._mirror_pending = []
+        db._build_mirror()
+    mock_cursor.execute.reset_mock()
+    # The query window passes the Entry text, not an int
+    assert db.fetch_songs("fldYear", "1999", True) == [(1, 1999)]
+    mock_cursor.execute.assert_not_called()
+
+def test_mirror_skipped_for_single_song(mirrored_db, mock_cursor):
+    mock_cursor.fetchall.return_value = [(2, "Abba (edited elsewhere)", None)]
+    assert mirrored_db.fetch_song(2)[1] == "Abba (edited elsewhere)"
+    assert "WHERE AUID = ?" in mock_cursor.execute.call_args[0][0]
+
+def test_mirror_applies_writes(mirrored_db, mock_cursor):
+    mirrored_db.update_song_fields(2, {"fldArtistName": "ABBA"})
+    assert "UPDATE snDatabase" in mock_cursor.execute.call_args[0][0]
+    assert mirrored_db.fetch_songs("AUID", 2, True)[0][1] == "ABBA"
+    mirrored_db.delete_song(1)
+    assert mirrored_db.fetch_songs("AUID", 1, True) == []
+
+def test_expired_mirror_is_rebuilt(mirrored_db, mock_cursor):
+    mirrored_db._mirror_built -= 3600
+    mock_cursor.fetchall.return_value = [(2, "Abba", None)]
+    with patch.object(mirrored_db, "_start_mirror_build") as start:
+        assert mirrored_db.fetch_songs("fldArtistName", "abba", True) == [(2, "Abba", None)]
+    start.assert_called_once()
+    assert mirrored_db._mirror is None
+    # Writes made while the new copy is built are kept for replay
+    mirrored_db.update_song_filename(2, "a.mp3")
+    assert len(mirrored_db._mirror_pending) == 1
+
+def test_mirror_replays_writes_made_while_copying(mock_cursor, mock_connection):
+    mock_cursor.description = [("AUID", int), ("fldArtistName", str)]
+    mock_cursor.fetchmany.side_effect = [[(1, "Old")], []]
+    with patch('src.core.database.connect', return_value=mock_connection):
+        db = Database("fake.mdb", "snDatabase")
+        db._mirror_pending = []
+        db.update_song_fields(1, {"fldArtistName": "New"})
+        db._build_mirror()
+    assert db.fetch_songs("AUID", 1, True) == [(1, "New")]
+
+def test_song_query_text_is_reused(db_instance):
+    first, params = db_instance._songs_query("fldTitle", "x", False)
+    second, _ = db_instance._songs_query("fldTitle", "y", False)
+    assert first is second
+    assert params == ('%x%',)
+
+# -- Connection Pool --
+
+def test_connection_reused_within_thread(db_instance, mock_connection):
+    with patch('src.core.database.connect', return_value=mock_connection) as mock_connect:
+        db_instance.fetch_songs("Artist", "Abba", False)
+        db_instance.update_song_filename(1, "a.mp3")
+        assert mock_connect.call_count == 1
+    mock_connection.close.assert_not_called()
+
+def test_connection_per_thread():
+    import threading
+    with patch('src.core.database.connect', side_effect=lambda *_: MagicMock()) as mock_connect:
+        db = Database("fake.mdb", "snDatabase")
+        conns = [db._get_connection()]
+        worker = threading.Thread(target=lambda: conns.append(db._get_connection()))
+        worker.start()
+        worker.join()
+        assert mock_connect.call_count == 2
+        assert conns[0] is not conns[1]
+        db.close()
+        for conn in conns:
+            conn.close.assert_called_once()
+
+def test_connection_dropped_after_error(db_instance, mock_cursor, mock_connection):
+    mock_cursor.execute.side_effect = pyodbc.Error("Link lost")
+    with pytest.raises(pyodbc.Error):
+        db_instance.fetch_songs("Artist", "Abba", False)
+    mock_connection.close.assert_called_once()
+    assert db_instance._local.conn is None
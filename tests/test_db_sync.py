@@ -0,0 +1,24 @@
+from unittest.mock import patch
+from src.utils import db_sync
+from src.utils.db_sync import sync_test_db
+
+
+def test_sync_copies_then_skips_unchanged(tmp_path, monkeypatch):
+    """A second sync of an unchanged live DB doesn't copy it again."""
+    monkeypatch.setattr(db_sync.Path, 'home', lambda: tmp_path)
+    monkeypatch.setattr(db_sync.os, 'name', 'posix')
+    live = tmp_path / "live.accdb"
+    live.write_bytes(b"data")
+
+    path, copied = sync_test_db(str(live))
+    assert copied
+    assert (tmp_path / "Downloads" / "JZRS2DB-V5.accdb").read_bytes() == b"data"
+
+    with patch.object(db_sync.shutil, 'copy2') as mock_copy:
+        assert sync_test_db(str(live)) == (path, True)
+    mock_copy.assert_not_called()
+
+    # A changed live DB is copied again
+    live.write_bytes(b"new data")
+    sync_test_db(str(live))
+    assert (tmp_path / "Downloads" / "JZRS2DB-V5.accdb").read_bytes() == b"new data"
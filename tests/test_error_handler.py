@@ -30,6 +30,7 @@ def test_log_silent_creates_log_entry(temp_log_file):
     """Test that log_silent writes to log file."""
     test_error = ValueError("Test error")
     ErrorHandler.log_silent(test_error, "Test context")
+    ErrorHandler.flush()
     
     # Read log file
     assert temp_log_file.exists()
@@ -48,6 +49,7 @@ def test_log_silent_creates_log_entry(temp_log_file):
 def test_log_info_creates_log_entry(temp_log_file):
     """Test that log_info writes to log file."""
     ErrorHandler.log_info("Test info message", "Test context")
+    ErrorHandler.flush()
     
     # Read log file
     with open(temp_log_file, 'r') as f:
@@ -166,3 +168,58 @@ def test_critical_error_callback_color(temp_log_file):
     
     assert len(callback_calls) == 1
     assert callback_calls[0] == (1, "red")
+
+
+def test_read_errors_since(temp_log_file):
+    """Test reading only the entries appended after a known offset."""
+    ErrorHandler.log_silent(ValueError("Error 1"), "Context 1")
+    errors, offset = ErrorHandler.tail_errors(limit=10)
+    assert [e["message"] for e in errors] == ["Error 1"]
+    assert offset == ErrorHandler.log_size()
+
+    assert ErrorHandler.read_errors_since(offset) == ([], offset)
+
+    ErrorHandler.log_silent(ValueError("Error 2"), "Context 2")
+    ErrorHandler.flush()
+    with open(temp_log_file, 'a', encoding='utf-8') as f:
+        f.write('{"message": "half writ')  # Partial line is left for later
+    errors, new_offset = ErrorHandler.read_errors_since(offset)
+    assert [e["message"] for e in errors] == ["Error 2"]
+    assert new_offset < ErrorHandler.log_size()
+
+
+def test_tail_errors_reads_from_end_of_large_log(temp_log_file, monkeypatch):
+    """Test that large logs are tail-read and give the same result."""
+    monkeypatch.setattr(ErrorHandler, "TAIL_FULL_READ_SIZE", 256)
+    monkeypatch.setattr(ErrorHandler, "TAIL_CHUNK_SIZE", 64)
+    for i in range(50):
+        ErrorHandler.log_silent(ValueError(f"Error {i}"), f"Context {i}")
+
+    errors, offset = ErrorHandler.tail_errors(limit=3)
+    assert [e["message"] for e in errors] == ["Error 47", "Error 48", "Error 49"]
+    assert offset == temp_log_file.stat().st_size
+    assert ErrorHandler.get_recent_errors(limit=60)[0]["message"] == "Error 0"
+
+
+def test_log_burst_is_written_in_order(temp_log_file):
+    """Test that a burst of queued entries all reach the file, in order."""
+    for i in range(200):
+        ErrorHandler.log_silent(ValueError(f"Error {i}"), "Burst")
+    ErrorHandler.flush()
+
+    with open(temp_log_file, 'r') as f:
+        messages = [json.loads(line)["message"] for line in f]
+    assert messages == [f"Error {i}" for i in range(200)]
+
+
+def test_stack_trace_only_with_active_exception(temp_log_file):
+    """ERROR entries carry a trace only when raised from an except block."""
+    ErrorHandler._log_error_internal(Exception("no trace"), "", ErrorSeverity.ERROR)
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        ErrorHandler._log_error_internal(e, "", ErrorSeverity.ERROR)
+
+    plain, raised = ErrorHandler.get_recent_errors(2)
+    assert plain["stack_trace"] is None
+    assert "ValueError: boom" in raised["stack_trace"]
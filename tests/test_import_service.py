@@ -5,6 +5,7 @@ Tests duplicate detection, artist linking, genre/decade resolution,
 and the execute import flow.
 """
 
+import dataclasses
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
 from src.services.import_parser import (
@@ -113,6 +114,27 @@ class TestImportServicePreview:
         assert candidates[0].existing_song_id == 99
         assert candidates[0].existing_path == 'B:\\Old.mp3'
 
+    def test_conflict_falls_back_to_cached_record(self, import_service, mock_backend):
+        """Test that the cached row is used when the full record fetch fails."""
+        mock_backend.fetch.return_value = [
+            {'AUID': 99, 'fldArtistName': 'Madonna', 'fldTitle': 'Vogue',
+             'fldFilename': 'B:\\Old.mp3', 'fldYear': 1990, 'fldCat1a': 2}
+        ]
+        mock_backend.fetch_one.side_effect = Exception("connection lost")
+
+        with patch.object(import_service.parser, 'parse') as mock_parse:
+            mock_parse.return_value = ParsedMetadata(
+                artist="Madonna", title="Vogue", source=ParseSource.ID3, confidence=0.9
+            )
+            candidates = import_service.preview_import(["C:\\New\\Madonna - Vogue.mp3"])
+
+        existing = candidates[0].existing_data
+        assert candidates[0].status == ImportStatus.CONFLICT
+        assert existing['artist'] == 'Madonna'
+        assert existing['year'] == 1990
+        assert existing['genre_ids'] == [2, 0, 0]
+        assert existing['path'] == 'B:\\Old.mp3'
+
     def test_conflict_detection_case_insensitive(self, import_service, mock_backend):
         """Test that artist+title comparison is case-insensitive."""
         mock_backend.fetch.return_value = [
@@ -138,6 +160,19 @@ class TestImportServicePreview:
         assert len(candidates) == 1
         assert candidates[0].status == ImportStatus.NEW
 
+    def test_unreadable_file_becomes_error_candidate(self, import_service):
+        """Test that analysis failures produce independent error candidates."""
+        with patch.object(import_service.parser, 'parse') as mock_parse:
+            mock_parse.side_effect = [IOError("bad header"), IOError("locked")]
+            candidates = import_service.preview_import(["C:\\Music\\a.mp3", "C:\\Music\\b.mp3"])
+
+        assert [c.file_path for c in candidates] == ["C:\\Music\\a.mp3", "C:\\Music\\b.mp3"]
+        assert candidates[0].metadata.artist == "Error"
+        assert candidates[0].metadata.title == "bad header"
+        assert candidates[1].metadata.title == "locked"
+        assert candidates[0].status == ImportStatus.NEW
+        assert candidates[0].genre_ids is not candidates[1].genre_ids
+
     # ─────────────────────────────────────────────────────────────
     # Artist Linking Tests
     # ─────────────────────────────────────────────────────────────
@@ -531,6 +566,13 @@ class TestJazlerDefaults:
         assert custom.fldPriority == 10
         assert custom.fldFadeDur == 5.0
 
+    def test_defaults_are_immutable(self):
+        """Test that shared defaults cannot be mutated between imports."""
+        defaults = JazlerDefaults()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            defaults.fldPriority = 1
+
 
 class TestCacheManagement:
     """Test cache management functionality."""
@@ -0,0 +1,152 @@
+"""
+Tests for LookupService with a mocked backend.
+
+Covers read caching and cache invalidation on writes.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from src.services.lookup_service import LookupService
+
+
+class TestLookupServiceCache:
+    """Test the in-memory read cache."""
+
+    @pytest.fixture
+    def mock_backend(self):
+        """Create a mock database backend."""
+        backend = MagicMock()
+        backend.fetch.return_value = [
+            {"AUID": 2, "Name": "pop"},
+            {"AUID": 1, "Name": "Dance"},
+        ]
+        backend.fetch_one.return_value = {"AUID": 1, "Name": "Dance"}
+        backend.update.return_value = True
+        return backend
+
+    @pytest.fixture
+    def service(self, mock_backend):
+        """Create LookupService with an empty registry."""
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        return LookupService(mock_backend, registry)
+
+    def test_get_all_is_cached(self, service, mock_backend):
+        """Test that repeated reads hit the backend once."""
+        first = service.get_all("snGenre", "Name")
+        second = service.get_all("snGenre", "Name")
+
+        assert mock_backend.fetch.call_count == 1
+        assert [r.get("Name") for r in second] == ["Dance", "pop"]
+        assert first is not second
+
+    def test_get_by_id_is_cached(self, service, mock_backend):
+        """Test that single-entry reads are cached."""
+        service.get_by_id("snGenre", 1)
+        record = service.get_by_id("snGenre", 1)
+
+        assert mock_backend.fetch_one.call_count == 1
+        assert record.get("Name") == "Dance"
+
+    def test_cached_records_are_not_shared(self, service, mock_backend):
+        """Test that editing a returned record doesn't change the cache."""
+        service.get_all("snGenre", "Name")[0]["Name"] = "Edited"
+        service.get_by_id("snGenre", 1)["Name"] = "Edited"
+
+        assert service.get_all("snGenre", "Name")[0].get("Name") == "Dance"
+        assert service.get_by_id("snGenre", 1).get("Name") == "Dance"
+        assert mock_backend.fetch.call_count == 1
+        assert mock_backend.fetch_one.call_count == 1
+
+    def test_fetch_does_not_hold_cache_lock(self, service, mock_backend):
+        """Test that a slow backend read doesn't block other cache users."""
+        def fetch(*args, **kwargs):
+            assert service._cache_lock.acquire(blocking=False)
+            service._cache_lock.release()
+            return [{"AUID": 1, "Name": "Dance"}]
+        mock_backend.fetch.side_effect = fetch
+
+        assert [r.get("Name") for r in service.get_all("snGenre")] == ["Dance"]
+
+    def test_update_invalidates_table(self, service, mock_backend):
+        """Test that writes drop cached reads for the table."""
+        service.get_all("snGenre")
+        service.get_by_id("snGenre", 1)
+
+        service.update("snGenre", 1, {"Name": "House"})
+        service.get_all("snGenre")
+        service.get_by_id("snGenre", 1)
+
+        assert mock_backend.fetch.call_count == 2
+        assert mock_backend.fetch_one.call_count == 2
+
+    def test_expired_entries_are_refetched(self, service, mock_backend):
+        """Test that entries older than CACHE_TTL are refetched."""
+        service.CACHE_TTL = 0
+        service.get_all("snGenre")
+        service.get_all("snGenre")
+
+        assert mock_backend.fetch.call_count == 2
+
+    def test_get_all_raw_returns_plain_rows(self, service, mock_backend):
+        """Test that raw reads skip Record wrapping."""
+        table_def, rows = service.get_all_raw("snGenre")
+
+        assert table_def is None
+        assert rows == mock_backend.fetch.return_value
+
+
+class TestLookupServiceSearch:
+    """Test the search result cache."""
+
+    @pytest.fixture
+    def mock_backend(self):
+        backend = MagicMock()
+        backend.search.return_value = [
+            {"AUID": 1, "Name": "The Beatles"},
+            {"AUID": 2, "Name": "Beat Happening"},
+        ]
+        return backend
+
+    @pytest.fixture
+    def service(self, mock_backend):
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        return LookupService(mock_backend, registry)
+
+    def test_repeated_query_is_cached(self, service, mock_backend):
+        service.search("snArtist", "Name", "Beat")
+        service.search("snArtist", "Name", "beat")
+
+        assert mock_backend.search.call_count == 1
+
+    def test_expired_query_is_refreshed_once(self, service, mock_backend):
+        with patch("src.services.lookup_service.time.monotonic", return_value=100.0):
+            service.search("snArtist", "Name", "beat")
+        later = 100.0 + service.CACHE_TTL + 1
+        with patch("src.services.lookup_service.time.monotonic", return_value=later):
+            for _ in range(3):
+                service.search("snArtist", "Name", "beat")
+
+        assert mock_backend.search.call_count == 2
+        assert service._search_cache[("snArtist", "Name", "beat")][0] == later
+
+    def test_narrower_query_filters_cached_superset(self, service, mock_backend):
+        service.search("snArtist", "Name", "beat")
+        results = service.search("snArtist", "Name", "beatles")
+
+        assert mock_backend.search.call_count == 1
+        assert [r.get("AUID") for r in results] == [1]
+
+    def test_wildcard_query_goes_to_backend(self, service, mock_backend):
+        service.search("snArtist", "Name", "beat")
+        service.search("snArtist", "Name", "beat_")
+
+        assert mock_backend.search.call_count == 2
+
+    def test_write_invalidates_search(self, service, mock_backend):
+        service.search("snArtist", "Name", "beat")
+        service.update("snArtist", 1, {"Name": "Beatles"})
+        service.search("snArtist", "Name", "beat")
+
+        assert mock_backend.search.call_count == 2
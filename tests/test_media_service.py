@@ -0,0 +1,143 @@
+"""
+Tests for MediaService path handling.
+
+Covers drive-map resolution and filename sanitizing.
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock
+from src.services.media_service import MediaService
+
+
+class TestResolvePath:
+    """Test database path -> local path resolution."""
+
+    @pytest.fixture
+    def service(self):
+        return MediaService({"B:": "Z:", "\\\\server\\music": "M:"})
+
+    def test_maps_drive_case_insensitive(self, service):
+        assert service.resolve_path("b:\\Songs\\A.mp3") == "Z:\\Songs\\A.mp3"
+
+    def test_maps_longer_prefix(self, service):
+        assert service.resolve_path("\\\\SERVER\\Music\\A.mp3") == "M:\\A.mp3"
+
+    def test_unmapped_path_unchanged(self, service):
+        assert service.resolve_path("C:\\A.mp3") == "C:\\A.mp3"
+
+    def test_empty_path(self, service):
+        assert service.resolve_path("") == ""
+
+    def test_longest_prefix_wins(self):
+        service = MediaService({"B:": "Z:", "B:\\Jingles": "J:"})
+        assert service.resolve_path("B:\\Jingles\\x.mp3") == "J:\\x.mp3"
+        assert service.resolve_path("B:\\Songs\\x.mp3") == "Z:\\Songs\\x.mp3"
+
+
+class TestRenameFile:
+    """Test renaming maps the new path back to the database drive."""
+
+    def test_rename_reverses_drive_map(self, tmp_path):
+        (tmp_path / "old.mp3").write_bytes(b"")
+        local_root = str(tmp_path)
+        service = MediaService({"B:": local_root})
+
+        new_path = service.rename_file("B:/old.mp3", "Artist - Title")
+
+        assert new_path.lower().startswith("b:")
+        assert new_path.endswith("Artist - Title.mp3")
+        assert (tmp_path / "Artist - Title.mp3").exists()
+
+
+class TestScanFiles:
+    """Test recursive MP3 discovery under base_path."""
+
+    def test_finds_mp3_recursively(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "one.MP3").write_bytes(b"")
+        (tmp_path / "two.mp3").write_bytes(b"")
+        (tmp_path / "cover.jpg").write_bytes(b"")
+
+        files = MediaService(base_path=str(tmp_path)).scan_files()
+
+        assert sorted(os.path.basename(f) for f in files) == ["one.MP3", "two.mp3"]
+
+    def test_missing_base_path(self, tmp_path):
+        assert list(MediaService(base_path=str(tmp_path / "nope")).scan_files()) == []
+
+
+class TestSanitizeFilename:
+    """Test filename sanitizing."""
+
+    def test_replaces_invalid_characters(self):
+        service = MediaService()
+        assert service.sanitize_filename(' AC/DC: "Back" <In> \\Black|?* ') == 'AC_DC_ _Back_ _In_ _Black___'
+
+
+class TestFileInfo:
+    """Test file info lookups."""
+
+    def test_existing_file(self, tmp_path):
+        song = tmp_path / "Song.MP3"
+        song.write_bytes(b"12345")
+
+        info = MediaService().get_file_info(str(song))
+
+        assert info["exists"] is True
+        assert info["vfs_status"] == "live"
+        assert info["size_bytes"] == 5
+        assert info["extension"] == ".mp3"
+
+    def test_missing_dir_is_remembered(self, tmp_path):
+        service = MediaService()
+        missing = str(tmp_path / "gone" / "a.mp3")
+
+        assert service.get_file_info(missing)["exists"] is False
+        assert os.path.dirname(missing) in service._known_missing_dirs
+
+        # Directory appears again: honoured once the TTL has passed
+        (tmp_path / "gone").mkdir()
+        (tmp_path / "gone" / "a.mp3").write_bytes(b"")
+        service.MISSING_DIR_TTL = 0
+        assert service.exists(missing) is True
+
+    def test_missing_dirs_are_capped(self, tmp_path):
+        service = MediaService()
+        service.MISSING_DIR_LIMIT = 2
+
+        for name in ("a", "b", "c"):
+            service.exists(str(tmp_path / name / "x.mp3"))
+
+        assert len(service._known_missing_dirs) <= 2
+        assert str(tmp_path / "c") in service._known_missing_dirs
+
+    def test_batch_preserves_order(self, tmp_path):
+        (tmp_path / "a.mp3").write_bytes(b"1")
+        paths = [str(tmp_path / "a.mp3"), str(tmp_path / "missing.mp3")]
+
+        infos = MediaService().get_file_info_batch(paths)
+
+        assert [i["db_path"] for i in infos] == paths
+        assert [i["exists"] for i in infos] == [True, False]
+
+
+class TestNoDriveMap:
+    """Test behaviour without any drive mapping configured."""
+
+    def test_resolve_path_passthrough(self):
+        assert MediaService().resolve_path("B:\\Songs\\A.mp3") == "B:\\Songs\\A.mp3"
+
+    def test_virtual_lookup_checks_path_once(self):
+        vfs = MagicMock()
+        vfs.exists.return_value = True
+        snapshot = MagicMock()
+        snapshot.get_metadata.return_value = {"title": "T"}
+        service = MediaService(vfs_service=vfs, snapshot_service=snapshot)
+
+        info = service.get_file_info("/no/such/dir/a.mp3")
+
+        assert info["vfs_status"] == "virtual"
+        assert info["metadata"] == {"title": "T"}
+        vfs.exists.assert_called_once_with("/no/such/dir/a.mp3")
+        snapshot.get_metadata.assert_called_once_with("/no/such/dir/a.mp3")
@@ -0,0 +1,57 @@
+"""
+Tests for the generic Record model.
+"""
+
+import copy
+import pytest
+from src.core.models.record import Record, RecordSet
+from src.core.schema.definition import TableDefinition, FieldDefinition
+
+
+def make_record():
+    schema = TableDefinition(
+        name="snDatabase",
+        columns=[FieldDefinition("fldArtistName", display_name="Artist"), FieldDefinition("AUID")],
+        primary_key="AUID",
+    )
+    return Record({"fldArtistName": "Queen", "AUID": 7}, schema)
+
+
+def test_access_by_column_display_and_short_name():
+    record = make_record()
+    assert record["fldArtistName"] == "Queen"
+    assert record.artist == "Queen"
+    assert record.artistname == "Queen"
+    assert record["auid"] == 7
+    assert record.primary_key == 7
+
+
+def test_changes_are_tracked():
+    record = make_record()
+    record.artist = "Queen + Adam Lambert"
+    assert record.changes == {"fldArtistName": "Queen + Adam Lambert"}
+
+
+def test_copy_keeps_data():
+    record = make_record()
+    clone = copy.copy(record)
+    assert clone.artist == "Queen"
+
+
+def test_recordset_column_resolves_display_name():
+    schema = make_record()._schema
+    records = RecordSet([Record({"fldArtistName": name, "AUID": i}, schema) for i, name in enumerate(["A", "B", None])])
+
+    assert records.column("artist") == ["A", "B", None]
+    assert RecordSet([]).column("artist") == []
+    with pytest.raises(KeyError):
+        records.column("nope")
+
+
+def test_recordset_columnar():
+    schema = make_record()._schema
+    records = RecordSet([Record({"fldArtistName": name, "AUID": i}, schema) for i, name in enumerate(["A", "B"])])
+
+    assert records.columnar() == {"fldArtistName": ["A", "B"], "AUID": [0, 1]}
+    assert records.columnar(["artist"]) == {"artist": ["A", "B"]}
+    assert RecordSet([]).columnar(["artist"]) == {"artist": []}
@@ -0,0 +1,77 @@
+"""
+Tests for SchemaSettingsService persistence.
+"""
+
+import gc
+import json
+from src.services import schema_settings_service
+from src.services.schema_settings_service import SchemaSettingsService
+
+
+class TestDebouncedSave:
+    """Test that toggles are coalesced into a single write."""
+
+    def test_toggles_write_once_on_flush(self, tmp_path):
+        config = tmp_path / "schema_settings.json"
+        settings = SchemaSettingsService(str(config))
+        settings.SAVE_DELAY = 60
+
+        settings.toggle_table_visibility("snDatabase")
+        settings.toggle_field_visibility("snDatabase", "fldComments")
+        settings.toggle_show_hidden()
+        assert not config.exists()
+
+        settings.flush()
+
+        data = json.loads(config.read_text())
+        assert data["hidden_tables"] == ["snDatabase"]
+        assert data["hidden_fields"] == {"snDatabase": ["fldComments"]}
+        assert data["show_hidden"] is True
+
+    def test_reload_roundtrip(self, tmp_path):
+        config = tmp_path / "schema_settings.json"
+        settings = SchemaSettingsService(str(config))
+        settings.toggle_field_visibility("snArtist", "AUID")
+        settings.flush()
+
+        reloaded = SchemaSettingsService(str(config))
+        assert reloaded.is_field_hidden("snArtist", "AUID")
+        assert not reloaded.is_field_hidden("snArtist", "Name")
+
+    def test_exit_flush_does_not_keep_instances_alive(self, tmp_path):
+        config = tmp_path / "schema_settings.json"
+        settings = SchemaSettingsService(str(config))
+        assert settings in schema_settings_service._instances
+
+        del settings
+        gc.collect()
+        assert not any(s.config_path == str(config) for s in schema_settings_service._instances)
+
+    def test_exit_flush_writes_pending_save(self, tmp_path):
+        config = tmp_path / "schema_settings.json"
+        settings = SchemaSettingsService(str(config))
+        settings.SAVE_DELAY = 60
+        settings.toggle_show_hidden()
+
+        schema_settings_service._flush_all()
+
+        assert json.loads(config.read_text())["show_hidden"] is True
+
+
+class TestHiddenLookup:
+    """Test is_*_hidden reflects toggles immediately."""
+
+    def test_toggle_updates_lookup(self, tmp_path):
+        settings = SchemaSettingsService(str(tmp_path / "schema_settings.json"))
+        settings.SAVE_DELAY = 60
+
+        assert not settings.is_table_hidden("snGenre")
+        settings.toggle_table_visibility("snGenre")
+        assert settings.is_table_hidden("snGenre")
+        settings.toggle_table_visibility("snGenre")
+        assert not settings.is_table_hidden("snGenre")
+
+        settings.toggle_field_visibility("snGenre", "Name")
+        assert settings.is_field_hidden("snGenre", "Name")
+        assert not settings.is_field_hidden("snDecade", "Name")
+        settings.flush()
@@ -0,0 +1,122 @@
+"""
+Tests for SnapshotService incremental indexing.
+"""
+
+import json
+import os
+from unittest.mock import patch
+from mutagen.id3 import ID3, TPE1, TIT2, TDRC, TCON
+from src.services.snapshot_service import SnapshotService, read_file_metadata
+
+
+class TestIncrementalSnapshot:
+    """Test that re-indexing reuses and prunes cached entries."""
+
+    def _write_cache(self, path, data):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_unchanged_file_keeps_cached_entry(self, tmp_path):
+        song = tmp_path / "music" / "a.mp3"
+        song.parent.mkdir()
+        song.write_bytes(b"not really an mp3")
+        st = os.stat(song)
+
+        cache_file = tmp_path / "snapshot.json"
+        self._write_cache(cache_file, {
+            str(song).lower(): {"title": "Cached", "_stat": [st.st_size, st.st_mtime_ns]}
+        })
+
+        service = SnapshotService(str(cache_file))
+        service.generate_snapshot([str(song.parent)], max_workers=1)
+
+        assert service.get_metadata(str(song))["title"] == "Cached"
+
+    def test_removed_file_is_pruned(self, tmp_path):
+        music = tmp_path / "music"
+        music.mkdir()
+        gone = str(music / "gone.mp3").lower()
+        elsewhere = "z:\\other\\b.mp3"
+
+        cache_file = tmp_path / "snapshot.json"
+        self._write_cache(cache_file, {
+            gone: {"title": "Gone", "_stat": [1, 1]},
+            elsewhere: {"title": "Other", "_stat": [1, 1]},
+        })
+
+        service = SnapshotService(str(cache_file))
+        service.generate_snapshot([str(music)], max_workers=1)
+
+        assert service.get_metadata(gone) is None
+        assert service.get_metadata(elsewhere)["title"] == "Other"
+
+
+class TestCacheIO:
+    """Test snapshot cache persistence."""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        cache_file = tmp_path / "snapshot.json"
+        service = SnapshotService(str(cache_file))
+        service.metadata_cache["c:\\a.mp3"] = {"artist": "Čović", "duration": 1.5, "_stat": [3, 4]}
+        service.save_cache()
+
+        loaded = SnapshotService(str(cache_file))
+        assert loaded.load_cache()
+        entry = loaded.get_metadata("C:\\A.mp3")
+        assert entry["artist"] == "Čović"
+        assert entry["duration"] == 1.5
+        assert entry["_stat"] == [3, 4]
+        assert len(loaded.metadata_cache) == 1
+
+    def test_save_bumps_version_only_with_changes(self, tmp_path):
+        service = SnapshotService(str(tmp_path / "snapshot.json"))
+        start = service.metadata_cache.version
+
+        service.metadata_cache["c:\\a.mp3"] = {"title": "A"}
+        service.save_cache()
+        service.save_cache()
+
+        assert service.metadata_cache.version == start + 1
+
+    def test_imports_legacy_json(self, tmp_path):
+        cache_file = tmp_path / "snapshot.json"
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"c:\\a.mp3": {"title": "Old"}}, f)
+
+        service = SnapshotService(str(cache_file))
+        assert service.load_cache()
+        assert service.get_metadata("c:\\a.mp3")["title"] == "Old"
+
+    def test_lookup_normalizes_path(self, tmp_path):
+        service = SnapshotService(str(tmp_path / "snapshot.json"))
+        service.metadata_cache[os.path.normcase(os.path.normpath("/music/a.mp3"))] = {"title": "A"}
+
+        assert service.get_metadata("/Music/sub/../A.MP3")["title"] == "A"
+
+
+class TestReadFileMetadata:
+    """Test tag extraction from parsed MP3 files."""
+
+    @patch('src.services.snapshot_service.MP3')
+    def test_reads_frames(self, mock_mp3):
+        tags = ID3()
+        tags.add(TPE1(encoding=3, text=["Artist", "Feat"]))
+        tags.add(TIT2(encoding=3, text=["Title"]))
+        tags.add(TDRC(encoding=3, text=["1999"]))
+        tags.add(TCON(encoding=3, text=["(17)"]))
+        audio = mock_mp3.return_value
+        audio.tags = tags
+        audio.info.length = 200.5
+        audio.info.bitrate = 320000
+        audio.info.sample_rate = 44100
+
+        metadata = read_file_metadata("x.mp3")
+
+        assert metadata == {
+            'artist': "Artist", 'title': "Title", 'album': None, 'year': "1999",
+            'genre': "Rock", 'duration': 200.5, 'bitrate': 320, 'sample_rate': 44100,
+        }
+
+    @patch('src.services.snapshot_service.MP3', side_effect=Exception("bad file"))
+    def test_unreadable_file(self, mock_mp3):
+        assert read_file_metadata("x.mp3") is None
@@ -209,3 +209,15 @@ def test_get_genre_id():
     
     assert Song.get_genre_id("Pop", rev_map) == 1
     assert Song.get_genre_id("Jazz", rev_map) == -1
+
+def test_update_genre_ids(genre_map, decade_map, tempo_map):
+    song = Song(create_dummy_db_record(), genre_map, decade_map, tempo_map)
+    song.genres_all = "pop, jazz"
+    song.update_genre_ids({"pop": 1, "rock": 2, "x": 0}, "x")
+    assert (song.genre_01_name, song.genre_01_id) == ("pop", 1)
+    assert (song.genre_02_name, song.genre_02_id) == ("jazz", -1)
+    assert (song.genre_03_name, song.genre_03_id) == ("x", 0)
+
+def test_same_path():
+    assert Song.same_path("Z:\\Songs\\Pop\\A.mp3", "z:\\songs\\pop\\a.mp3")
+    assert not Song.same_path("z:\\songs\\pop\\a.mp3", "z:\\songs\\rock\\a.mp3")
@@ -0,0 +1,308 @@
+"""
+Tests for SongService with a mocked backend.
+
+Covers bulk loading, bulk summaries and bulk updates.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from src.services.song_service import SongService
+
+
+def make_row(auid, **fields):
+    row = {"AUID": auid, "genre": 1, "decade": 2, "tempo": 3, "album": "A", "publisher": "P", "year": 1999}
+    row.update(fields)
+    return row
+
+
+class TestBulkOperations:
+    """Test multi-song loading and summaries."""
+
+    @pytest.fixture
+    def mock_backend(self):
+        backend = MagicMock()
+        backend.fetch_sql.return_value = []
+        return backend
+
+    @pytest.fixture
+    def service(self, mock_backend):
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        return SongService(mock_backend, registry)
+
+    def test_get_many_single_query_in_input_order(self, service, mock_backend):
+        mock_backend.fetch_sql.return_value = [make_row(2), make_row(1)]
+
+        songs = service.get_many([1, 2, 3])
+
+        assert [s.primary_key for s in songs] == [1, 2]
+        assert mock_backend.fetch_sql.call_count == 1
+        query, params = mock_backend.fetch_sql.call_args[0]
+        assert "IN (?,?,?)" in query
+        assert params == (1, 2, 3)
+
+    def test_get_many_chunks_large_selections(self, service, mock_backend):
+        service.IN_CLAUSE_CHUNK = 2
+        service.get_many([1, 2, 3, 4, 5])
+
+        assert mock_backend.fetch_sql.call_count == 3
+
+    def test_bulk_summary_marks_mixed_fields(self, service, mock_backend):
+        mock_backend.fetch_sql.return_value = [make_row(1), make_row(2, album="B"), make_row(3, year=2001)]
+
+        summary = service.get_bulk_summary([1, 2, 3])
+
+        assert summary["album"] == SongService.MIXED
+        assert summary["year"] == SongService.MIXED
+        assert summary["genre"] == 1
+        assert summary["publisher"] == "P"
+
+    def test_summarize_records_accepts_plain_list(self, service):
+        songs = [service._row_to_record(make_row(1)), service._row_to_record(make_row(2, tempo=4))]
+
+        summary = service.summarize_records(songs)
+
+        assert summary["tempo"] == SongService.MIXED
+        assert summary["decade"] == 2
+
+    def test_bulk_summary_empty(self, service):
+        assert service.get_bulk_summary([]) == {}
+
+    def test_perform_bulk_update_uses_batched_backend_call(self, service, mock_backend):
+        mock_backend.update_many.return_value = 3
+
+        assert service.perform_bulk_update([1, 2, 3], {"fldAlbum": "X"}) == 3
+        mock_backend.update_many.assert_called_once_with(
+            "snDatabase", [1, 2, 3], {"fldAlbum": "X"}, primary_key_column="AUID"
+        )
+
+    def test_perform_bulk_update_failure_returns_zero(self, service, mock_backend):
+        mock_backend.update_many.side_effect = Exception("locked")
+
+        assert service.perform_bulk_update([1], {"fldAlbum": "X"}) == 0
+
+
+class TestLookupMaps:
+    """Test loading of genre/decade/tempo maps."""
+
+    @pytest.fixture
+    def service(self):
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        return SongService(MagicMock(), registry)
+
+    def test_all_maps_loaded_in_one_query(self, service):
+        service.backend.fetch_sql.return_value = [
+            {"src": 0, "k": 1, "v": "Rock"},
+            {"src": 1, "k": 4, "v": "2000's"},
+            {"src": 2, "k": 2, "v": "Fast"},
+            {"src": 0, "k": None, "v": "junk"},
+        ]
+
+        assert service.genre_map == {0: "", 1: "Rock"}
+        assert service.decade_map == {0: "", 4: "2000's"}
+        assert service.tempo_map == {0: "", 2: "Fast"}
+        assert service.backend.fetch_sql.call_count == 1
+        assert "UNION ALL" in service.backend.fetch_sql.call_args[0][0]
+
+    def test_falls_back_to_per_table_loads(self, service):
+        service.backend.fetch_sql.side_effect = Exception("no UNION")
+        service.backend.fetch.return_value = [{"AUID": 1, "fldMusicType": "X"}]
+
+        assert service.genre_map == {0: "", 1: "X"}
+        assert service.backend.fetch.call_count == 3
+
+
+class TestSchemaDerivedLists:
+    """Test caching of schema-derived field lists."""
+
+    @pytest.fixture
+    def service(self):
+        from src.core.schema.definition import TableDefinition, FieldDefinition
+        schema = TableDefinition(
+            name="snDatabase",
+            columns=[
+                FieldDefinition("fldTitle", display_name="Title"),
+                FieldDefinition("fldArtistName", display_name="Artist"),
+                FieldDefinition("fldComments"),
+            ],
+            aliases={"artist": "fldArtistName"},
+        )
+        registry = MagicMock()
+        registry.get_table.return_value = schema
+        registry.get_grid_view.return_value = ["fldTitle", "missing"]
+        return SongService(MagicMock(), registry)
+
+    def test_searchable_fields_sorted_and_cached(self, service):
+        fields = service.get_searchable_fields()
+
+        assert fields == [("artist", "Artist"), ("fldTitle", "Title")]
+        assert service.get_searchable_fields() is fields
+
+    def test_grid_columns_cached_per_view(self, service):
+        cols = service.get_grid_columns("default")
+
+        assert [c.name for c in cols] == ["fldTitle"]
+        assert service.get_grid_columns("default") is cols
+        service.registry.get_grid_view.assert_called_once_with("default")
+
+    def test_resolve_field_name(self, service):
+        assert service._resolve_field_name("fldTitle") == "fldTitle"
+        assert service._resolve_field_name("TITLE") == "fldTitle"
+        assert service._resolve_field_name("artist") == "fldArtistName"
+        assert service._resolve_field_name("comments") == "fldComments"
+        assert service._resolve_field_name("nope") == "nope"
+
+
+class TestLookupFilter:
+    """Test SQL generation for genre/decade/tempo criteria."""
+
+    @pytest.fixture
+    def service(self):
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        return SongService(MagicMock(), registry)
+
+    def test_unloaded_map_uses_subquery(self, service):
+        snippet, params = service._build_lookup_filter("fldCat2", "80", "contains")
+
+        assert snippet == "[fldCat2] IN (SELECT [AUID] FROM [snCat2] WHERE [fldMusicType] LIKE ?)"
+        assert params == ["%80%"]
+        service.backend.fetch_sql.assert_not_called()
+
+    def test_loaded_map_inlines_few_ids(self, service):
+        service._genre_map, service._decade_map, service._tempo_map = {0: "", 1: "Rock", 2: "Pop Rock", 3: "Pop"}, {}, {}
+
+        snippet, params = service._build_lookup_filter("fldCat1a", "rock", "contains")
+
+        assert snippet == "[fldCat1a] IN (?,?) OR [fldCat1b] IN (?,?) OR [fldCat1c] IN (?,?)"
+        assert params == [1, 2, 1, 2, 1, 2]
+
+    def test_inline_ids_padded_to_power_of_two(self, service):
+        service._genre_map, service._decade_map, service._tempo_map = {}, {1: "60s", 2: "70s", 3: "80s"}, {}
+
+        snippet, params = service._build_lookup_filter("fldCat2", "0s", "ends_with")
+
+        assert snippet == "[fldCat2] IN (?,?,?,?)"
+        assert params == [1, 2, 3, 3]
+
+    def test_lowered_names_reused_until_map_reloads(self, service):
+        service._genre_map, service._decade_map, service._tempo_map = {1: "Rock"}, {}, {}
+        service._build_lookup_filter("fldCat1a", "ROCK", "equals")
+        pairs = service._lowered_lookups[0][1]
+
+        service._build_lookup_filter("fldCat1a", "ro", "starts_with")
+        assert service._lowered_lookups[0][1] is pairs
+
+        service._genre_map = {2: "Jazz"}
+        assert service._build_lookup_filter("fldCat1b", "JAZZ", "equals") == ("[fldCat1b] IN (?)", [2])
+
+    def test_inline_snippet_reused_for_same_shape(self, service):
+        service._genre_map, service._decade_map, service._tempo_map = {1: "Rock", 2: "Pop"}, {}, {}
+
+        first, _ = service._build_lookup_filter("fldCat1a", "rock", "equals")
+        second, params = service._build_lookup_filter("fldCat1a", "pop", "equals")
+
+        assert first is second
+        assert params == [2, 2, 2]
+
+    def test_loaded_map_without_match(self, service):
+        service._genre_map, service._decade_map, service._tempo_map = {1: "Rock"}, {}, {}
+
+        assert service._build_lookup_filter("fldCat1b", "jazz", "equals") == ("1=0", [])
+
+    def test_non_lookup_field(self, service):
+        assert service._build_lookup_filter("fldTitle", "x", "contains") == (None, [])
+
+
+class TestGetAllPaths:
+    """Test streaming of the filename column."""
+
+    def test_streams_non_empty_paths(self):
+        backend = MagicMock()
+        backend.iter_column.return_value = iter(["C:\\a.mp3", None, "", "C:\\b.mp3"])
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        service = SongService(backend, registry)
+
+        assert list(service.get_all_paths()) == ["C:\\a.mp3", "C:\\b.mp3"]
+        backend.iter_column.assert_called_once_with(service._table, "fldFilename")
+        backend.fetch.assert_not_called()
+
+
+class TestIterAll:
+    """Test streaming of whole songs."""
+
+    def test_streams_records(self):
+        backend = MagicMock()
+        backend.iter_rows.return_value = iter([make_row(1), make_row(2)])
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        service = SongService(backend, registry)
+
+        assert [s.primary_key for s in service.iter_all()] == [1, 2]
+        backend.iter_rows.assert_called_once_with(service._table, columns=None)
+        backend.fetch.assert_not_called()
+
+
+class TestBackendQueries:
+    """Test the queries SongService sends to the backend."""
+
+    @pytest.fixture
+    def service(self):
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        backend = MagicMock()
+        backend.fetch.return_value = []
+        backend.fetch_sql.return_value = []
+        return SongService(backend, registry)
+
+    def test_search_top_rounds_up_to_cap(self, service):
+        service.backend.fetch_sql.return_value = [{"AUID": i} for i in range(100)]
+
+        songs = service.search_advanced([{"field": "fldAlbum", "value": "x"}], limit=42)
+
+        assert service.backend.fetch_sql.call_args[0][0].startswith("SELECT TOP 100 * FROM [snDatabase]")
+        assert len(songs) == 42
+
+    def test_search_projects_requested_columns(self, service):
+        service.search_advanced([{"field": "fldAlbum", "value": "x"}], columns=["fldTitle", "AUID", "fldAlbum"])
+
+        query = service.backend.fetch_sql.call_args[0][0]
+        assert query.startswith("SELECT TOP 1000 [AUID], [fldTitle], [fldAlbum] FROM [snDatabase]")
+
+    def test_get_all_projects_requested_columns(self, service):
+        service.get_all(columns=["fldTitle"])
+
+        assert service.backend.fetch.call_args.kwargs["columns"] == ["AUID", "fldTitle"]
+
+
+class TestDisplayData:
+    """Test lookup resolution for display."""
+
+    @pytest.fixture
+    def service(self):
+        registry = MagicMock()
+        registry.get_table.return_value = None
+        backend = MagicMock()
+        backend.fetch_sql.return_value = [
+            {"src": 0, "k": 1, "v": "Rock"}, {"src": 0, "k": 2, "v": "Pop"},
+            {"src": 1, "k": 8, "v": "80s"}, {"src": 2, "k": 3, "v": "Fast"},
+        ]
+        return SongService(backend, registry)
+
+    def test_resolves_and_memoizes_combinations(self, service):
+        row = {"AUID": 1, "fldCat1a": 1, "fldCat1b": 2, "fldCat1c": 0, "fldCat2": 8, "fldCat3": 3, "fldDuration": 200.5}
+
+        first = service.get_display_data(service._row_to_record(row))
+        second = service.get_display_data(service._row_to_record(dict(row, AUID=2)))
+
+        assert first["genres_resolved"] == ["Rock", "Pop"]
+        assert first["genre_display"] == "Rock, Pop"
+        assert first["decade_display"] == "80s"
+        assert first["tempo_display"] == "Fast"
+        assert first["duration_raw"] == 200.5
+        assert second["AUID"] == 2
+        assert first["genres_resolved"] is not second["genres_resolved"]
+        assert service._resolve_display.cache_info().hits == 1
+        service.backend.fetch_sql.assert_called_once()
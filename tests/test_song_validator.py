@@ -91,3 +91,45 @@ class TestSongValidator:
             result = validator.validate(mock_song, mock_id3)
             assert not result.is_valid
             assert "wrong folder" in result.issues[0].message
+
+    def test_validate_genre_uses_replaced_map(self, validator, mock_song, mock_id3):
+        mock_song.genres_all = "blues"
+        validator.genre_map = {0: "x", 1: "blues"}
+        result = validator.validate(mock_song, mock_id3)
+        assert not any("not found" in issue.message for issue in result.issues)
+
+    def test_path_rules_follow_config_changes(self, validator, mock_song, mock_id3):
+        with patch('src.validators.song_validator.app_config') as mock_config, \
+             patch('src.models.song.Song.check_genre', return_value=True):
+            mock_config.genre_rules = {"standard_subfolder": [], "path_overrides": {}}
+            assert not validator.validate(mock_song, mock_id3).is_valid
+
+            # Replaced dict (config reload) is picked up automatically
+            mock_config.genre_rules = {"standard_subfolder": ["Pop"]}
+            assert validator.validate(mock_song, mock_id3).is_valid
+
+            # In-place edits need reload_rules()
+            mock_config.genre_rules["standard_subfolder"] = []
+            assert validator.validate(mock_song, mock_id3).is_valid
+            validator.reload_rules()
+            assert not validator.validate(mock_song, mock_id3).is_valid
+
+    def test_validate_batch(self, validator, mock_song, mock_id3):
+        bad_id3 = MagicMock(spec=SongID3)
+        bad_id3.artist = "Other"
+        with patch('src.validators.song_validator.app_config') as mock_config, \
+             patch('src.models.song.Song.check_genre', return_value=True):
+            mock_config.genre_rules = {"standard_subfolder": ["pop"]}
+            results = validator.validate_batch([(mock_song, mock_id3), (mock_song, bad_id3)])
+        assert [r.is_valid for r in results] == [True, False]
+
+
+def test_validation_result_builds_issues_on_read():
+    result = ValidationResult()
+    assert not result.has_issues
+    result.add_warning("w", "year")
+    result.add_error("e", "title")
+    assert not result.is_valid
+    assert result.has_issues
+    assert [(i.message, i.field) for i in result.issues] == [("w", "year"), ("e", "title")]
+    assert result.issues is result.issues
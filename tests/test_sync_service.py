@@ -0,0 +1,102 @@
+"""
+Tests for SyncService queue persistence.
+"""
+
+import gc
+import json
+from src.services import sync_service
+from src.services.sync_service import SyncService
+
+
+class TestQueueStore:
+    """Test the SQLite-backed change queue."""
+
+    def test_changes_merge_per_song(self, tmp_path):
+        sync = SyncService(str(tmp_path / "sync_queue.json"))
+
+        sync.queue_change(1, "Artist", "Title", {"fldAlbum": "A"})
+        sync.queue_change(1, "Renamed", "Title", {"fldYear": 1999, "fldAlbum": "B"})
+        sync.queue_change(2, "Other", "Song", {"fldEnabled": True})
+
+        pending = {item["id"]: item for item in sync.get_pending()}
+        assert sync.count() == 2
+        assert pending[1]["artist"] == "Artist"
+        assert pending[1]["fields"] == {"fldAlbum": "B", "fldYear": 1999}
+        assert pending[2]["fields"] == {"fldEnabled": True}
+
+    def test_pending_newest_first(self, tmp_path):
+        sync = SyncService(str(tmp_path / "sync_queue.json"))
+        sync.queue_change(1, "A", "T", {"fldAlbum": "A"})
+        sync.queue_change(2, "B", "T", {"fldAlbum": "B"})
+        sync.queue_change(1, "A", "T", {"fldYear": 2000})
+
+        assert [item["id"] for item in sync.get_pending()] == [1, 2]
+
+    def test_reload_roundtrip(self, tmp_path):
+        queue = tmp_path / "sync_queue.json"
+        sync = SyncService(str(queue))
+        sync.queue_change(5, "Artist", "Title", {"fldAlbum": "A"})
+        sync.remove_change(5)
+        sync.queue_change(6, "Artist", "Title", {"fldAlbum": "B"})
+        sync.close()
+
+        reloaded = SyncService(str(queue))
+        assert reloaded.count() == 1
+        assert reloaded.get_pending()[0]["id"] == 6
+
+    def test_clear(self, tmp_path):
+        sync = SyncService(str(tmp_path / "sync_queue.json"))
+        sync.queue_change(1, "Artist", "Title", {"fldAlbum": "A"})
+
+        sync.clear()
+
+        assert sync.count() == 0
+        assert sync.get_pending() == []
+
+    def test_imports_legacy_json_once(self, tmp_path):
+        queue = tmp_path / "sync_queue.json"
+        queue.write_text(json.dumps({
+            "7": {"id": 7, "artist": "A", "title": "T", "timestamp": "2024-01-01T00:00:00",
+                  "fields": {"fldAlbum": "X"}}
+        }), encoding="utf-8")
+
+        sync = SyncService(str(queue))
+
+        assert sync.count() == 1
+        assert not queue.exists()
+        assert sync.get_pending() == [{
+            "id": 7, "artist": "A", "title": "T", "timestamp": "2024-01-01T00:00:00",
+            "fields": {"fldAlbum": "X"}
+        }]
+
+    def test_nothing_opened_until_used(self, tmp_path):
+        queue = tmp_path / "sync_queue.json"
+        sync = SyncService(str(queue))
+
+        assert not (tmp_path / "sync_queue.json.db").exists()
+        assert sync.count() == 0
+
+    def test_count_tracks_mutations(self, tmp_path):
+        sync = SyncService(str(tmp_path / "sync_queue.json"))
+        assert sync.count() == 0
+
+        sync.queue_change(1, "A", "T", {"fldAlbum": "A"})
+        sync.queue_change(1, "A", "T", {"fldYear": 1})
+        sync.queue_change(2, "B", "T", {"fldAlbum": "B"})
+        assert sync.count() == 2
+
+        sync.remove_change(1)
+        sync.remove_change(99)
+        assert sync.count() == 1
+        assert sync.count() == len(sync.get_pending())
+
+    def test_exit_hook_does_not_keep_instances_alive(self, tmp_path):
+        queue = str(tmp_path / "sync_queue.json")
+        sync = SyncService(queue)
+        sync.queue_change(1, "A", "T", {"fldAlbum": "A"})
+        assert sync in sync_service._instances
+
+        del sync
+        gc.collect()
+        assert not any(s.queue_path == queue for s in sync_service._instances)
+        assert SyncService(queue).count() == 1
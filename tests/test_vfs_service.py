@@ -0,0 +1,101 @@
+"""
+Tests for VfsService log parsing and lookups.
+"""
+
+import pytest
+from src.services import vfs_service
+from src.services.vfs_service import VfsService
+
+
+TABLE_LOG = """
+    Directory: B:\\Songs\\Rock
+
+Mode                 LastWriteTime         Length Name
+----                 -------------         ------ ----
+-a----        29/10/2025     14:28        5483047 Artist - Title.mp3
+-a----        29/10/2025     14:29        4000000 Other Song.mp3
+
+    Directory: B:\\Songs\\Pop
+
+-a----        29/10/2025     14:30        3000000 Hit.mp3
+"""
+
+
+def write_log(tmp_path, text, encoding="utf-8"):
+    path = tmp_path / "log.txt"
+    path.write_text(text, encoding=encoding)
+    return str(path)
+
+
+class TestLoadLog:
+    """Test parsing of PowerShell dir listings."""
+
+    def test_table_format(self, tmp_path):
+        vfs = VfsService(write_log(tmp_path, TABLE_LOG))
+        rock = "B:\\Songs\\Rock\\Artist - Title.mp3"
+
+        assert vfs.is_active
+        assert len(vfs) == 3
+        assert vfs.exists(rock)
+        assert vfs.exists(rock.upper())
+        assert not vfs.exists("B:\\Songs\\Rock\\Hit.mp3")
+        assert sorted(vfs.files) == sorted([
+            "b:\\songs\\rock\\artist - title.mp3",
+            "b:\\songs\\rock\\other song.mp3",
+            "b:\\songs\\pop\\hit.mp3",
+        ])
+
+    def test_separator_insensitive(self, tmp_path):
+        vfs = VfsService(write_log(tmp_path, TABLE_LOG))
+
+        assert vfs.exists("B:/Songs/Pop/Hit.mp3")
+        assert vfs.exists("b:\\songs/pop\\HIT.MP3")
+
+    def test_full_name_format_utf16(self, tmp_path):
+        log = write_log(tmp_path, "\\\\nas\\music\\a.mp3\r\n\\\\nas\\music\\b.mp3\r\n", encoding="utf-16")
+        vfs = VfsService(log)
+
+        assert vfs.exists("\\\\NAS\\Music\\A.mp3")
+        assert not vfs.exists("\\\\nas\\music\\c.mp3")
+        assert not vfs.exists("")
+
+    def test_second_log_merges(self, tmp_path):
+        vfs = VfsService(write_log(tmp_path, "\\\\nas\\music\\a.mp3\n"))
+        vfs.load_log(write_log(tmp_path, "\\\\nas\\music\\b.mp3\n\\\\nas\\music\\a.mp3\n"))
+
+        assert len(vfs) == 2
+        assert vfs.exists("\\\\nas\\music\\a.mp3")
+        assert vfs.exists("\\\\nas\\music\\b.mp3")
+
+    def test_padded_and_indented_lines(self, tmp_path):
+        log = "Directory: B:\\Songs\r\n\r\n  -a----   29/10/2025   14:28   5483047 Padded.mp3   \r\n"
+        vfs = VfsService(write_log(tmp_path, log))
+
+        assert vfs.exists("B:\\Songs\\Padded.mp3")
+        assert len(vfs) == 1
+
+    def test_files_before_directory_header_ignored(self, tmp_path):
+        vfs = VfsService(write_log(tmp_path, "-a----  29/10/2025  14:28  1  Orphan.mp3\n"))
+
+        assert len(vfs) == 0
+
+
+class TestParallelLoad:
+    """Test chunked multi-process parsing of large logs."""
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+    def test_matches_sequential_parse(self, tmp_path, monkeypatch, encoding):
+        blocks = []
+        for d in range(20):
+            blocks.append(f"    Directory: B:\\Songs\\Dir{d}\n")
+            blocks.extend(f"-a----  29/10/2025  14:28  {i}  Track {i}.mp3\n" for i in range(30))
+        log = write_log(tmp_path, "".join(blocks), encoding=encoding)
+
+        sequential = VfsService(log)
+        monkeypatch.setattr(vfs_service, "PARALLEL_THRESHOLD", 0)
+        monkeypatch.setattr(vfs_service, "PARSE_CHUNK_SIZE", 997)
+        parallel = VfsService()
+        assert parallel.load_log(log, max_workers=2)
+
+        assert len(parallel) == 600
+        assert sorted(parallel.files) == sorted(sequential.files)
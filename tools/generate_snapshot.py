@@ -52,15 +52,14 @@ def run_generator():
     cache_path = Path('config/metadata_snapshot.json')
     service = SnapshotService(str(cache_path))
     
-    # Optional: Load existing cache to skip or update
-    # service.load_cache()
+    # Existing cache is loaded by generate_snapshot; unchanged files are skipped
 
     # 4. Generate snapshot
     try:
-        service.generate_snapshot(scan_folders, max_workers=20)
+        service.generate_snapshot(scan_folders)
         print("\n" + "="*50)
         print(f"SUCCESS: Snapshot generated with {len(service.metadata_cache)} entries.")
-        print(f"Output: {cache_path}")
+        print(f"Output: {service.metadata_cache.db_path}")
         print("="*50)
     except Exception as e:
         logger.error(f"Snapshot generation failed: {e}")